@@ -9,20 +9,30 @@ from .asserts import (  # noqa
 from .exceptions import ImproperlyConfigured  # noqa
 from .expressions import Asterisk, row_to_json  # noqa
 from .functions import (  # noqa
+    AdminEngineCache,
     analyze,
+    cascade_delete,
     cast_if,
+    changed_attributes,
     create_database,
+    create_databases,
     create_mock_engine,
     database_exists,
+    DatabasePool,
+    databases_exist,
     dependent_objects,
     drop_database,
     escape_like,
+    find_naturally_equivalent,
     get_bind,
+    get_cascade_delete_plan,
     get_class_by_table,
     get_column_key,
     get_columns,
     get_declarative_base,
+    get_foreign_key_index_ddl,
     get_hybrid_properties,
+    get_index_catalog,
     get_mapper,
     get_primary_keys,
     get_query_entities,
@@ -35,12 +45,18 @@ from .functions import (  # noqa
     has_unique_index,
     identity,
     is_loaded,
+    iter_keyset,
+    json_recordset_sql,
     json_sql,
     merge_references,
     mock_engine,
     naturally_equivalent,
+    paginate_keyset,
+    QueryBenchmark,
+    render_bulk_insert,
     render_expression,
     render_statement,
+    session_changes,
     sort_query,
     table_name
 )
@@ -50,7 +66,8 @@ from .listeners import (  # noqa
     auto_delete_orphans,
     coercion_listener,
     force_auto_coercion,
-    force_instant_defaults
+    force_instant_defaults,
+    install_slow_query_explainer
 )
 from .models import Timestamp  # noqa
 from .observer import observes  # noqa
@@ -59,6 +76,7 @@ from .proxy_dict import proxy_dict, ProxyDict  # noqa
 from .query_chain import QueryChain  # noqa
 from .types import (  # noqa
     ArrowType,
+    BlindIndexType,
     Choice,
     ChoiceType,
     ColorType,
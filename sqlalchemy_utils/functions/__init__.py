@@ -1,25 +1,43 @@
+from .benchmark import BenchmarkResult, QueryBenchmark, Regression  # noqa
 from .database import (  # noqa
+    AdminEngineCache,
     analyze,
     create_database,
+    create_databases,
     database_exists,
+    databases_exist,
     drop_database,
     escape_like,
     has_index,
     has_unique_index,
     is_auto_assigned_date_column,
+    json_recordset_sql,
     json_sql
 )
+from .database_pool import DatabasePool  # noqa
 from .foreign_keys import (  # noqa
+    cascade_delete,
     dependent_objects,
+    get_cascade_delete_plan,
+    get_foreign_key_index_ddl,
     get_referencing_foreign_keys,
     group_foreign_keys,
     is_indexed_foreign_key,
     merge_references,
     non_indexed_foreign_keys
 )
-from .mock import create_mock_engine, mock_engine  # noqa
+from .index_catalog import (  # noqa
+    clear_index_catalogs,
+    get_index_catalog,
+    IndexCatalog,
+    IndexInfo
+)
+from .mock import create_mock_engine, mock_engine, open_dump  # noqa
 from .orm import (  # noqa
     cast_if,
+    changed_attributes,
+    compile_dotpath,
+    find_naturally_equivalent,
     get_bind,
     get_class_by_table,
     get_column_key,
@@ -32,14 +50,23 @@ from .orm import (  # noqa
     get_tables,
     get_type,
     getdotattr,
+    getdotattr_many,
     has_changes,
     identity,
     is_loaded,
     naturally_equivalent,
     quote,
+    session_changes,
     table_name
 )
-from .render import render_expression, render_statement  # noqa
+from .pagination import iter_keyset, paginate_keyset  # noqa
+from .render import (  # noqa
+    get_statement_renderer,
+    render_bulk_insert,
+    render_expression,
+    render_statement,
+    StatementRenderer
+)
 from .sort_query import (  # noqa
     make_order_by_deterministic,
     QuerySorterException,
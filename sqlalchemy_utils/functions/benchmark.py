@@ -0,0 +1,369 @@
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+import io
+import json
+import os
+
+import six
+
+from .database import analyze
+
+
+def _median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def _known(*values):
+    return all(value is not None for value in values)
+
+
+class BenchmarkResult(object):
+    """
+    Timings and plan information of a single benchmarked query.
+
+    :param name: name of the benchmarked query
+    :param runtimes: list of runtimes (in milliseconds) of each run
+    :param node_types: plan node types of the last run
+    :param estimated_rows: number of rows estimated by the planner
+    :param actual_rows: number of rows returned by the query
+    """
+    def __init__(
+        self,
+        name,
+        runtimes,
+        node_types,
+        estimated_rows,
+        actual_rows
+    ):
+        self.name = name
+        self.runtimes = runtimes
+        self.node_types = node_types
+        self.estimated_rows = estimated_rows
+        self.actual_rows = actual_rows
+
+    @property
+    def runtime(self):
+        """
+        Median runtime of all runs in milliseconds.
+        """
+        return _median(self.runtimes)
+
+    @classmethod
+    def from_analyses(cls, name, analyses):
+        plan = analyses[-1].plan
+        return cls(
+            name=name,
+            runtimes=[analysis.runtime for analysis in analyses],
+            node_types=analyses[-1].node_types,
+            estimated_rows=plan.get('Plan Rows'),
+            actual_rows=plan.get('Actual Rows')
+        )
+
+    @classmethod
+    def from_dict(cls, name, data):
+        return cls(
+            name=name,
+            runtimes=data['runtimes'],
+            node_types=data['node_types'],
+            estimated_rows=data['estimated_rows'],
+            actual_rows=data['actual_rows']
+        )
+
+    def to_dict(self):
+        return {
+            'runtimes': self.runtimes,
+            'node_types': self.node_types,
+            'estimated_rows': self.estimated_rows,
+            'actual_rows': self.actual_rows
+        }
+
+    def __repr__(self):
+        return '<BenchmarkResult name=%r runtime=%r>' % (
+            self.name,
+            self.runtime
+        )
+
+
+class Regression(object):
+    """
+    Regression detected by :meth:`QueryBenchmark.compare`.
+
+    :param name: name of the benchmarked query
+    :param kind:
+        Kind of the regression, one of `'seq_scan'`, `'runtime'`,
+        `'estimated_rows'`, `'actual_rows'` and `'missing'`.
+    :param baseline: baseline value
+    :param value: current value
+    """
+    def __init__(self, name, kind, baseline, value):
+        self.name = name
+        self.kind = kind
+        self.baseline = baseline
+        self.value = value
+
+    def __str__(self):
+        return '%s: %s changed from %r to %r' % (
+            self.name,
+            self.kind,
+            self.baseline,
+            self.value
+        )
+
+    def __repr__(self):
+        return '<Regression %s>' % self
+
+
+class QueryBenchmark(object):
+    """
+    Registry of named queries that can be benchmarked with :func:`analyze`
+    and compared against JSON baselines in order to catch query plan
+    regressions. Currently only PostgreSQL is supported.
+
+    ::
+
+        from sqlalchemy_utils import QueryBenchmark
+
+
+        benchmark = QueryBenchmark(runs=5)
+
+        benchmark.register(
+            'latest_articles',
+            'SELECT * FROM article ORDER BY created_at DESC LIMIT 10'
+        )
+
+
+        @benchmark.register('published_articles')
+        def published_articles(conn):
+            return session.query(Article).filter(Article.is_published)
+
+
+        results = benchmark.run(conn)
+        results['latest_articles'].runtime     # median runtime in ms
+        results['latest_articles'].node_types  # [u'Limit', u'Index Scan']
+
+
+    Baselines can be stored as JSON and compared against later runs::
+
+
+        benchmark.save(results, 'benchmarks.json')
+
+        regressions = benchmark.compare(
+            benchmark.load('benchmarks.json'),
+            benchmark.run(conn)
+        )
+
+
+    Following changes are considered regressions:
+
+    * A query plan with more `Seq Scan` nodes than the baseline plan
+    * Median runtime increase of more than `runtime_threshold` (relative to
+      the baseline runtime)
+    * Relative change of the number of estimated rows of more than
+      `rows_threshold`
+    * Change in the number of rows returned by the query
+
+
+    Within pytest the whole cycle can be done with
+    :meth:`assert_no_regressions`, which writes the baseline file if it does
+    not exist yet::
+
+
+        def test_query_plans(connection):
+            benchmark.assert_no_regressions(connection, 'benchmarks.json')
+
+
+    .. versionadded: 0.31.0
+
+    :param runs: number of times each query is analyzed
+    :param runtime_threshold:
+        maximum allowed relative runtime increase, for example 0.5 allows
+        runtimes up to 1.5 times the baseline runtime
+    :param rows_threshold:
+        maximum allowed relative change of the number of estimated rows
+    """
+    def __init__(self, runs=5, runtime_threshold=0.5, rows_threshold=0.5):
+        self.runs = runs
+        self.runtime_threshold = runtime_threshold
+        self.rows_threshold = rows_threshold
+        self.queries = OrderedDict()
+
+    def register(self, name, query=None):
+        """
+        Register query with given name. Query can be given as a string, a
+        SQLAlchemy Query or selectable object or a callable which takes the
+        connection as its only argument and returns one of these. If no query
+        is given this method returns a decorator for registering a callable.
+
+        :param name: unique name of the query
+        :param query: query to register
+        """
+        if query is None:
+            def decorator(func):
+                self.register(name, func)
+                return func
+            return decorator
+        if name in self.queries:
+            raise ValueError('Query %r is already registered.' % name)
+        self.queries[name] = query
+        return query
+
+    def run_query(self, conn, name):
+        """
+        Analyze the query with given name `runs` times and return a
+        :class:`BenchmarkResult` object.
+
+        :param conn: SQLAlchemy Connection object
+        :param name: name of the registered query
+        """
+        query = self.queries[name]
+        if callable(query):
+            query = query(conn)
+        return BenchmarkResult.from_analyses(
+            name,
+            [analyze(conn, query) for _ in range(self.runs)]
+        )
+
+    def run(self, conn, names=None):
+        """
+        Run given registered queries (by default all of them) and return an
+        OrderedDict of query names and :class:`BenchmarkResult` objects.
+
+        :param conn: SQLAlchemy Connection object
+        :param names: names of the queries to run
+        """
+        return OrderedDict(
+            (name, self.run_query(conn, name))
+            for name in (self.queries if names is None else names)
+        )
+
+    def save(self, results, path):
+        """
+        Save given results as a JSON baseline to given path.
+
+        :param results: dict of :class:`BenchmarkResult` objects
+        :param path: path of the baseline file
+        """
+        data = OrderedDict(
+            (name, result.to_dict()) for name, result in results.items()
+        )
+        with io.open(path, 'w', encoding='utf8') as f:
+            f.write(six.text_type(json.dumps(data, indent=2, sort_keys=True)))
+
+    def load(self, path):
+        """
+        Load baseline results saved with :meth:`save` from given path.
+
+        :param path: path of the baseline file
+        """
+        with io.open(path, encoding='utf8') as f:
+            data = json.load(f)
+        # :meth:`save` writes sorted keys; ``object_pairs_hook`` is not
+        # available on Python 2.6.
+        return OrderedDict(
+            (name, BenchmarkResult.from_dict(name, values))
+            for name, values in sorted(data.items())
+        )
+
+    def compare_result(self, baseline, result):
+        """
+        Return a list of :class:`Regression` objects for given result compared
+        to given baseline result. Runtimes and row counts that are missing
+        from either result (for example the row estimates of databases whose
+        plans don't contain them) are not compared.
+        """
+        regressions = []
+        name = result.name
+
+        seq_scans = baseline.node_types.count('Seq Scan')
+        if result.node_types.count('Seq Scan') > seq_scans:
+            regressions.append(
+                Regression(
+                    name,
+                    'seq_scan',
+                    baseline.node_types,
+                    result.node_types
+                )
+            )
+        if _known(baseline.runtime, result.runtime) and (
+            result.runtime > baseline.runtime * (1 + self.runtime_threshold)
+        ):
+            regressions.append(
+                Regression(name, 'runtime', baseline.runtime, result.runtime)
+            )
+        if _known(baseline.estimated_rows, result.estimated_rows) and (
+            abs(result.estimated_rows - baseline.estimated_rows) >
+            baseline.estimated_rows * self.rows_threshold
+        ):
+            regressions.append(
+                Regression(
+                    name,
+                    'estimated_rows',
+                    baseline.estimated_rows,
+                    result.estimated_rows
+                )
+            )
+        if _known(baseline.actual_rows, result.actual_rows) and (
+            result.actual_rows != baseline.actual_rows
+        ):
+            regressions.append(
+                Regression(
+                    name,
+                    'actual_rows',
+                    baseline.actual_rows,
+                    result.actual_rows
+                )
+            )
+        return regressions
+
+    def compare(self, baseline, results):
+        """
+        Compare given results against given baseline results and return a
+        list of :class:`Regression` objects. Queries that are missing from
+        the results are reported as regressions, new queries that are missing
+        from the baseline are ignored.
+
+        :param baseline: dict of baseline :class:`BenchmarkResult` objects
+        :param results: dict of current :class:`BenchmarkResult` objects
+        """
+        regressions = []
+        for name, baseline_result in baseline.items():
+            if name not in results:
+                regressions.append(
+                    Regression(name, 'missing', baseline_result.runtime, None)
+                )
+                continue
+            regressions.extend(
+                self.compare_result(baseline_result, results[name])
+            )
+        return regressions
+
+    def assert_no_regressions(self, conn, path, update=False):
+        """
+        Run all registered queries and assert that there are no regressions
+        compared to the baseline stored in given path. If the baseline file
+        does not exist (or `update` is True) the results are saved as the
+        new baseline instead.
+
+        :param conn: SQLAlchemy Connection object
+        :param path: path of the baseline file
+        :param update: whether or not to overwrite the baseline
+        :raises AssertionError: if regressions were found
+        """
+        results = self.run(conn)
+        if update or not os.path.exists(path):
+            self.save(results, path)
+            return
+        regressions = self.compare(self.load(path), results)
+        if regressions:
+            raise AssertionError(
+                'Query plan regressions found:\n%s' % '\n'.join(
+                    str(regression) for regression in regressions
+                )
+            )
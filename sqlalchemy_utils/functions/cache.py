@@ -0,0 +1,200 @@
+"""
+Memoization layer for the model introspection helpers.
+
+Functions such as :func:`~sqlalchemy_utils.functions.get_columns` and
+:func:`~sqlalchemy_utils.functions.get_primary_keys` are often called in
+tight loops. Their results only depend on the mapper configuration, hence
+they are memoized per declarative class (or mapper) in a module level
+:class:`IntrospectionCache` object. The cache is cleared automatically
+whenever a new mapper is instrumented or configured. The classes, mappers
+and tables are referenced weakly, hence the cached values are discarded
+along with them.
+
+::
+
+    from sqlalchemy_utils.functions.cache import introspection_cache
+
+
+    get_primary_keys(User)
+    get_primary_keys(User())
+
+    introspection_cache.hits    # 1
+    introspection_cache.misses  # 1
+
+    introspection_cache.clear()  # clear the cached values
+    introspection_cache.reset()  # clear the cached values and counters
+"""
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+import threading
+import weakref
+from copy import copy as shallow_copy
+from functools import wraps
+from inspect import isclass
+
+import sqlalchemy as sa
+
+
+class IntrospectionCache(object):
+    def __init__(self):
+        self.values = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """
+        Clear all cached values.
+        """
+        self.values.clear()
+
+    def evict(self, mixed):
+        """
+        Discard the cached values of given declarative class, mapper or Table
+        object.
+        """
+        self.values.pop(mixed, None)
+
+    def reset(self):
+        """
+        Clear all cached values and reset the hit and miss counters.
+        """
+        self.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_key(self, mixed, tables=False):
+        """
+        Return the cache key for given object or None if the results for given
+        object should not be cached. Declarative classes and mappers are used
+        as is, instances are keyed by their class. Aliases and other
+        expressions are never cached.
+        """
+        if isclass(mixed) or isinstance(mixed, sa.orm.Mapper):
+            return mixed
+        if isinstance(mixed, sa.Table):
+            return mixed if tables else None
+        if hasattr(mixed, '_sa_instance_state'):
+            return type(mixed)
+
+    def memoize(self, tables=False, weak=False, copy=False):
+        """
+        Memoize the decorated function based on the identity of its first
+        argument and the rest of the arguments.
+
+        :param tables:
+            Whether or not to cache the results for Table objects. By default
+            Table objects are not cached since tables without mappers could
+            be created dynamically (for example by reflection).
+        :param weak:
+            Whether or not to hold the results weakly. Use this for results
+            that reference the cache keys (such as mappers), which would
+            otherwise never be discarded.
+        :param copy:
+            Whether or not to return shallow copies of the cached results, so
+            that callers modifying the results don't affect each other.
+        """
+        def decorator(func):
+            @wraps(func)
+            def wrapper(mixed, *args, **kwargs):
+                key = self.get_key(mixed, tables=tables)
+                if key is None:
+                    return func(mixed, *args, **kwargs)
+                values = self.values.setdefault(key, {})
+                subkey = (func.__name__, args, tuple(sorted(kwargs.items())))
+                value = values.get(subkey)
+                if weak and value is not None:
+                    value = value()
+                if value is None:
+                    self.misses += 1
+                    value = func(mixed, *args, **kwargs)
+                    if value is not None:
+                        values[subkey] = weakref.ref(value) if weak else value
+                else:
+                    self.hits += 1
+                return shallow_copy(value) if copy else value
+            return wrapper
+        return decorator
+
+
+class LRUCache(object):
+    """
+    Thread safe dictionary-like cache that holds at most `maxsize` values.
+    When the cache is full the least recently used value is discarded.
+
+    ::
+
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')     # 1
+        cache.set('c', 3)  # discards 'b'
+
+    :param maxsize: maximum number of values to hold
+    """
+    def __init__(self, maxsize=1000):
+        self.maxsize = maxsize
+        self.values = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.values)
+
+    def __contains__(self, key):
+        return key in self.values
+
+    def get(self, key, default=None):
+        """
+        Return the value for given key (marking it as the most recently used
+        one) or `default` if the key is not in the cache.
+        """
+        with self.lock:
+            try:
+                value = self.values.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self.values[key] = value
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """
+        Set the value for given key, discarding the least recently used value
+        if the cache is full.
+        """
+        with self.lock:
+            self.values.pop(key, None)
+            self.values[key] = value
+            while len(self.values) > self.maxsize:
+                self.values.popitem(last=False)
+
+    def clear(self):
+        """
+        Clear all cached values.
+        """
+        with self.lock:
+            self.values.clear()
+
+    def reset(self):
+        """
+        Clear all cached values and reset the hit and miss counters.
+        """
+        self.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+introspection_cache = IntrospectionCache()
+
+
+def clear_introspection_cache(*args):
+    introspection_cache.clear()
+
+
+sa.event.listen(sa.orm.mapper, 'instrument_class', clear_introspection_cache)
+sa.event.listen(sa.orm.mapper, 'mapper_configured', clear_introspection_cache)
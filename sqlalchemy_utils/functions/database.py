@@ -1,30 +1,160 @@
 import collections
 import itertools
 import os
+import threading
+from contextlib import contextmanager
 from copy import copy
+from decimal import Decimal
 
+import six
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.exc import OperationalError, ProgrammingError
 
 from sqlalchemy_utils.expressions import explain_analyze
 
+from .index_catalog import get_index_catalog
 from .orm import quote
 
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+
+BUFFER_KEYS = (
+    ('shared_hit', 'Shared Hit Blocks'),
+    ('shared_read', 'Shared Read Blocks'),
+    ('local_hit', 'Local Hit Blocks'),
+    ('local_read', 'Local Read Blocks'),
+)
+
 
 class PlanAnalysis(object):
+    """
+    Single node of an EXPLAIN plan tree. The attributes that are only
+    available for EXPLAIN ANALYZE plans (such as actual rows and timings) are
+    None for plain EXPLAIN plans.
+    """
     def __init__(self, plan):
         self.plan = plan
+        self.children = [
+            PlanAnalysis(child) for child in plan.get('Plans', [])
+        ]
+
+    @property
+    def node_type(self):
+        return self.plan['Node Type']
 
     @property
     def node_types(self):
-        types = [self.plan['Node Type']]
-        if 'Plans' in self.plan:
-            for plan in self.plan['Plans']:
-                analysis = PlanAnalysis(plan)
-                types.extend(analysis.node_types)
+        types = [self.node_type]
+        for child in self.children:
+            types.extend(child.node_types)
         return types
 
+    @property
+    def relation_name(self):
+        """
+        Name of the relation scanned by this node (if any).
+        """
+        return self.plan.get('Relation Name')
+
+    @property
+    def index_name(self):
+        """
+        Name of the index used by this node (if any).
+        """
+        return self.plan.get('Index Name')
+
+    @property
+    def startup_cost(self):
+        return self.plan.get('Startup Cost')
+
+    @property
+    def total_cost(self):
+        return self.plan.get('Total Cost')
+
+    @property
+    def estimated_rows(self):
+        """
+        Number of rows per loop estimated by the planner.
+        """
+        return self.plan.get('Plan Rows')
+
+    @property
+    def actual_rows(self):
+        """
+        Actual number of rows per loop.
+        """
+        return self.plan.get('Actual Rows')
+
+    @property
+    def loops(self):
+        return self.plan.get('Actual Loops')
+
+    @property
+    def total_time(self):
+        """
+        Total time (in milliseconds) spent in this node and its children over
+        all loops.
+        """
+        if 'Actual Total Time' not in self.plan:
+            return None
+        return self.plan['Actual Total Time'] * self.loops
+
+    @property
+    def exclusive_time(self):
+        """
+        Time (in milliseconds) spent in this node excluding the time spent in
+        its children.
+        """
+        if self.total_time is None:
+            return None
+        return max(
+            self.total_time - sum(
+                child.total_time or 0 for child in self.children
+            ),
+            0
+        )
+
+    @property
+    def buffers(self):
+        """
+        Dictionary of shared and local buffer hits and reads of this node
+        (including its children).
+        """
+        return dict(
+            (key, self.plan.get(plan_key, 0))
+            for key, plan_key in BUFFER_KEYS
+        )
+
+    @property
+    def misestimate(self):
+        """
+        Ratio between the larger and smaller of the estimated and actual
+        number of rows of this node, or None for plain EXPLAIN plans.
+        """
+        if self.actual_rows is None:
+            return None
+        rows = sorted([self.estimated_rows, self.actual_rows])
+        return rows[1] / float(max(rows[0], 1))
+
+    def walk(self):
+        """
+        Iterate through this node and all its descendants in depth first
+        order.
+        """
+        yield self
+        for child in self.children:
+            for node in child.walk():
+                yield node
+
+    def __repr__(self):
+        return '<PlanAnalysis node_type=%r>' % self.node_type
+
 
 class QueryAnalysis(object):
     def __init__(self, result_set):
@@ -32,16 +162,60 @@ class QueryAnalysis(object):
         if 'Total Runtime' in result_set[0]:
             # PostgreSQL versions < 9.4
             self.runtime = result_set[0]['Total Runtime']
-        else:
+        elif 'Execution Time' in result_set[0]:
             # PostgreSQL versions >= 9.4
             self.runtime = (
                 result_set[0]['Execution Time'] +
                 result_set[0]['Planning Time']
             )
+        else:
+            # Plain EXPLAIN without ANALYZE
+            self.runtime = None
+        self.root = PlanAnalysis(self.plan)
 
     @property
     def node_types(self):
-        return list(PlanAnalysis(self.plan).node_types)
+        return list(self.root.node_types)
+
+    @property
+    def nodes(self):
+        """
+        List of all :class:`PlanAnalysis` nodes of the plan tree in depth
+        first order.
+        """
+        return list(self.root.walk())
+
+    @property
+    def total_buffers(self):
+        """
+        Dictionary of shared and local buffer hits and reads of the whole
+        query.
+        """
+        return self.root.buffers
+
+    def slowest_nodes(self, n=5):
+        """
+        Return `n` plan nodes with the highest exclusive time.
+
+        :param n: number of nodes to return
+        """
+        return sorted(
+            self.nodes,
+            key=lambda node: node.exclusive_time or 0,
+            reverse=True
+        )[:n]
+
+    def misestimates(self, factor=10):
+        """
+        Return plan nodes where the actual number of rows differs from the
+        planner estimate by at least given factor.
+
+        :param factor: minimum ratio between estimated and actual rows
+        """
+        return [
+            node for node in self.nodes
+            if node.misestimate is not None and node.misestimate >= factor
+        ]
 
     def __repr__(self):
         return '<QueryAnalysis runtime=%r>' % self.runtime
@@ -81,8 +255,32 @@ def analyze(conn, query):
         assert 'Seq Scan' not in analysis.node_types
 
 
+    The whole plan tree is available as :class:`PlanAnalysis` nodes, which
+    makes it possible to find the hot spots of the query::
+
+
+        for node in analysis.slowest_nodes(3):
+            print(
+                node.node_type,
+                node.relation_name,
+                node.index_name,
+                node.exclusive_time,
+                node.buffers
+            )
+
+        # Nodes where the planner estimate is off by a factor of 10 or more
+        for node in analysis.misestimates(10):
+            print(node.node_type, node.estimated_rows, node.actual_rows)
+
+        analysis.total_buffers
+        # {'shared_hit': 12, 'shared_read': 3, 'local_hit': 0, ...}
+
+
     .. versionadded: 0.26.17
 
+    .. versionchanged: 0.31.0
+        Added plan tree model
+
     :param conn: SQLAlchemy Connection object
     :param query: SQLAlchemy Query object or query as a string
     """
@@ -118,7 +316,7 @@ def escape_like(string, escape_char='*'):
     )
 
 
-def json_sql(value, scalars_to_json=True):
+def json_sql(value, scalars_to_json=True, bindparams=False, chunk_size=50):
     """
     Convert python data structures to PostgreSQL specific SQLAlchemy JSON
     constructs. This function is extremly useful if you need to build
@@ -159,9 +357,41 @@ def json_sql(value, scalars_to_json=True):
         # json_build_object('a', json_build_array[1, 2, 3])
 
 
+    By default scalars are inlined as literal SQL. For large documents use
+    `bindparams=True`, which binds all scalars as parameters and builds
+    `jsonb` instead of `json`. The SQL of the resulting statement then only
+    depends on the structure of the data, not on the values. Objects and
+    arrays with more than `chunk_size` items are split into several
+    `jsonb_build_object` / `jsonb_build_array` calls concatenated with `||`
+    so that PostgreSQL's 100 argument limit for functions is never hit.
+
+    ::
+
+        json_sql({'a': 'b', 'c': 1}, bindparams=True)
+        # jsonb_build_object(
+        #     CAST(:param_1 AS TEXT), CAST(:param_2 AS TEXT),
+        #     CAST(:param_3 AS TEXT), CAST(:param_4 AS BIGINT)
+        # )
+
+    .. seealso:: :func:`json_recordset_sql`
+
+    .. versionchanged: 0.31.0
+        Added bindparams and chunk_size parameters
+
     :param value:
         value to be converted to SQLAlchemy PostgreSQL function constructs
+    :param scalars_to_json:
+        whether or not to convert top level scalars with to_json
+    :param bindparams:
+        whether or not to bind scalars as parameters and build jsonb
+    :param chunk_size:
+        maximum number of object items (key-value pairs) or array elements
+        per jsonb_build_object or jsonb_build_array call when `bindparams` is
+        True
     """
+    if bindparams:
+        return _jsonb_sql(value, chunk_size, scalars_to_json)
+
     scalar_convert = sa.text
     if scalars_to_json:
         scalar_convert = lambda a: sa.func.to_json(sa.text(a))
@@ -187,16 +417,126 @@ def json_sql(value, scalars_to_json=True):
     return value
 
 
+JSONB_SCALAR_TYPES = (
+    (bool, sa.Boolean),
+    (six.string_types, sa.Text),
+    (six.integer_types, sa.BigInteger),
+    (float, sa.Float),
+    (Decimal, sa.Numeric),
+)
+
+
+def _jsonb_build(func, args, chunk_size):
+    chunks = [
+        func(*args[index:index + chunk_size], type_=JSONB)
+        for index in range(0, len(args), chunk_size)
+    ] or [func(type_=JSONB)]
+    expr = chunks[0]
+    for chunk in chunks[1:]:
+        expr = expr.op('||')(chunk)
+    return expr
+
+
+def _jsonb_sql(value, chunk_size, scalars_to_json=False):
+    if isinstance(value, collections.Mapping):
+        return _jsonb_build(
+            sa.func.jsonb_build_object,
+            [
+                _jsonb_sql(v, chunk_size)
+                for v in itertools.chain(*value.items())
+            ],
+            chunk_size * 2
+        )
+    if value is None:
+        return sa.null()
+    for python_type, type_ in JSONB_SCALAR_TYPES:
+        if isinstance(value, python_type):
+            expr = sa.cast(sa.bindparam(None, value, type_=type_), type_)
+            return sa.func.to_jsonb(expr) if scalars_to_json else expr
+    if isinstance(value, collections.Sequence):
+        return _jsonb_build(
+            sa.func.jsonb_build_array,
+            [_jsonb_sql(v, chunk_size) for v in value],
+            chunk_size
+        )
+    return value
+
+
+def json_recordset_sql(table, rows):
+    """
+    Return a SELECT that turns given rows into a record set of given table's
+    row type using PostgreSQL's `jsonb_populate_recordset` function. All the
+    rows are sent as a single JSONB bound parameter, which makes this useful
+    for sending large amounts of rows with a statement that always compiles
+    to the same SQL.
+
+    ::
+
+        from sqlalchemy_utils import json_recordset_sql
+
+
+        rows = [
+            {'id': 1, 'name': u'Some article'},
+            {'id': 2, 'name': u'Some other article'}
+        ]
+
+        conn.execute(
+            article.insert().from_select(
+                [column.name for column in article.c],
+                json_recordset_sql(article, rows)
+            )
+        )
+        # INSERT INTO article (id, name)
+        # SELECT id, name
+        # FROM jsonb_populate_recordset(NULL::article, :rows) AS records
+
+
+    Columns missing from the rows are set to NULL.
+
+
+    .. note::
+
+        This function needs PostgreSQL >= 9.4
+
+    .. versionadded: 0.31.0
+
+    :param table: SQLAlchemy Table object
+    :param rows: sequence of dictionaries keyed by column names
+    """
+    dialect = postgresql.dialect()
+    name = quote(dialect, table.name)
+    if table.schema:
+        name = '%s.%s' % (quote(dialect, table.schema), name)
+    records = sa.func.jsonb_populate_recordset(
+        sa.literal_column('NULL::%s' % name),
+        sa.bindparam('rows', list(rows), type_=JSONB)
+    ).alias('records')
+    return sa.select(
+        [sa.column(column.name, column.type) for column in table.c]
+    ).select_from(records)
+
+
 def has_index(column):
     """
     Return whether or not given column has an index. A column has an index if
     it has a single column index or it is the first column in compound column
     index.
 
-    :param column: SQLAlchemy Column object
+    If a sequence of columns is given this function returns whether or not
+    there is an index (or primary key) that starts with the given columns in
+    the given order. In other words whether or not the columns could be
+    served by an index when used in this order for example in ORDER BY.
+
+    :param column: SQLAlchemy Column object or a sequence of Column objects
 
     .. versionadded: 0.26.2
 
+    .. versionchanged: 0.31.0
+        Added support for sequences of columns. Indexes are looked up from a
+        cached :class:`~sqlalchemy_utils.functions.index_catalog.IndexCatalog`
+        and expression indexes are no longer considered to index the columns
+        used in their expressions.
+
     ::
 
         from sqlalchemy_utils import has_index
@@ -240,34 +580,34 @@ def has_index(column):
 
         has_index(table.c.locale)   # False
         has_index(table.c.id)       # True
+        has_index([table.c.id, table.c.locale])  # True
+        has_index([table.c.locale, table.c.id])  # False
+
+    :raises TypeError: if given columns do not belong to the same Table object
     """
-    table = column.table
-    if not isinstance(table, sa.Table):
-        raise TypeError(
-            'Only columns belonging to Table objects are supported. Given '
-            'column belongs to %r.' % table
-        )
-    primary_keys = table.primary_key.columns.values()
-    return (
-        (primary_keys and column is primary_keys[0])
-        or
-        any(
-            index.columns.values()[0] is column
-            for index in table.indexes
-        )
-    )
+    columns = _get_index_columns(column)
+    return get_index_catalog(columns[0].table).has_prefix(columns)
 
 
 def has_unique_index(column):
     """
     Return whether or not given column has a unique index. A column has a
     unique index if it has a single column primary key index or it has a
-    single column UniqueConstraint.
+    single column UniqueConstraint or unique Index.
 
-    :param column: SQLAlchemy Column object
+    If a sequence of columns is given this function returns whether or not
+    there is a primary key, UniqueConstraint or unique Index consisting of
+    exactly the given columns (in any order).
+
+    :param column: SQLAlchemy Column object or a sequence of Column objects
 
     .. versionadded: 0.27.1
 
+    .. versionchanged: 0.31.0
+        Added support for sequences of columns and unique indexes. Unique
+        keys are looked up from a cached
+        :class:`~sqlalchemy_utils.functions.index_catalog.IndexCatalog`.
+
     ::
 
         from sqlalchemy_utils import has_unique_index
@@ -287,27 +627,30 @@ def has_unique_index(column):
         has_unique_index(table.c.is_published) # True
         has_unique_index(table.c.is_deleted)   # False
         has_unique_index(table.c.id)           # True
+        has_unique_index([table.c.id, table.c.title])  # False
 
 
-    :raises TypeError: if given column does not belong to a Table object
+    :raises TypeError: if given columns do not belong to the same Table object
     """
-    table = column.table
+    columns = _get_index_columns(column)
+    return get_index_catalog(columns[0].table).has_unique(columns)
+
+
+def _get_index_columns(column):
+    columns = (
+        list(column) if isinstance(column, (list, tuple)) else [column]
+    )
+    if not columns:
+        raise ValueError('At least one column must be given.')
+    table = columns[0].table
     if not isinstance(table, sa.Table):
         raise TypeError(
             'Only columns belonging to Table objects are supported. Given '
             'column belongs to %r.' % table
         )
-    pks = table.primary_key.columns
-    return (
-        (column is pks.values()[0] and len(pks) == 1)
-        or
-        any(
-            match_columns(constraint.columns.values()[0], column) and
-            len(constraint.columns) == 1
-            for constraint in column.table.constraints
-            if isinstance(constraint, sa.sql.schema.UniqueConstraint)
-        )
-    )
+    if any(c.table is not table for c in columns):
+        raise TypeError('All given columns must belong to the same table.')
+    return columns
 
 
 def match_columns(column, column2):
@@ -336,10 +679,126 @@ def is_auto_assigned_date_column(column):
     )
 
 
-def database_exists(url):
+class AdminEngineCache(object):
+    """
+    Cache of administrative engines (engines connected to the server rather
+    than to a specific database) keyed by server URL. Passing the same cache
+    to :func:`database_exists`, :func:`create_database`,
+    :func:`drop_database` and their batch variants makes them reuse a single
+    engine (and connection pool) per server. The engines are disposed
+    explicitly with :meth:`dispose`.
+
+    ::
+
+        from sqlalchemy_utils import AdminEngineCache, create_database
+
+
+        engines = AdminEngineCache()
+        for url in tenant_urls:
+            if not database_exists(url, engines=engines):
+                create_database(url, engines=engines)
+        engines.dispose()
+
+
+    Caches can also be used as context managers, in which case the engines
+    are disposed on exit::
+
+
+        with AdminEngineCache() as engines:
+            create_databases(tenant_urls, engines=engines)
+
+
+    .. versionadded: 0.31.0
+    """
+    def __init__(self):
+        self.engines = {}
+        self.lock = threading.Lock()
+
+    def get(self, url):
+        """
+        Return the cached engine for given server URL, creating it if needed.
+
+        :param url: administrative URL of the database server
+        """
+        key = str(url)
+        with self.lock:
+            try:
+                return self.engines[key]
+            except KeyError:
+                engine = self.engines[key] = _create_admin_engine(url)
+                return engine
+
+    def dispose(self):
+        """
+        Dispose all the cached engines and clear the cache.
+        """
+        with self.lock:
+            for engine in self.engines.values():
+                engine.dispose()
+            self.engines.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.dispose()
+
+
+def _get_admin_url(url):
+    url = copy(make_url(url))
+    database = url.database
+    if url.drivername.startswith('postgresql'):
+        url.database = 'template1'
+    elif not url.drivername.startswith('sqlite'):
+        url.database = None
+    return url, database
+
+
+def _create_admin_engine(url):
+    engine = sa.create_engine(url)
+    if engine.dialect.name == 'postgresql' and engine.driver == 'psycopg2':
+        # CREATE DATABASE and DROP DATABASE can't be run inside a
+        # transaction block.
+        engine = engine.execution_options(isolation_level='AUTOCOMMIT')
+    return engine
+
+
+@contextmanager
+def _admin_engine(url, engines=None):
+    if engines is not None:
+        yield engines.get(url)
+    else:
+        engine = _create_admin_engine(url)
+        try:
+            yield engine
+        finally:
+            engine.dispose()
+
+
+def _get_existing_databases(engine, names):
+    if engine.dialect.name == 'postgresql':
+        column, table = 'datname', 'pg_database'
+    else:
+        column, table = 'SCHEMA_NAME', 'INFORMATION_SCHEMA.SCHEMATA'
+    params = dict(
+        ('name_%d' % index, name) for index, name in enumerate(names)
+    )
+    query = sa.text('SELECT %s FROM %s WHERE %s IN (%s)' % (
+        column,
+        table,
+        column,
+        ', '.join(':%s' % key for key in sorted(params))
+    ))
+    return set(row[0] for row in engine.execute(query, **params))
+
+
+def database_exists(url, engines=None):
     """Check if a database exists.
 
     :param url: A SQLAlchemy engine URL.
+    :param engines:
+        Optional :class:`AdminEngineCache` object. By default a new engine is
+        created (and disposed) for each call.
 
     Performs backend-specific testing to quickly determine if a database
     exists on the server. ::
@@ -355,42 +814,71 @@ def database_exists(url):
         create_database(engine.url)
         database_exists(engine.url)  #=> True
 
-    """
-
-    url = copy(make_url(url))
-    database = url.database
-    if url.drivername.startswith('postgresql'):
-        url.database = 'template1'
-    else:
-        url.database = None
+    .. versionchanged: 0.31.0
+        Added engines parameter
 
-    engine = sa.create_engine(url)
+    """
+    return databases_exist([url], engines=engines)[0]
 
-    if engine.dialect.name == 'postgresql':
-        text = "SELECT 1 FROM pg_database WHERE datname='%s'" % database
-        return bool(engine.execute(text).scalar())
 
-    elif engine.dialect.name == 'mysql':
-        text = ("SELECT SCHEMA_NAME FROM INFORMATION_SCHEMA.SCHEMATA "
-                "WHERE SCHEMA_NAME = '%s'" % database)
-        return bool(engine.execute(text).scalar())
+def databases_exist(urls, engines=None):
+    """Check if given databases exist.
 
-    elif engine.dialect.name == 'sqlite':
-        return database == ':memory:' or os.path.exists(database)
+    :param urls: A sequence of SQLAlchemy engine URLs.
+    :param engines:
+        Optional :class:`AdminEngineCache` object. By default a new engine is
+        created (and disposed) for each database server.
+    :return: A list of booleans in the order of the given URLs.
 
-    else:
-        text = 'SELECT 1'
-        try:
-            url.database = database
-            engine = sa.create_engine(url)
-            engine.execute(text)
-            return True
+    Works like :func:`database_exists` but checks all the databases of each
+    server with a single query. ::
 
-        except (ProgrammingError, OperationalError):
-            return False
+        databases_exist([
+            'postgres://postgres@localhost/tenant_1',
+            'postgres://postgres@localhost/tenant_2',
+        ])  #=> [True, False]
 
+    .. versionadded: 0.31.0
+    """
+    servers = OrderedDict()
+    for index, url in enumerate(urls):
+        admin_url, database = _get_admin_url(url)
+        servers.setdefault(str(admin_url), (admin_url, []))[1].append(
+            (index, url, database)
+        )
 
-def create_database(url, encoding='utf8', template=None):
+    results = [None] * len(urls)
+    for admin_url, databases in servers.values():
+        if admin_url.drivername.startswith('sqlite'):
+            for index, url, database in databases:
+                results[index] = (
+                    database == ':memory:' or os.path.exists(database)
+                )
+            continue
+
+        with _admin_engine(admin_url, engines) as engine:
+            if engine.dialect.name in ('postgresql', 'mysql'):
+                existing = _get_existing_databases(
+                    engine,
+                    [database for _, _, database in databases]
+                )
+                for index, url, database in databases:
+                    results[index] = database in existing
+                continue
+
+            for index, url, database in databases:
+                database_engine = sa.create_engine(url)
+                try:
+                    database_engine.execute('SELECT 1')
+                    results[index] = True
+                except (ProgrammingError, OperationalError):
+                    results[index] = False
+                finally:
+                    database_engine.dispose()
+    return results
+
+
+def create_database(url, encoding='utf8', template=None, engines=None):
     """Issue the appropriate CREATE DATABASE statement.
 
     :param url: A SQLAlchemy engine URL.
@@ -398,6 +886,9 @@ def create_database(url, encoding='utf8', template=None):
     :param template:
         The name of the template from which to create the new database. At the
         moment only supported by PostgreSQL driver.
+    :param engines:
+        Optional :class:`AdminEngineCache` object. By default a new engine is
+        created (and disposed) for each call.
 
     To create a database, you can pass a simple URL that would have
     been passed to ``create_engine``. ::
@@ -410,55 +901,83 @@ def create_database(url, encoding='utf8', template=None):
 
     Has full support for mysql, postgres, and sqlite. In theory,
     other database engines should be supported.
+
+    .. versionchanged: 0.31.0
+        Added engines parameter
     """
 
-    url = copy(make_url(url))
+    url, database = _get_admin_url(url)
 
-    database = url.database
+    with _admin_engine(url, engines) as engine:
+        if engine.dialect.name == 'postgresql':
+            if not template:
+                template = 'template0'
 
-    if url.drivername.startswith('postgresql'):
-        url.database = 'template1'
-    elif not url.drivername.startswith('sqlite'):
-        url.database = None
-
-    engine = sa.create_engine(url)
+            text = "CREATE DATABASE {0} ENCODING '{1}' TEMPLATE {2}".format(
+                quote(engine, database),
+                encoding,
+                quote(engine, template)
+            )
+            engine.execute(text)
 
-    if engine.dialect.name == 'postgresql':
-        if engine.driver == 'psycopg2':
-            from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
-            engine.raw_connection().set_isolation_level(
-                ISOLATION_LEVEL_AUTOCOMMIT
+        elif engine.dialect.name == 'mysql':
+            text = "CREATE DATABASE {0} CHARACTER SET = '{1}'".format(
+                quote(engine, database),
+                encoding
             )
+            engine.execute(text)
 
-        if not template:
-            template = 'template0'
+        elif engine.dialect.name == 'sqlite' and database != ':memory:':
+            open(database, 'w').close()
 
-        text = "CREATE DATABASE {0} ENCODING '{1}' TEMPLATE {2}".format(
-            quote(engine, database),
-            encoding,
-            quote(engine, template)
-        )
-        engine.execute(text)
+        else:
+            text = 'CREATE DATABASE {0}'.format(quote(engine, database))
+            engine.execute(text)
 
-    elif engine.dialect.name == 'mysql':
-        text = "CREATE DATABASE {0} CHARACTER SET = '{1}'".format(
-            quote(engine, database),
-            encoding
-        )
-        engine.execute(text)
 
-    elif engine.dialect.name == 'sqlite' and database != ':memory:':
-        open(database, 'w').close()
+def create_databases(urls, encoding='utf8', template=None, engines=None):
+    """Create the given databases that do not exist yet.
 
-    else:
-        text = 'CREATE DATABASE {0}'.format(quote(engine, database))
-        engine.execute(text)
+    :param urls: A sequence of SQLAlchemy engine URLs.
+    :param encoding: The encoding to create the databases as.
+    :param template:
+        The name of the template from which to create the new databases. At
+        the moment only supported by PostgreSQL driver.
+    :param engines:
+        Optional :class:`AdminEngineCache` object. By default a temporary
+        cache is used for the duration of the call.
+    :return: A list of the URLs of the created databases.
+
+    The existence of the databases is checked with :func:`databases_exist`
+    (a single query per database server) and the missing databases are
+    created using one engine per database server. ::
+
+        create_databases([
+            'postgres://postgres@localhost/tenant_%d' % index
+            for index in range(100)
+        ])
+
+    .. versionadded: 0.31.0
+    """
+    if engines is None:
+        with AdminEngineCache() as engines:
+            return create_databases(urls, encoding, template, engines)
 
+    created = []
+    for url, exists in zip(urls, databases_exist(urls, engines=engines)):
+        if not exists:
+            create_database(url, encoding, template, engines=engines)
+            created.append(url)
+    return created
 
-def drop_database(url):
+
+def drop_database(url, engines=None):
     """Issue the appropriate DROP DATABASE statement.
 
     :param url: A SQLAlchemy engine URL.
+    :param engines:
+        Optional :class:`AdminEngineCache` object. By default a new engine is
+        created (and disposed) for each call.
 
     Works similar to the :ref:`create_database` method in that both url text
     and a constructed url are accepted. ::
@@ -466,48 +985,42 @@ def drop_database(url):
         drop_database('postgres://postgres@localhost/name')
         drop_database(engine.url)
 
+    .. versionchanged: 0.31.0
+        Added engines parameter
     """
 
-    url = copy(make_url(url))
-
-    database = url.database
-
-    if url.drivername.startswith('postgresql'):
-        url.database = 'template1'
-    elif not url.drivername.startswith('sqlite'):
-        url.database = None
-
-    engine = sa.create_engine(url)
-
-    if engine.dialect.name == 'sqlite' and url.database != ':memory:':
-        os.remove(url.database)
-
-    elif engine.dialect.name == 'postgresql' and engine.driver == 'psycopg2':
-        from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
-        engine.raw_connection().set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-
-        # Disconnect all users from the database we are dropping.
-        version = list(
-            map(
-                int,
-                engine.execute('SHOW server_version').first()[0].split('.')
+    url, database = _get_admin_url(url)
+
+    with _admin_engine(url, engines) as engine:
+        if engine.dialect.name == 'sqlite' and url.database != ':memory:':
+            os.remove(url.database)
+
+        elif (
+            engine.dialect.name == 'postgresql' and
+            engine.driver == 'psycopg2'
+        ):
+            # Disconnect all users from the database we are dropping.
+            version = list(
+                map(
+                    int,
+                    engine.execute('SHOW server_version').first()[0].split('.')
+                )
             )
-        )
-        pid_column = (
-            'pid' if (version[0] >= 9 and version[1] >= 2) else 'procpid'
-        )
-        text = '''
-        SELECT pg_terminate_backend(pg_stat_activity.%(pid_column)s)
-        FROM pg_stat_activity
-        WHERE pg_stat_activity.datname = '%(database)s'
-          AND %(pid_column)s <> pg_backend_pid();
-        ''' % {'pid_column': pid_column, 'database': database}
-        engine.execute(text)
-
-        # Drop the database.
-        text = 'DROP DATABASE {0}'.format(quote(engine, database))
-        engine.execute(text)
+            pid_column = (
+                'pid' if (version[0] >= 9 and version[1] >= 2) else 'procpid'
+            )
+            text = '''
+            SELECT pg_terminate_backend(pg_stat_activity.%(pid_column)s)
+            FROM pg_stat_activity
+            WHERE pg_stat_activity.datname = '%(database)s'
+              AND %(pid_column)s <> pg_backend_pid();
+            ''' % {'pid_column': pid_column, 'database': database}
+            engine.execute(text)
 
-    else:
-        text = 'DROP DATABASE {0}'.format(quote(engine, database))
-        engine.execute(text)
+            # Drop the database.
+            text = 'DROP DATABASE {0}'.format(quote(engine, database))
+            engine.execute(text)
+
+        else:
+            text = 'DROP DATABASE {0}'.format(quote(engine, database))
+            engine.execute(text)
@@ -0,0 +1,205 @@
+import os
+import shutil
+from contextlib import contextmanager
+from copy import copy
+
+import sqlalchemy as sa
+from six.moves import queue
+from sqlalchemy.engine.url import make_url
+
+from .database import (
+    AdminEngineCache,
+    create_database,
+    database_exists,
+    drop_database
+)
+
+
+class DatabasePool(object):
+    """
+    Pool of identical databases cloned from a single template database. This
+    is useful for test suites that run in parallel: the (potentially slow)
+    schema creation or migrations are run only once for the template database
+    and each worker gets its own copy of it.
+
+    On PostgreSQL the databases are cloned with
+    `CREATE DATABASE ... TEMPLATE`. On SQLite the database file is copied.
+
+    The template database is named `<database>_template` and the cloned
+    databases `<database>_1` ... `<database>_<size>` (for SQLite the suffix
+    is added before the file extension).
+
+    ::
+
+        from sqlalchemy_utils import DatabasePool
+
+
+        def setup(engine):
+            Base.metadata.create_all(engine)
+
+
+        pool = DatabasePool(
+            'postgres://postgres@localhost/app_test',
+            size=4,
+            setup=setup
+        )
+        pool.create()
+
+        url = pool.acquire()
+        ...
+        pool.release(url)  # drops and re-clones the database
+
+        pool.drop()
+
+
+    With pytest the pool can be used for example as follows::
+
+
+        @pytest.fixture(scope='session')
+        def database_pool():
+            pool = DatabasePool(URL, size=4, setup=setup)
+            pool.create()
+            yield pool
+            pool.drop()
+
+
+        @pytest.fixture
+        def engine(database_pool):
+            with database_pool.database() as url:
+                engine = sa.create_engine(url)
+                yield engine
+                engine.dispose()
+
+
+    For multi process test runners (such as pytest-xdist) the pool should
+    be created once before the workers start, each worker can then use
+    `pool.urls[worker_index]` and :meth:`reset` between tests.
+
+    .. versionadded: 0.31.0
+
+    :param url: SQLAlchemy engine URL used as a base for the database names
+    :param size: number of cloned databases
+    :param setup:
+        Callable that receives an engine bound to the template database and
+        creates the schema (for example runs migrations).
+    """
+    def __init__(self, url, size, setup):
+        self.url = copy(make_url(url))
+        if self.is_sqlite and self.url.database in (None, '', ':memory:'):
+            raise ValueError(
+                'In-memory SQLite databases can not be used with '
+                'DatabasePool.'
+            )
+        self.size = size
+        self.setup = setup
+        self.template_url = self.get_url('template')
+        self.urls = [self.get_url(index) for index in range(1, size + 1)]
+        self.available = queue.Queue()
+        self.engines = AdminEngineCache()
+
+    @property
+    def is_sqlite(self):
+        return self.url.drivername.startswith('sqlite')
+
+    def get_url(self, suffix):
+        url = copy(self.url)
+        if self.is_sqlite:
+            root, ext = os.path.splitext(self.url.database)
+            url.database = '%s_%s%s' % (root, suffix, ext)
+        else:
+            url.database = '%s_%s' % (self.url.database, suffix)
+        return url
+
+    def create_template(self):
+        """
+        (Re)create the template database and run the setup callable for it.
+        """
+        self.drop_database(self.template_url)
+        create_database(self.template_url, engines=self.engines)
+        engine = sa.create_engine(self.template_url)
+        try:
+            self.setup(engine)
+        finally:
+            # PostgreSQL refuses to clone a template that has connections.
+            engine.dispose()
+
+    def clone(self, url):
+        """
+        Create database with given URL as a copy of the template database.
+
+        :param url: SQLAlchemy engine URL of the database to create
+        """
+        if self.is_sqlite:
+            shutil.copyfile(self.template_url.database, url.database)
+        else:
+            create_database(
+                url,
+                template=self.template_url.database,
+                engines=self.engines
+            )
+
+    def drop_database(self, url):
+        if database_exists(url, engines=self.engines):
+            drop_database(url, engines=self.engines)
+
+    def reset(self, url):
+        """
+        Reset database with given URL by dropping it and cloning it again
+        from the template database.
+
+        :param url: SQLAlchemy engine URL of a database of this pool
+        """
+        self.drop_database(url)
+        self.clone(url)
+
+    def create(self):
+        """
+        Create the template database and all the cloned databases.
+        """
+        self.create_template()
+        self.available = queue.Queue()
+        for url in self.urls:
+            self.reset(url)
+            self.available.put(url)
+
+    def drop(self):
+        """
+        Drop all the cloned databases and the template database and dispose
+        the administrative engines of this pool.
+        """
+        for url in self.urls + [self.template_url]:
+            self.drop_database(url)
+        self.available = queue.Queue()
+        self.engines.dispose()
+
+    def acquire(self, timeout=None):
+        """
+        Return the URL of an available database, blocking until one is
+        released if all of them are in use.
+
+        :param timeout: maximum number of seconds to wait
+        """
+        return self.available.get(timeout=timeout)
+
+    def release(self, url, reset=True):
+        """
+        Return given database back to the pool.
+
+        :param url: URL returned by :meth:`acquire`
+        :param reset: whether or not to reset the database before reuse
+        """
+        if reset:
+            self.reset(url)
+        self.available.put(url)
+
+    @contextmanager
+    def database(self, timeout=None):
+        """
+        Context manager that acquires a database and releases (and resets)
+        it on exit.
+        """
+        url = self.acquire(timeout=timeout)
+        try:
+            yield url
+        finally:
+            self.release(url)
@@ -8,7 +8,12 @@ from sqlalchemy.orm import object_session
 from sqlalchemy.schema import ForeignKeyConstraint, MetaData, Table
 
 from ..query_chain import QueryChain
-from .orm import get_column_key, get_mapper, get_tables
+from .orm import get_column_key, get_mapper, get_tables, quote
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
 
 
 def get_foreign_key_values(fk, obj):
@@ -313,17 +318,387 @@ def _get_criteria(keys, class_, obj):
     return criteria
 
 
-def non_indexed_foreign_keys(metadata, engine=None):
+def _in(columns, selectable):
+    if len(columns) == 1:
+        return columns[0].in_(selectable)
+    return sa.tuple_(*columns).in_(selectable)
+
+
+def _select(columns, criteria):
+    query = sa.select(columns)
+    if criteria is not None:
+        query = query.where(criteria)
+    return query
+
+
+def get_cascade_delete_plan(mixed):
+    """
+    Return an ordered list of `(table, criteria)` tuples describing which rows
+    need to be deleted (and in which order) in order to delete the rows
+    represented by given table or query along with all rows that reference
+    them, either directly or transitively.
+
+    The tables are ordered so that referencing tables come before the tables
+    they reference, hence the criteria of each table can be evaluated against
+    the rows that still exist at the time of its deletion. The criteria of
+    each referencing table is a set based `IN (SELECT ...)` expression, no
+    objects are ever loaded into memory.
+
+    ::
+
+        for table, criteria in get_cascade_delete_plan(
+            session.query(Tenant).filter_by(name=u'acme')
+        ):
+            print table.name, criteria
+
+
+    Self-referencing foreign keys are skipped when computing the closure.
+    Cycles between different tables are not supported.
+
+    :param mixed:
+        SA Table object, SA declarative class or SA Query object. For tables
+        and declarative classes all rows are considered for deletion, for
+        queries only the rows matching the query.
+
+    :raises ValueError: if the foreign keys of the closure form a cycle
+
+    .. seealso:: :func:`cascade_delete`
+    """
+    root, root_criteria = _get_cascade_delete_root(mixed)
+    return _get_cascade_delete_plan(root, root_criteria)
+
+
+def _get_cascade_delete_root(mixed):
+    if isinstance(mixed, sa.orm.query.Query):
+        root = get_tables(mixed._entities[0])[0]
+        primary_keys = list(root.primary_key.columns)
+        return root, _in(primary_keys, _get_root_keys_query(mixed, root))
+    return mixed if isinstance(mixed, sa.Table) else mixed.__table__, None
+
+
+def _get_root_keys_query(query, root):
+    return query.with_entities(*root.primary_key.columns).order_by(None)
+
+
+def _get_cascade_delete_plan(root, root_criteria):
+    references = OrderedDict([(root, [])])
+    tables = [root]
+    while tables:
+        parent = tables.pop(0)
+        foreign_keys = get_referencing_foreign_keys(parent)
+        for table, keys in group_foreign_keys(foreign_keys):
+            if table not in references:
+                references[table] = []
+                tables.append(table)
+            for key in keys:
+                edge = (parent, key.constraint)
+                if edge not in references[table]:
+                    references[table].append(edge)
+
+    ordered = []
+    remaining = OrderedDict(
+        (table, set(parent for parent, _ in edges))
+        for table, edges in references.items()
+    )
+    while remaining:
+        ready = [
+            table for table, parents in remaining.items()
+            if not (parents - set(ordered))
+        ]
+        if not ready:
+            raise ValueError(
+                'Foreign keys between tables %s form a cycle.' %
+                ', '.join(sorted(repr(t.name) for t in remaining))
+            )
+        for table in ready:
+            ordered.append(table)
+            del remaining[table]
+
+    criteria = {root: root_criteria}
+    for table in ordered[1:]:
+        criteria[table] = sa.or_(*(
+            _in(
+                [element.parent for element in constraint.elements],
+                _select(
+                    [element.column for element in constraint.elements],
+                    criteria[parent]
+                )
+            )
+            for parent, constraint in references[table]
+        ))
+    return [(table, criteria[table]) for table in reversed(ordered)]
+
+
+def cascade_delete(mixed, bind=None, chunk_size=None, dry_run=False):
+    """
+    Delete the rows represented by given table or query along with all rows
+    referencing them (transitively) using set based DELETE statements. This is
+    useful for deleting large subtrees (for example a tenant and everything
+    referencing it) without having to rely on ORM cascades which load every
+    dependent object into memory.
+
+    Returns an ordered dictionary of table names and affected row counts in
+    the order the deletes were issued.
+
+    ::
+
+        from sqlalchemy_utils import cascade_delete
+
+
+        cascade_delete(session.query(Tenant).filter_by(name=u'acme'))
+        # OrderedDict([('comment', 120), ('article', 15), ('tenant', 1)])
+
+
+    The dry run mode doesn't delete anything but reports the number of rows
+    that would be deleted from each table.
+
+    ::
+
+        cascade_delete(
+            session.query(Tenant).filter_by(name=u'acme'),
+            dry_run=True
+        )
+
+
+    Large tables can be deleted in chunks. Each chunk is deleted by primary
+    key using a separate DELETE statement.
+
+    ::
+
+        cascade_delete(
+            session.query(Tenant).filter_by(name=u'acme'),
+            chunk_size=10000
+        )
+
+
+    :param mixed:
+        SA Table object, SA declarative class or SA Query object to delete the
+        rows from
+    :param bind:
+        SQLAlchemy Session / Connection / Engine object to execute the
+        statements with. If None the session of given query is used.
+    :param chunk_size:
+        Maximum number of rows to delete per DELETE statement. By default this
+        is None indicating that each table is deleted using a single
+        statement. Tables without primary keys are always deleted using a
+        single statement.
+    :param dry_run:
+        Whether or not to only count the rows instead of deleting them.
+
+    The primary keys of the rows matching given query are fetched once before
+    anything is deleted, hence the query may depend on the referencing rows.
+
+    :raises ValueError:
+        if `bind` is not given and `mixed` is not a query bound to a session
+
+    .. seealso:: :func:`get_cascade_delete_plan`
+    """
+    is_query = isinstance(mixed, sa.orm.query.Query)
+    if bind is None:
+        if not is_query or mixed.session is None:
+            raise ValueError(
+                'Either pass a query bound to a session or pass the session, '
+                'connection or engine to use as the bind parameter.'
+            )
+        bind = mixed.session
+
+    if is_query:
+        # The primary keys of the root rows are fetched before anything is
+        # deleted, since the criteria of the query may depend on the rows
+        # that are deleted first.
+        root = get_tables(mixed._entities[0])[0]
+        primary_keys = list(root.primary_key.columns)
+        keys = [
+            tuple(row) for row in bind.execute(
+                _get_root_keys_query(mixed, root).statement
+            )
+        ]
+        if not keys:
+            root_criteria = sa.false()
+        elif len(primary_keys) == 1:
+            root_criteria = primary_keys[0].in_([key[0] for key in keys])
+        else:
+            root_criteria = sa.tuple_(*primary_keys).in_(
+                [sa.tuple_(*key) for key in keys]
+            )
+        plan = _get_cascade_delete_plan(root, root_criteria)
+    else:
+        plan = get_cascade_delete_plan(mixed)
+
+    counts = OrderedDict()
+    for table, criteria in plan:
+        if dry_run:
+            counts[table.name] = bind.execute(
+                _select([sa.func.count()], criteria).select_from(table)
+            ).scalar()
+            continue
+
+        primary_keys = list(table.primary_key.columns)
+        if chunk_size is None or not primary_keys:
+            query = table.delete()
+            if criteria is not None:
+                query = query.where(criteria)
+            counts[table.name] = bind.execute(query).rowcount
+            continue
+
+        counts[table.name] = 0
+        while True:
+            # The chunk is wrapped in a derived table since some databases
+            # (such as MySQL) don't support LIMIT in IN subqueries.
+            chunk = _select(primary_keys, criteria).limit(chunk_size).alias()
+            deleted = bind.execute(
+                table.delete().where(
+                    _in(primary_keys, sa.select(list(chunk.c)))
+                )
+            ).rowcount
+            counts[table.name] += deleted
+            if deleted < chunk_size:
+                break
+    return counts
+
+
+def _reflect_foreign_key_tables(inspector, metadata):
+    """
+    Reflect the foreign keys and indexes of all tables of given MetaData into
+    a new MetaData object using given Inspector (and hence a single
+    connection and a shared reflection cache). Only the columns that take
+    part in foreign keys or indexes are reflected.
+    """
+    reflected_metadata = MetaData()
+
+    for table in metadata.tables.values():
+        foreign_keys = inspector.get_foreign_keys(
+            table.name, schema=table.schema
+        )
+        indexes = [
+            index for index in inspector.get_indexes(
+                table.name, schema=table.schema
+            )
+            # Skip expression based indexes
+            if None not in index['column_names']
+        ]
+        column_names = set()
+        for foreign_key in foreign_keys:
+            column_names.update(foreign_key['constrained_columns'])
+        for index in indexes:
+            column_names.update(index['column_names'])
+
+        reflected_table = Table(
+            table.name,
+            reflected_metadata,
+            *(sa.Column(name) for name in sorted(column_names)),
+            schema=table.schema
+        )
+        for foreign_key in foreign_keys:
+            referred_table = foreign_key['referred_table']
+            if foreign_key['referred_schema']:
+                referred_table = '%s.%s' % (
+                    foreign_key['referred_schema'], referred_table
+                )
+            reflected_table.append_constraint(
+                ForeignKeyConstraint(
+                    foreign_key['constrained_columns'],
+                    [
+                        '%s.%s' % (referred_table, name)
+                        for name in foreign_key['referred_columns']
+                    ],
+                    name=foreign_key['name']
+                )
+            )
+        for index in indexes:
+            sa.Index(
+                index['name'],
+                *(reflected_table.c[name] for name in index['column_names']),
+                unique=index['unique']
+            )
+    return reflected_metadata
+
+
+def _reflect_table_sizes(conn):
+    if conn.dialect.name != 'postgresql':
+        return {}
+    query = sa.text(
+        """
+        SELECT n.nspname, c.relname, c.reltuples,
+            pg_total_relation_size(c.oid)
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE c.relkind = 'r'
+        """
+    )
+    return dict(
+        ((schema, name), (int(rows), total_bytes))
+        for schema, name, rows, total_bytes in conn.execute(query)
+    )
+
+
+def get_foreign_key_index_ddl(constraint, dialect):
+    """
+    Return the CREATE INDEX statement for an index covering the columns of
+    given foreign key constraint. On PostgreSQL the index is created
+    CONCURRENTLY in order to avoid locking the table against writes.
+
+    ::
+
+        for constraints in non_indexed_foreign_keys(metadata).values():
+            for constraint in constraints:
+                print get_foreign_key_index_ddl(constraint, engine.dialect)
+
+        # CREATE INDEX CONCURRENTLY ix_article_category_id
+        # ON article (category_id)
+
+
+    :param constraint: ForeignKeyConstraint object to create the index for
+    :param dialect: SQLAlchemy Dialect object to generate the statement for
+    """
+    table = constraint.table
+    names = list(constraint.columns.keys())
+    table_name = quote(dialect, table.name)
+    if table.schema:
+        table_name = '%s.%s' % (quote(dialect, table.schema), table_name)
+
+    return 'CREATE INDEX {0}{1} ON {2} ({3})'.format(
+        'CONCURRENTLY ' if dialect.name == 'postgresql' else '',
+        quote(dialect, 'ix_%s_%s' % (table.name, '_'.join(names))),
+        table_name,
+        ', '.join(quote(dialect, name) for name in names)
+    )
+
+
+def non_indexed_foreign_keys(metadata, engine=None, prefix=False):
     """
     Finds all non indexed foreign keys from all tables of given MetaData.
 
     Very useful for optimizing postgresql database and finding out which
     foreign keys need indexes.
 
+    The foreign keys and indexes of all tables are reflected in a single pass
+    using one connection. The returned ForeignKeyConstraint objects belong to
+    the reflected tables and contain additional information in their `info`
+    dictionaries:
+
+    * ``constraint.info['ddl']`` contains the CREATE INDEX statement for the
+      missing index (see :func:`get_foreign_key_index_ddl`).
+    * ``constraint.table.info['estimated_rows']`` and
+      ``constraint.table.info['total_bytes']`` contain the estimated row
+      count and total size of the table (PostgreSQL only).
+
+    ::
+
+        fks = non_indexed_foreign_keys(Base.metadata, engine)
+
+        for constraint in fks['article']:
+            print constraint.info['ddl']
+
+
     :param metadata: MetaData object to inspect tables from
+    :param engine: SQLAlchemy Engine or Connection object to use for
+        reflection. If None the bind of given MetaData object is used.
+    :param prefix:
+        Whether or not to consider foreign keys whose columns are the leading
+        columns of a composite index as indexed. See
+        :func:`is_indexed_foreign_key`.
     """
-    reflected_metadata = MetaData()
-
     if metadata.bind is None and engine is None:
         raise Exception(
             'Either pass a metadata object with bind or '
@@ -332,34 +707,55 @@ def non_indexed_foreign_keys(metadata, engine=None):
 
     constraints = defaultdict(list)
 
-    for table_name in metadata.tables.keys():
-        table = Table(
-            table_name,
-            reflected_metadata,
-            autoload=True,
-            autoload_with=metadata.bind or engine
-        )
+    conn = (metadata.bind or engine).connect()
+    try:
+        inspector = sa.inspect(conn)
+        reflected_metadata = _reflect_foreign_key_tables(inspector, metadata)
+        table_sizes = _reflect_table_sizes(conn)
+        default_schema = inspector.default_schema_name
+    finally:
+        conn.close()
 
+    for table in reflected_metadata.tables.values():
         for constraint in table.constraints:
             if not isinstance(constraint, ForeignKeyConstraint):
                 continue
 
-            if not is_indexed_foreign_key(constraint):
+            if not is_indexed_foreign_key(constraint, prefix=prefix):
+                constraint.info['ddl'] = get_foreign_key_index_ddl(
+                    constraint,
+                    conn.dialect
+                )
                 constraints[table.name].append(constraint)
 
+        size = table_sizes.get((table.schema or default_schema, table.name))
+        if size is not None:
+            table.info['estimated_rows'], table.info['total_bytes'] = size
+
     return dict(constraints)
 
 
-def is_indexed_foreign_key(constraint):
+def is_indexed_foreign_key(constraint, prefix=False):
     """
     Whether or not given foreign key constraint's columns have been indexed.
 
     :param constraint: ForeignKeyConstraint object to check the indexes
+    :param prefix:
+        By default the foreign key is considered indexed only if some index
+        has exactly the same set of columns. If this is True the foreign key
+        is also considered indexed if its columns are the leading columns of
+        a composite index, since such an index can serve the foreign key
+        lookups as well.
     """
+    columns = set(constraint.columns.keys())
     return any(
-        set(constraint.columns.keys())
-        ==
-        set(column.name for column in index.columns)
+        columns ==
+        set(
+            column.name for column in (
+                index.columns.values()[:len(columns)]
+                if prefix else index.columns
+            )
+        )
         for index
         in constraint.table.indexes
     )
@@ -0,0 +1,344 @@
+import weakref
+
+import six
+import sqlalchemy as sa
+
+
+def get_index_key(expr):
+    """
+    Return the key used for given column or expression in index catalogs.
+    Columns are identified by their names and other expressions by their
+    SQL string (for example `lower(user.name)`). ORDER BY modifiers such as
+    ASC and DESC are ignored.
+
+    :param expr: SQLAlchemy Column object or an SQL expression
+    """
+    if hasattr(expr, '__clause_element__'):
+        expr = expr.__clause_element__()
+    while isinstance(
+        expr,
+        (sa.sql.expression.UnaryExpression, sa.sql.elements.Label)
+    ):
+        expr = expr.element
+    if isinstance(expr, sa.Column):
+        return expr.name
+    base_columns = list(getattr(expr, 'base_columns', ()))
+    if len(base_columns) == 1 and isinstance(base_columns[0], sa.Column):
+        return base_columns[0].name
+    return six.text_type(expr)
+
+
+def get_index_predicate(index):
+    """
+    Return the predicate of given partial Index object (declared with the
+    `postgresql_where` or `sqlite_where` argument) or None if the index is
+    not partial.
+
+    :param index: SQLAlchemy Index object
+    """
+    for dialect in ('postgresql', 'sqlite'):
+        predicate = index.dialect_options[dialect]['where']
+        if predicate is not None:
+            return predicate
+
+
+class IndexInfo(object):
+    """
+    Description of a single index (or primary key or unique constraint) in
+    an :class:`IndexCatalog`.
+
+    :param name: name of the index
+    :param keys:
+        tuple of index keys (see :func:`get_index_key`) in index order
+    :param unique: whether or not the index is unique
+    :param predicate: predicate of a partial index or None
+    """
+    def __init__(self, name, keys, unique=False, predicate=None):
+        self.name = name
+        self.keys = tuple(keys)
+        self.unique = unique
+        self.predicate = predicate
+
+    @property
+    def is_partial(self):
+        return self.predicate is not None
+
+    def __repr__(self):
+        return '<IndexInfo name=%r keys=%r unique=%r>' % (
+            self.name,
+            self.keys,
+            self.unique
+        )
+
+
+class IndexCatalog(object):
+    """
+    Catalog of the indexes of a single table. All index prefixes and unique
+    key sets are precomputed, hence the lookups are O(1).
+
+    Partial indexes are recorded but they are not used for answering prefix
+    or uniqueness questions unless explicitly asked (`partial=True`), since
+    they can serve only the queries matching their predicate.
+
+    :param indexes: sequence of :class:`IndexInfo` objects
+    """
+    def __init__(self, indexes):
+        self.indexes = list(indexes)
+        self.prefixes = set()
+        self.partial_prefixes = set()
+        self.unique_keys = set()
+        for index in self.indexes:
+            prefixes = (
+                self.partial_prefixes if index.is_partial else self.prefixes
+            )
+            for length in range(1, len(index.keys) + 1):
+                prefixes.add(index.keys[:length])
+            if index.unique and not index.is_partial:
+                self.unique_keys.add(frozenset(index.keys))
+
+    @classmethod
+    def from_table(cls, table):
+        """
+        Build a catalog from the declared primary key, unique constraints and
+        indexes of given Table object.
+        """
+        indexes = []
+        if table.primary_key.columns:
+            indexes.append(
+                IndexInfo(
+                    table.primary_key.name,
+                    [column.name for column in table.primary_key.columns],
+                    unique=True
+                )
+            )
+        for constraint in table.constraints:
+            if isinstance(constraint, sa.UniqueConstraint):
+                indexes.append(
+                    IndexInfo(
+                        constraint.name,
+                        [column.name for column in constraint.columns],
+                        unique=True
+                    )
+                )
+        for index in table.indexes:
+            indexes.append(
+                IndexInfo(
+                    index.name,
+                    [get_index_key(expr) for expr in index.expressions],
+                    unique=index.unique,
+                    predicate=get_index_predicate(index)
+                )
+            )
+        return cls(indexes)
+
+    @classmethod
+    def reflect(cls, table, bind):
+        """
+        Build a catalog from the primary key, unique constraints and indexes
+        reflected from the database.
+
+        Expression indexes are reflected only up to their first expression
+        column, since reflection does not return the expressions. Note that
+        depending on the dialect the predicates of partial indexes may not be
+        reflected, in which case partial indexes are treated as full ones.
+        """
+        inspector = sa.inspect(bind)
+        name = table.name
+        schema = table.schema
+        indexes = []
+        primary_key = inspector.get_pk_constraint(name, schema=schema)
+        if primary_key['constrained_columns']:
+            indexes.append(
+                IndexInfo(
+                    primary_key.get('name'),
+                    primary_key['constrained_columns'],
+                    unique=True
+                )
+            )
+        try:
+            unique_constraints = inspector.get_unique_constraints(
+                name, schema=schema
+            )
+        except NotImplementedError:
+            unique_constraints = []
+        for constraint in unique_constraints:
+            indexes.append(
+                IndexInfo(
+                    constraint['name'],
+                    constraint['column_names'],
+                    unique=True
+                )
+            )
+        for index in inspector.get_indexes(name, schema=schema):
+            keys = []
+            for column_name in index['column_names']:
+                if column_name is None:
+                    break
+                keys.append(column_name)
+            if not keys:
+                continue
+            indexes.append(
+                IndexInfo(
+                    index['name'],
+                    keys,
+                    unique=(
+                        index['unique'] and
+                        len(keys) == len(index['column_names'])
+                    )
+                )
+            )
+        return cls(indexes)
+
+    def has_prefix(self, exprs, partial=False):
+        """
+        Return whether or not there is an index that starts with given
+        columns or expressions in given order, in other words whether or not
+        an ORDER BY or WHERE clause using given expressions can be served by
+        an index.
+
+        :param exprs: sequence of columns, expressions or index keys
+        :param partial: whether or not to consider partial indexes
+        """
+        keys = tuple(self.get_keys(exprs))
+        return keys in self.prefixes or (
+            partial and keys in self.partial_prefixes
+        )
+
+    def has_unique(self, exprs):
+        """
+        Return whether or not there is a primary key, unique constraint or
+        (non-partial) unique index consisting of exactly given columns (in
+        any order).
+
+        :param exprs: sequence of columns, expressions or index keys
+        """
+        return frozenset(self.get_keys(exprs)) in self.unique_keys
+
+    def get_keys(self, exprs):
+        return [
+            expr if isinstance(expr, six.string_types)
+            else get_index_key(expr)
+            for expr in exprs
+        ]
+
+    def __repr__(self):
+        return '<IndexCatalog indexes=%r>' % self.indexes
+
+
+_catalogs = weakref.WeakKeyDictionary()
+
+
+def _get_signature(table):
+    # Columns and expressions are compared by identity, hence replaced and
+    # reordered columns change the signature as well.
+    return (
+        tuple(map(id, table.primary_key.columns)),
+        frozenset(
+            (
+                tuple(map(id, constraint.columns)),
+                isinstance(constraint, sa.UniqueConstraint)
+            )
+            for constraint in table.constraints
+        ),
+        frozenset(
+            (
+                tuple(map(id, index.expressions)),
+                index.unique,
+                id(get_index_predicate(index))
+            )
+            for index in table.indexes
+        )
+    )
+
+
+def get_index_catalog(table, bind=None):
+    """
+    Return an :class:`IndexCatalog` for given Table object. The catalog is
+    built from the declared table metadata on first call and cached per
+    table. The cache is refreshed automatically if the primary key, indexes
+    or constraints of the table change.
+
+    If `bind` is given the catalog is built from the indexes reflected from
+    the database instead. Reflected catalogs are cached per table and
+    database URL until :func:`clear_index_catalogs` is called, for example
+    after running migrations.
+
+    ::
+
+        from sqlalchemy_utils import get_index_catalog
+
+
+        class Article(Base):
+            __tablename__ = 'article'
+            id = sa.Column(sa.Integer, primary_key=True)
+            author_id = sa.Column(sa.Integer)
+            created_at = sa.Column(sa.DateTime)
+
+            __table_args__ = (
+                sa.Index('ix_author_created', author_id, created_at),
+            )
+
+
+        catalog = get_index_catalog(Article.__table__)
+
+        catalog.has_prefix([Article.author_id])                      # True
+        catalog.has_prefix([Article.author_id, Article.created_at])  # True
+        catalog.has_prefix([Article.created_at])                     # False
+        catalog.has_unique([Article.id])                             # True
+
+        catalog = get_index_catalog(Article.__table__, bind=engine)
+
+
+    .. versionadded: 0.31.0
+
+    :param table: SQLAlchemy Table object
+    :param bind: optional Engine or Connection used for reflection
+    """
+    catalogs = _catalogs.setdefault(table, {})
+    if bind is None:
+        signature = _get_signature(table)
+        try:
+            cached_signature, catalog = catalogs[None]
+        except KeyError:
+            cached_signature = None
+        if cached_signature != signature:
+            catalog = IndexCatalog.from_table(table)
+            catalogs[None] = (signature, catalog)
+        return catalog
+
+    key = bind.engine.url.__to_string__(hide_password=True)
+    try:
+        return catalogs[key]
+    except KeyError:
+        catalog = catalogs[key] = IndexCatalog.reflect(table, bind)
+        return catalog
+
+
+def clear_index_catalogs(table=None, bind=None):
+    """
+    Clear cached index catalogs. By default all catalogs are cleared.
+
+    ::
+
+        # After migrating the database
+        clear_index_catalogs(bind=engine)
+
+
+    :param table: optional Table object whose catalogs to clear
+    :param bind:
+        optional Engine or Connection whose reflected catalogs to clear
+    """
+    if table is None and bind is None:
+        _catalogs.clear()
+        return
+    tables = list(_catalogs.keys()) if table is None else [table]
+    for table in tables:
+        catalogs = _catalogs.get(table)
+        if catalogs is None:
+            continue
+        if bind is None:
+            catalogs.clear()
+        else:
+            catalogs.pop(
+                bind.engine.url.__to_string__(hide_password=True), None
+            )
@@ -1,17 +1,118 @@
+import codecs
 import contextlib
 import datetime
+import gzip
 import inspect
+import io
 import re
 
 import six
 import sqlalchemy as sa
 
 
-def create_mock_engine(bind, stream=None):
+class LiteralValueRenderer(object):
+    """
+    Compiler mixin that renders literal values in a database agnostic
+    manner.
+    """
+    def render_literal_value(self, value, type_):
+        if value is None:
+            return 'NULL'
+
+        elif isinstance(value, six.integer_types):
+            return str(value)
+
+        elif isinstance(value, (datetime.date, datetime.datetime)):
+            return "'%s'" % value
+
+        return super(LiteralValueRenderer, self).render_literal_value(
+            value, type_)
+
+
+class LiteralBindsRenderer(LiteralValueRenderer):
+    """
+    Compiler mixin that renders all bound parameters inline as literals.
+    """
+    def visit_bindparam(self, bindparam, *args, **kwargs):
+        return self.render_literal_value(bindparam.value, bindparam.type)
+
+
+_compiler_classes = {}
+
+
+def get_compiler_class(base, mixin=LiteralBindsRenderer):
+    """
+    Return a (cached) subclass of given compiler class with given mixin
+    applied.
+
+    :param base: compiler class, for example `dialect.statement_compiler`
+    :param mixin: compiler mixin class
+    """
+    try:
+        return _compiler_classes[(base, mixin)]
+    except KeyError:
+        cls = _compiler_classes[(base, mixin)] = type(
+            'Literal' + base.__name__, (mixin, base), {}
+        )
+        return cls
+
+
+def get_base_compiler_class(dialect, sql):
+    if isinstance(sql, sa.schema.DDLElement):
+        return dialect.ddl_compiler
+    return dialect.statement_compiler
+
+
+def open_dump(path, compress=None, encoding='utf8'):
+    """
+    Open given path for writing SQL dumps in text mode. If `compress` is
+    True (by default if the path ends with `.gz`) the output is gzip
+    compressed.
+
+    ::
+
+        from sqlalchemy_utils import create_mock_engine
+        from sqlalchemy_utils.functions import open_dump
+
+
+        with open_dump('schema.sql.gz') as stream:
+            engine = create_mock_engine(
+                'postgresql://', stream, normalize=False
+            )
+            metadata.create_all(engine)
+
+
+    .. versionadded: 0.31.0
+
+    :param path: path of the file to write
+    :param compress: whether or not to gzip the output
+    :param encoding: text encoding of the output
+    """
+    if compress is None:
+        compress = path.endswith('.gz')
+    if compress:
+        # GzipFile does not implement the io interface on Python 2.6, hence
+        # io.TextIOWrapper can't be used.
+        return codecs.getwriter(encoding)(gzip.open(path, 'wb'))
+    return io.open(path, 'w', encoding=encoding)
+
+
+def create_mock_engine(bind, stream=None, normalize=True):
     """Create a mock SQLAlchemy engine from the passed engine or bind URL.
 
+    Each statement is written to the stream as soon as it is executed, hence
+    the stream can be a (possibly compressed, see :func:`open_dump`) file for
+    dumping large schemas without buffering the output in memory.
+
+    .. versionchanged: 0.31.0
+        Added normalize parameter
+
     :param bind: A SQLAlchemy engine or bind URL to mock.
     :param stream: Render all DDL operations to the stream.
+    :param normalize:
+        Whether or not to strip empty lines and surrounding whitespace from
+        the rendered statements. Disabling this skips the regular expression
+        post-processing of each statement and writes the compiled SQL as is.
     """
 
     if not isinstance(bind, six.string_types):
@@ -20,31 +121,26 @@ def create_mock_engine(bind, stream=None):
     else:
         bind_url = bind
 
-    if stream is not None:
+    if stream is not None and normalize:
 
         def dump(sql, *args, **kwargs):
-
-            class Compiler(type(sql._compiler(engine.dialect))):
-
-                def visit_bindparam(self, bindparam, *args, **kwargs):
-                    return self.render_literal_value(
-                        bindparam.value, bindparam.type)
-
-                def render_literal_value(self, value, type_):
-                    if isinstance(value, six.integer_types):
-                        return str(value)
-
-                    elif isinstance(value, (datetime.date, datetime.datetime)):
-                        return "'%s'" % value
-
-                    return super(Compiler, self).render_literal_value(
-                        value, type_)
-
-            text = str(Compiler(engine.dialect, sql).process(sql))
+            Compiler = get_compiler_class(
+                get_base_compiler_class(engine.dialect, sql)
+            )
+            text = six.text_type(Compiler(engine.dialect, sql))
             text = re.sub(r'\n+', '\n', text)
             text = text.strip('\n').strip()
 
-            stream.write('\n%s;' % text)
+            stream.write(u'\n%s;' % text)
+
+    elif stream is not None:
+
+        def dump(sql, *args, **kwargs):
+            Compiler = get_compiler_class(
+                get_base_compiler_class(engine.dialect, sql)
+            )
+            text = six.text_type(Compiler(engine.dialect, sql))
+            stream.write(u'\n%s;' % text)
 
     else:
 
@@ -55,21 +151,39 @@ def create_mock_engine(bind, stream=None):
 
 
 @contextlib.contextmanager
-def mock_engine(engine, stream=None):
+def mock_engine(engine, stream=None, normalize=True):
     """Mocks out the engine specified in the passed bind expression.
 
     Note this function is meant for convenience and protected usage. Do NOT
     blindly pass user input to this function as it uses exec.
 
+    ::
+
+        with mock_engine('engine', 'schema.sql.gz', normalize=False):
+            metadata.create_all(engine)
+
+
+    .. versionchanged: 0.31.0
+        Added normalize parameter and support for file paths as stream
+
     :param engine: A python expression that represents the engine to mock.
-    :param stream: Render all DDL operations to the stream.
+    :param stream:
+        Render all DDL operations to the stream. If a path is given the
+        file is opened with :func:`open_dump` and closed on exit.
+    :param normalize: See :func:`create_mock_engine`.
     """
 
     # Create a stream if not present.
 
+    close = False
+
     if stream is None:
         stream = six.moves.cStringIO()
 
+    elif isinstance(stream, six.string_types):
+        stream = open_dump(stream)
+        close = True
+
     # Navigate the stack and find the calling frame that allows the
     # expression to execuate.
 
@@ -91,7 +205,7 @@ def mock_engine(engine, stream=None):
 
     # Evaluate the expression and get the target engine.
 
-    frame.f_locals['__mock'] = create_mock_engine(target, stream)
+    frame.f_locals['__mock'] = create_mock_engine(target, stream, normalize)
 
     # Replace the target with our mock.
 
@@ -99,7 +213,12 @@ def mock_engine(engine, stream=None):
 
     # Give control back.
 
-    yield stream
+    try:
+        yield stream
+
+    finally:
+        if close:
+            stream.close()
 
     # Put the target engine back.
 
@@ -3,6 +3,9 @@ try:
 except ImportError:
     from ordereddict import OrderedDict
 
+import itertools
+import weakref
+from collections import defaultdict
 from functools import partial
 from inspect import isclass
 from operator import attrgetter
@@ -21,6 +24,38 @@ from sqlalchemy.orm.util import AliasedInsp
 
 from sqlalchemy_utils.utils import is_sequence
 
+from .cache import introspection_cache, LRUCache
+
+
+@introspection_cache.memoize()
+def _get_class_index(base):
+    """
+    Return a tuple of two dictionaries for given declarative base. The first
+    one maps tables to (weak references of) their declarative classes. The
+    second one maps tables to dictionaries of polymorphic discriminator column
+    names and polymorphic identities of the classes sharing the table.
+
+    The index is built once per declarative base and cleared whenever a new
+    mapper appears.
+    """
+    classes = defaultdict(list)
+    for class_ in list(base._decl_class_registry.values()):
+        if hasattr(class_, '__table__'):
+            classes[class_.__table__].append(weakref.ref(class_))
+
+    identities = defaultdict(lambda: defaultdict(dict))
+    for table, refs in classes.items():
+        if len(refs) < 2:
+            continue
+        for ref in refs:
+            mapper = sa.inspect(ref())
+            if mapper.polymorphic_on is not None:
+                identities[table][mapper.polymorphic_on.name][
+                    mapper.polymorphic_identity
+                ] = ref
+
+    return dict(classes), dict(identities)
+
 
 def get_class_by_table(base, table, data=None):
     """
@@ -72,11 +107,19 @@ def get_class_by_table(base, table, data=None):
     :param table: SQLAlchemy Table object
     :param data: Data row to determine the class in polymorphic scenarios
     :return: Declarative class or None.
+
+    .. versionchanged: 0.31.0
+        The classes and polymorphic identities are looked up from an index
+        that is built once per declarative base instead of scanning the
+        class registry on every call.
     """
-    found_classes = set(
-        c for c in base._decl_class_registry.values()
-        if hasattr(c, '__table__') and c.__table__ is table
-    )
+    classes, identities = _get_class_index(base)
+    found_classes = [ref() for ref in classes.get(table, [])]
+    if None in found_classes:
+        # Some of the indexed classes have been garbage collected.
+        introspection_cache.evict(base)
+        return get_class_by_table(base, table, data)
+
     if len(found_classes) > 1:
         if not data:
             raise ValueError(
@@ -87,12 +130,12 @@ def get_class_by_table(base, table, data=None):
                 )
             )
         else:
-            for cls in found_classes:
-                mapper = sa.inspect(cls)
-                polymorphic_on = mapper.polymorphic_on.name
+            polymorphic_map = identities.get(table, {})
+            for polymorphic_on, classes_by_identity in polymorphic_map.items():
                 if polymorphic_on in data:
-                    if data[polymorphic_on] == mapper.polymorphic_identity:
-                        return cls
+                    ref = classes_by_identity.get(data[polymorphic_on])
+                    if ref is not None:
+                        return ref()
             raise ValueError(
                 "Multiple declarative classes found for table '{0}'. Given "
                 "data row does not match any polymorphic identity of the "
@@ -101,7 +144,7 @@ def get_class_by_table(base, table, data=None):
                 )
             )
     elif found_classes:
-        return found_classes.pop()
+        return found_classes[0]
     return None
 
 
@@ -204,6 +247,7 @@ def cast_if(expression, type_):
     )
 
 
+@introspection_cache.memoize()
 def get_column_key(model, column):
     """
     Return the key for given column in given model.
@@ -239,6 +283,7 @@ def get_column_key(model, column):
     )
 
 
+@introspection_cache.memoize(tables=True, weak=True)
 def get_mapper(mixed):
     """
     Return related SQLAlchemy Mapper for given SQLAlchemy object.
@@ -338,6 +383,7 @@ def get_bind(obj):
     return conn
 
 
+@introspection_cache.memoize(copy=True)
 def get_primary_keys(mixed):
     """
     Return an OrderedDict of all primary keys for given Table object,
@@ -367,6 +413,10 @@ def get_primary_keys(mixed):
 
         Renamed this function to 'get_primary_keys', formerly 'primary_keys'
 
+    .. versionchanged: 0.31.0
+        The results are memoized for declarative classes, instances and
+        mappers.
+
     .. seealso:: :func:`get_columns`
     """
     return OrderedDict(
@@ -377,6 +427,7 @@ def get_primary_keys(mixed):
     )
 
 
+@introspection_cache.memoize(copy=True)
 def get_tables(mixed):
     """
     Return a set of tables associated with given SQLAlchemy object.
@@ -698,6 +749,7 @@ def get_all_descriptors(expr):
         return attrs
 
 
+@introspection_cache.memoize(copy=True)
 def get_hybrid_properties(model):
     """
     Returns a dictionary of hybrid property keys and hybrid properties for
@@ -753,6 +805,9 @@ def get_hybrid_properties(model):
     .. versionchanged: 0.30.15
         Added support for aliased classes
 
+    .. versionchanged: 0.31.0
+        The results are memoized for declarative classes and mappers.
+
     :param model: SQLAlchemy declarative model or mapper
     """
     return dict(
@@ -777,6 +832,86 @@ def get_declarative_base(model):
     return model
 
 
+_sequence_types = {}
+
+
+def _is_sequence(value):
+    # The result of is_sequence only depends on the type of the value, hence
+    # it is cached per type in order to avoid repeated ABC isinstance checks.
+    type_ = type(value)
+    try:
+        return _sequence_types[type_]
+    except KeyError:
+        result = _sequence_types[type_] = is_sequence(value)
+        return result
+
+
+_dotpath_getters = LRUCache(maxsize=1000)
+
+
+def _get_dotpath_getters(dot_path):
+    getters = _dotpath_getters.get(dot_path)
+    if getters is None:
+        getters = [attrgetter(path) for path in dot_path.split('.')]
+        _dotpath_getters.set(dot_path, getters)
+    return getters
+
+
+def compile_dotpath(dot_path, condition=None):
+    """
+    Return a reusable callable that works like :func:`getdotattr` for given
+    dot-notated path and condition. The parsed paths are cached, hence each
+    path is only parsed once.
+
+    ::
+
+        get_document = compile_dotpath('section.document')
+
+        get_document(subsection)
+
+        get_document(SubSection)
+
+
+    .. versionadded: 0.31.0
+
+    :param dot_path: Attribute path with dot mark as separator
+    :param condition:
+        Optional callable. Values for which this returns False are filtered
+        out from the results.
+    """
+    getters = _get_dotpath_getters(str(dot_path))
+
+    def getter(obj_or_class):
+        last = obj_or_class
+
+        for attr_getter in getters:
+            if _is_sequence(last):
+                tmp = []
+                for element in last:
+                    value = None if element is None else attr_getter(element)
+                    if _is_sequence(value):
+                        tmp.extend(value)
+                    else:
+                        tmp.append(value)
+                last = tmp
+            elif isinstance(last, InstrumentedAttribute):
+                last = attr_getter(last.property.mapper.class_)
+            elif last is None:
+                return None
+            else:
+                last = attr_getter(last)
+            if condition is not None:
+                if _is_sequence(last):
+                    last = [v for v in last if condition(v)]
+                else:
+                    if not condition(last):
+                        return None
+
+        return last
+
+    return getter
+
+
 def getdotattr(obj_or_class, dot_path, condition=None):
     """
     Allow dot-notated strings to be passed to `getattr`.
@@ -788,37 +923,103 @@ def getdotattr(obj_or_class, dot_path, condition=None):
         getdotattr(subsection, 'section.document')
 
 
+    None elements of the sequences along the path result in None values.
+
+    .. versionchanged: 0.31.0
+        None elements of sequences along the path no longer raise an
+        AttributeError but result in None values.
+
     :param obj_or_class: Any object or class
     :param dot_path: Attribute path with dot mark as separator
+
+    .. seealso:: :func:`compile_dotpath`
+    """
+    return compile_dotpath(dot_path, condition)(obj_or_class)
+
+
+def _load_dotpath(objs, dot_path):
+    """
+    Load the relationships along given dot-notated path for all given
+    declarative model objects using a single query with subquery eager
+    loading.
     """
-    last = obj_or_class
+    session = object_session(objs[0])
+    if session is None:
+        return
 
+    mapper = get_mapper(objs[0])
+    relationships = []
     for path in str(dot_path).split('.'):
-        getter = attrgetter(path)
-
-        if is_sequence(last):
-            tmp = []
-            for element in last:
-                value = getter(element)
-                if is_sequence(value):
-                    tmp.extend(value)
-                else:
-                    tmp.append(value)
-            last = tmp
-        elif isinstance(last, InstrumentedAttribute):
-            last = getter(last.property.mapper.class_)
-        elif last is None:
-            return None
-        else:
-            last = getter(last)
-        if condition is not None:
-            if is_sequence(last):
-                last = [v for v in last if condition(v)]
-            else:
-                if not condition(last):
-                    return None
+        prop = mapper.attrs.get(path)
+        if not isinstance(prop, RelationshipProperty):
+            break
+        relationships.append(path)
+        mapper = prop.mapper
+
+    identities = [
+        identity for identity in (sa.inspect(obj).identity for obj in objs)
+        if identity is not None
+    ]
+    if not relationships or not identities:
+        return
+
+    mapper = get_mapper(objs[0])
+    primary_keys = mapper.primary_key
+    if len(primary_keys) == 1:
+        criteria = primary_keys[0].in_(
+            [identity[0] for identity in identities]
+        )
+    else:
+        criteria = sa.tuple_(*primary_keys).in_(identities)
+    (
+        session.query(mapper)
+        .filter(criteria)
+        .options(sa.orm.subqueryload_all('.'.join(relationships)))
+        .all()
+    )
+
+
+def getdotattr_many(objs, dot_path, condition=None, load=False):
+    """
+    Return a flattened list of the values of given dot-notated path for all
+    given objects.
+
+    ::
+
+        getdotattr_many(subsections, 'section.document')
+        # [Document(...), Document(...), ...]
 
-    return last
+
+    If the objects are persisted SQLAlchemy declarative model objects the
+    relationships along the path can be loaded for all objects using a single
+    query before traversing the path. This avoids issuing a separate lazy load
+    query per object.
+
+    ::
+
+        getdotattr_many(subsections, 'section.document', load=True)
+
+
+    As with :func:`getdotattr`, paths that run into a None value result in
+    None.
+
+    .. versionadded: 0.31.0
+
+    :param objs: Sequence of objects
+    :param dot_path: Attribute path with dot mark as separator
+    :param condition:
+        Optional callable. Values for which this returns False are filtered
+        out from the results.
+    :param load:
+        Whether or not to eagerly load the relationships along the path for
+        all given objects before traversing the path.
+    """
+    objs = list(objs)
+    if not objs:
+        return []
+    if load:
+        _load_dotpath(objs, dot_path)
+    return compile_dotpath(dot_path, condition)(objs)
 
 
 def is_deleted(obj):
@@ -871,6 +1072,10 @@ def has_changes(obj, attrs=None, exclude=None):
     .. versionchanged: 0.26.6
         Added support for multiple attributes and exclude parameter.
 
+    .. versionchanged: 0.31.0
+        Only the modified attributes are inspected when no attributes are
+        given. See :func:`changed_attributes`.
+
     :param obj: SQLAlchemy declarative model object
     :param attrs: Names of the attributes
     :param exclude: Names of the attributes to exclude
@@ -889,11 +1094,84 @@ def has_changes(obj, attrs=None, exclude=None):
     else:
         if exclude is None:
             exclude = []
-        return any(
-            attr.history.has_changes()
-            for key, attr in sa.inspect(obj).attrs.items()
-            if key not in exclude
-        )
+        return any(key not in exclude for key in changed_attributes(obj))
+
+
+def changed_attributes(obj):
+    """
+    Return a set of the keys of all column and relationship attributes of
+    given declarative model object that have changed during the session.
+
+    Only the attributes that have been modified since the object was last
+    flushed (the keys of the committed state of the object) are inspected,
+    hence this function never loads any attributes and its cost doesn't
+    depend on the number of attributes the model has.
+
+    ::
+
+
+        from sqlalchemy_utils import changed_attributes
+
+
+        user = session.query(User).first()
+
+        changed_attributes(user)  # set()
+
+        user.name = u'someone'
+
+        changed_attributes(user)  # set(['name'])
+
+
+    Assigning an attribute its current value is not considered a change.
+
+    .. versionadded: 0.31.0
+
+    .. seealso:: :func:`has_changes`
+
+    :param obj: SQLAlchemy declarative model object
+    """
+    state = sa.inspect(obj)
+    return set(
+        key for key in state.committed_state
+        if sa.orm.attributes.get_history(
+            obj,
+            key,
+            passive=sa.orm.attributes.PASSIVE_NO_INITIALIZE
+        ).has_changes()
+    )
+
+
+def session_changes(session):
+    """
+    Return a list of `(obj, keys)` tuples for all new and dirty objects of
+    given session that have changed attributes. The `keys` are the changed
+    attribute keys of each object as returned by :func:`changed_attributes`.
+    Deleted objects and dirty objects without net changes are skipped.
+
+    This function is especially useful within `before_flush` listeners.
+
+    ::
+
+
+        from sqlalchemy_utils import session_changes
+
+
+        @sa.event.listens_for(Session, 'before_flush')
+        def audit(session, flush_context, instances):
+            for obj, keys in session_changes(session):
+                print obj, keys
+
+
+    .. versionadded: 0.31.0
+
+    :param session: SQLAlchemy Session object
+    """
+    changes = []
+    for obj in itertools.chain(session.new, session.dirty):
+        keys = changed_attributes(obj)
+        if keys:
+            changes.append((obj, keys))
+    return changes
 
 
 def is_loaded(obj, prop):
@@ -996,10 +1274,153 @@ def naturally_equivalent(obj, obj2):
     :param obj: SQLAlchemy declarative model object
     :param obj2: SQLAlchemy declarative model object to compare with `obj`
     """
-    for column_key, column in sa.inspect(obj.__class__).columns.items():
-        if column.primary_key:
-            continue
-
+    for column_key in _get_natural_keys(obj.__class__):
         if not (getattr(obj, column_key) == getattr(obj2, column_key)):
             return False
     return True
+
+
+@introspection_cache.memoize()
+def _get_natural_keys(model):
+    return [
+        column_key for column_key, column in get_columns(model).items()
+        if not column.primary_key
+    ]
+
+
+def _null_safe_eq(column, column2):
+    if getattr(column, 'nullable', True):
+        return sa.or_(
+            column == column2,
+            sa.and_(column.is_(None), column2.is_(None))
+        )
+    return column == column2
+
+
+def _query_natural_duplicates(query, exclude):
+    mapper = get_mapper(query._entities[0])
+    columns = [
+        column
+        for key, column in get_columns(mapper).items()
+        if not column.primary_key and key not in exclude
+    ]
+    if not columns:
+        return None
+    # Joins may repeat the rows of an entity, hence the rows are made
+    # distinct by primary key before counting them.
+    rows = (
+        query
+        .with_entities(*(
+            [
+                column.label('pk_%d' % index) for index, column
+                in enumerate(get_primary_keys(mapper).values())
+            ] + [
+                column.label('column_%d' % index)
+                for index, column in enumerate(columns)
+            ]
+        ))
+        .order_by(None)
+        .distinct()
+        .subquery()
+    )
+    row_columns = [
+        rows.c['column_%d' % index] for index in range(len(columns))
+    ]
+    duplicates = (
+        sa.select(row_columns)
+        .group_by(*row_columns)
+        .having(sa.func.count() > 1)
+        .alias()
+    )
+    return query.join(
+        duplicates,
+        sa.and_(*(
+            _null_safe_eq(column, duplicates.c['column_%d' % index])
+            for index, column in enumerate(columns)
+        ))
+    )
+
+
+def find_naturally_equivalent(mixed, exclude=None):
+    """
+    Return a list of groups of naturally equivalent objects (see
+    :func:`naturally_equivalent`) from given iterable of SQLAlchemy declarative
+    instances or SQLAlchemy Query object. Each group is a list of at least two
+    objects.
+
+    The objects are grouped by their non primary key column values in a
+    single pass instead of comparing each pair of objects.
+
+    ::
+
+        from sqlalchemy_utils import find_naturally_equivalent
+
+
+        users = [
+            User(name=u'someone'),
+            User(name=u'someone'),
+            User(name=u'someone else')
+        ]
+
+        find_naturally_equivalent(users)
+        # [[User(name=u'someone'), User(name=u'someone')]]
+
+
+    For Query objects the duplicates are found in the database using
+    `GROUP BY <non primary key columns> HAVING count(*) > 1` over the
+    distinct primary keys of the query and only the duplicate rows are
+    loaded. The query should select a single entity.
+
+    ::
+
+        find_naturally_equivalent(session.query(User))
+
+
+    Additionally exclude parameter can be given to ignore certain attributes.
+
+    ::
+
+        find_naturally_equivalent(users, exclude=['created_at'])
+
+
+    .. versionadded: 0.31.0
+
+    :param mixed:
+        An iterable of SQLAlchemy declarative model objects or SQLAlchemy
+        Query object
+    :param exclude: Names of the attributes to exclude from the comparison
+    """
+    if exclude is None:
+        exclude = []
+
+    if isinstance(mixed, sa.orm.query.Query):
+        query = _query_natural_duplicates(mixed, exclude)
+        if query is None:
+            return []
+        mixed = OrderedDict((id(obj), obj) for obj in query).values()
+
+    groups = OrderedDict()
+    unhashable_groups = []
+    for obj in mixed:
+        values = (type(obj), ) + tuple(
+            getattr(obj, column_key)
+            for column_key in _get_natural_keys(type(obj))
+            if column_key not in exclude
+        )
+        try:
+            groups.setdefault(values, []).append(obj)
+        except TypeError:
+            for values2, group in unhashable_groups:
+                if values == values2:
+                    group.append(obj)
+                    break
+            else:
+                unhashable_groups.append((values, [obj]))
+
+    return [
+        group for group in itertools.chain(
+            groups.values(),
+            (group for _, group in unhashable_groups)
+        )
+        if len(group) > 1
+    ]
@@ -0,0 +1,278 @@
+import base64
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+import six
+import sqlalchemy as sa
+
+from .sort_query import make_order_by_deterministic
+
+
+class UTC(datetime.tzinfo):
+    def utcoffset(self, dt):
+        return datetime.timedelta(0)
+
+    def tzname(self, dt):
+        return 'UTC'
+
+    def dst(self, dt):
+        return datetime.timedelta(0)
+
+
+utc = UTC()
+
+
+DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+DATE_FORMAT = '%Y-%m-%d'
+TIME_FORMAT = '%H:%M:%S.%f'
+
+
+def _encode_value(value):
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            return {
+                'datetimetz': value.astimezone(utc).strftime(DATETIME_FORMAT)
+            }
+        return {'datetime': value.strftime(DATETIME_FORMAT)}
+    if isinstance(value, datetime.date):
+        return {'date': value.strftime(DATE_FORMAT)}
+    if isinstance(value, datetime.time):
+        return {'time': value.strftime(TIME_FORMAT)}
+    if isinstance(value, Decimal):
+        return {'decimal': str(value)}
+    if isinstance(value, uuid.UUID):
+        return {'uuid': value.hex}
+    if value is None or isinstance(
+        value, six.string_types + six.integer_types + (bool, float)
+    ):
+        return value
+    raise TypeError('Could not encode cursor value %r.' % value)
+
+
+def _decode_value(value):
+    if not isinstance(value, dict):
+        return value
+    (type_, value), = value.items()
+    if type_ == 'datetimetz':
+        return datetime.datetime.strptime(value, DATETIME_FORMAT).replace(
+            tzinfo=utc
+        )
+    if type_ == 'datetime':
+        return datetime.datetime.strptime(value, DATETIME_FORMAT)
+    if type_ == 'date':
+        return datetime.datetime.strptime(value, DATE_FORMAT).date()
+    if type_ == 'time':
+        return datetime.datetime.strptime(value, TIME_FORMAT).time()
+    if type_ == 'decimal':
+        return Decimal(value)
+    if type_ == 'uuid':
+        return uuid.UUID(value)
+    raise ValueError('Unknown cursor value type %r.' % type_)
+
+
+def encode_cursor(values):
+    """
+    Encode given sequence of ORDER BY values into an URL safe cursor string.
+
+    :param values: sequence of values
+    """
+    data = json.dumps([_encode_value(value) for value in values])
+    return base64.urlsafe_b64encode(data.encode('utf8')).decode('ascii')
+
+
+def decode_cursor(cursor):
+    """
+    Decode given cursor string (as returned by :func:`encode_cursor`) back to
+    a list of ORDER BY values.
+
+    :param cursor: cursor string
+    :raises ValueError: if given cursor is not valid
+    """
+    try:
+        values = json.loads(
+            base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf8')
+        )
+        return [_decode_value(value) for value in values]
+    except (TypeError, ValueError, AttributeError) as e:
+        raise ValueError('Invalid cursor %r: %s' % (cursor, e))
+
+
+def get_order_by_columns(query):
+    """
+    Return a list of `(expression, descending)` tuples for the ORDER BY of
+    given query.
+
+    :param query: SQLAlchemy Query object
+    """
+    columns = []
+    for expr in query._order_by or []:
+        descending = False
+        if isinstance(expr, sa.sql.expression.UnaryExpression):
+            descending = expr.modifier == sa.sql.operators.desc_op
+            expr = expr.element
+        if isinstance(expr, sa.sql.elements.Label):
+            expr = expr.element
+        if not isinstance(expr, sa.sql.expression.ColumnElement):
+            raise TypeError(
+                'Keyset pagination supports only column expressions in ORDER '
+                'BY. Got %r.' % expr
+            )
+        columns.append((expr, descending))
+    return columns
+
+
+def _supports_row_values(query):
+    if query.session is None:
+        return False
+    bind = query.session.get_bind(query._mapper_zero())
+    return bind.dialect.name == 'postgresql'
+
+
+def get_seek_predicate(columns, values, row_values=False):
+    """
+    Return the keyset seek predicate for given ORDER BY columns (as returned
+    by :func:`get_order_by_columns`) and values of the last seen row.
+
+    If all the columns are sorted in the same direction and `row_values` is
+    True a row value comparison such as `(a, b) > (:a, :b)` is returned.
+    Otherwise the expanded form `a > :a OR (a = :a AND b > :b)` is used.
+
+    :param columns: sequence of `(expression, descending)` tuples
+    :param values: ORDER BY values of the last seen row
+    :param row_values: whether or not to use row value comparison
+    """
+    values = [
+        sa.bindparam(None, value, type_=expr.type)
+        for (expr, _), value in zip(columns, values)
+    ]
+    directions = set(descending for _, descending in columns)
+
+    if row_values and len(directions) == 1 and len(columns) > 1:
+        left = sa.tuple_(*(expr for expr, _ in columns))
+        right = sa.tuple_(*values)
+        return left < right if directions.pop() else left > right
+
+    criteria = []
+    for index, (expr, descending) in enumerate(columns):
+        criteria.append(sa.and_(*(
+            [
+                columns[i][0] == values[i]
+                for i in range(index)
+            ] +
+            [expr < values[index] if descending else expr > values[index]]
+        )))
+    return sa.or_(*criteria)
+
+
+def _paginate_keyset(query, per_page, values=None):
+    query = make_order_by_deterministic(query)
+    columns = get_order_by_columns(query)
+
+    if values is not None:
+        if len(values) != len(columns):
+            raise ValueError(
+                'Cursor does not match the ORDER BY of given query.'
+            )
+        query = query.filter(
+            get_seek_predicate(
+                columns,
+                values,
+                row_values=_supports_row_values(query)
+            )
+        )
+
+    entity_count = len(query.column_descriptions)
+    rows = (
+        query
+        .add_columns(*(
+            expr.label('keyset_%d' % index)
+            for index, (expr, _) in enumerate(columns)
+        ))
+        .limit(per_page + 1)
+        .all()
+    )
+    items = [
+        row[0] if entity_count == 1 else tuple(row[:entity_count])
+        for row in rows[:per_page]
+    ]
+    if len(rows) > per_page:
+        return items, list(rows[per_page - 1][entity_count:])
+    return items, None
+
+
+def paginate_keyset(query, per_page, after=None):
+    """
+    Return a page of given query using keyset (seek) pagination along with
+    an encoded cursor for the next page.
+
+    Unlike OFFSET based pagination, keyset pagination doesn't need to scan
+    the rows of the previous pages. Instead the next page is fetched with a
+    predicate such as `(a, b) > (:a, :b)` built from the ORDER BY of the
+    query and the values of the last row of the previous page.
+
+    The ORDER BY of given query is first made deterministic with
+    :func:`make_order_by_deterministic`. Mixed ascending and descending
+    orderings (for example produced by :func:`sort_query`) are supported.
+
+    ::
+
+        from sqlalchemy_utils import paginate_keyset, sort_query
+
+
+        query = sort_query(session.query(Article), '-created_at')
+
+        articles, cursor = paginate_keyset(query, 20)
+
+        # cursor is None if there are no more pages
+        articles, cursor = paginate_keyset(query, 20, after=cursor)
+
+
+    .. note::
+        The ORDER BY expressions should be non nullable columns or
+        expressions. Row value comparisons are used only on PostgreSQL.
+
+    .. versionadded: 0.31.0
+
+    .. seealso:: :func:`iter_keyset`
+
+    :param query: SQLAlchemy Query object
+    :param per_page: maximum number of items per page
+    :param after: cursor returned for the previous page
+    :return: tuple of page items and the cursor of the next page (or None)
+    """
+    values = decode_cursor(after) if after is not None else None
+    items, values = _paginate_keyset(query, per_page, values)
+    return items, encode_cursor(values) if values is not None else None
+
+
+def iter_keyset(query, per_page=1000):
+    """
+    Iterate through all the results of given query using keyset pagination.
+    This is useful for batch jobs that need to walk through whole tables
+    without holding long running cursors or using slow OFFSET queries.
+
+    ::
+
+        from sqlalchemy_utils import iter_keyset
+
+
+        for user in iter_keyset(session.query(User), per_page=5000):
+            process(user)
+
+
+    .. versionadded: 0.31.0
+
+    .. seealso:: :func:`paginate_keyset`
+
+    :param query: SQLAlchemy Query object
+    :param per_page: number of rows to fetch per query
+    """
+    values = None
+    while True:
+        items, values = _paginate_keyset(query, per_page, values)
+        for item in items:
+            yield item
+        if values is None:
+            break
@@ -1,9 +1,169 @@
 import inspect
+import re
+import threading
+import weakref
+from itertools import islice
 
 import six
 import sqlalchemy as sa
 
-from .mock import create_mock_engine
+from .mock import (
+    create_mock_engine,
+    get_base_compiler_class,
+    get_compiler_class,
+    LiteralValueRenderer
+)
+
+BIND_MARKER = '\x00'
+NEWLINES = re.compile(r'\n+')
+
+
+class TemplateRenderer(LiteralValueRenderer):
+    """
+    Compiler mixin that renders bound parameters as markers, which are later
+    replaced with the literal values of the parameters.
+    """
+    def bindparam_string(self, name, positional_names=None, **kw):
+        return BIND_MARKER + name + BIND_MARKER
+
+
+class StatementTemplate(object):
+    def __init__(self, compiled):
+        self.parts = NEWLINES.sub(
+            '\n', six.text_type(compiled)
+        ).strip('\n').strip().split(BIND_MARKER)
+        # Templates are cached weakly by statement, hence only the bound
+        # parameters and a statement-less compiler for rendering the literal
+        # values are kept instead of the compiled statement.
+        self.binds = dict(
+            (name, bindparam)
+            for bindparam, name in compiled.bind_names.items()
+        )
+        self.compiler = compiled.__class__(compiled.dialect, None)
+
+    def get_value(self, name, params):
+        bindparam = self.binds[name]
+        if bindparam.key in params:
+            return params[bindparam.key]
+        if name in params:
+            return params[name]
+        if bindparam.required:
+            raise sa.exc.InvalidRequestError(
+                'A value is required for bind parameter %r' % bindparam.key
+            )
+        return bindparam.effective_value
+
+    def render(self, params=None):
+        params = params or {}
+        parts = list(self.parts)
+        for index in range(1, len(parts), 2):
+            name = parts[index]
+            parts[index] = self.compiler.render_literal_value(
+                self.get_value(name, params),
+                self.binds[name].type
+            )
+        return ''.join(parts)
+
+
+class StatementRenderer(object):
+    """
+    Reusable renderer that renders SQL statements with their bound
+    parameters inline for given dialect.
+
+    The compiled form of each statement (or Query) object is cached as a
+    template in which only the parameter values need to be rendered. Hence
+    rendering the same statement object again, possibly with different
+    parameter values, skips the SQL compilation entirely. The templates are
+    cached by the identity of the statement objects and only as long as the
+    statement objects are alive, structurally identical but separately
+    built statements are compiled separately. Code that builds a new
+    statement for each rendering (for example an audit logger) does not
+    benefit from the cache; build the statement once with
+    :func:`~sqlalchemy.sql.expression.bindparam` placeholders and pass the
+    values with `params` instead.
+
+    ::
+
+        from sqlalchemy_utils.functions import get_statement_renderer
+
+
+        renderer = get_statement_renderer(engine.dialect)
+
+        statement = (
+            sa.select([user.c.name])
+            .where(user.c.id == sa.bindparam('id'))
+        )
+        renderer.render(statement, {'id': 3})
+        # SELECT user.name FROM user WHERE user.id = 3
+        renderer.render(statement, {'id': 4})
+        # SELECT user.name FROM user WHERE user.id = 4
+
+
+    .. versionadded: 0.31.0
+
+    :param dialect: SQLAlchemy Dialect object
+    """
+    def __init__(self, dialect):
+        self.dialect = dialect
+        self.templates = weakref.WeakKeyDictionary()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_template(self, statement):
+        """
+        Return the (cached) template of given statement or Query object.
+        """
+        with self.lock:
+            template = self.templates.get(statement)
+            if template is not None:
+                self.hits += 1
+                return template
+            self.misses += 1
+        sql = statement
+        if isinstance(sql, sa.orm.query.Query):
+            sql = sql.statement
+        Compiler = get_compiler_class(
+            get_base_compiler_class(self.dialect, sql),
+            TemplateRenderer
+        )
+        template = StatementTemplate(Compiler(self.dialect, sql))
+        with self.lock:
+            self.templates[statement] = template
+        return template
+
+    def render(self, statement, params=None):
+        """
+        Render given statement with its bound parameters inline.
+
+        :param statement: SQLAlchemy statement, Query object or DDL element
+        :param params:
+            optional dictionary of parameter values that override the values
+            of the bound parameters of the statement
+        """
+        if isinstance(statement, sa.schema.DDLElement):
+            Compiler = get_compiler_class(self.dialect.ddl_compiler)
+            compiled = Compiler(self.dialect, statement)
+            return NEWLINES.sub(
+                '\n', six.text_type(compiled)
+            ).strip('\n').strip()
+        return self.get_template(statement).render(params)
+
+
+_renderers = weakref.WeakKeyDictionary()
+
+
+def get_statement_renderer(dialect):
+    """
+    Return a shared :class:`StatementRenderer` object for given dialect.
+
+    :param dialect: SQLAlchemy Dialect object
+    """
+    try:
+        return _renderers[dialect]
+    except KeyError:
+        renderer = _renderers[dialect] = StatementRenderer(dialect)
+        return renderer
 
 
 def render_expression(expression, bind, stream=None):
@@ -45,28 +205,116 @@ def render_expression(expression, bind, stream=None):
     return stream
 
 
-def render_statement(statement, bind=None):
+def render_statement(statement, bind=None, params=None):
     """
     Generate an SQL expression string with bound parameters rendered inline
     for the given SQLAlchemy statement.
 
+    The statements are rendered with a shared :class:`StatementRenderer` of
+    the dialect of the bind, which caches the compiled form of each statement
+    or Query object while the object is alive. Hence rendering the same
+    object again (for example with different params) skips the compilation.
+
+    .. versionchanged: 0.31.0
+        Added params parameter
+
     :param statement: SQLAlchemy Query object.
     :param bind:
         Optional SQLAlchemy bind, if None uses the bind of the given query
         object.
+    :param params:
+        Optional dictionary of parameter values that override the values of
+        the bound parameters of the statement.
     """
 
     if isinstance(statement, sa.orm.query.Query):
         if bind is None:
             bind = statement.session.get_bind(statement._mapper_zero())
 
-        statement = statement.statement
-
     elif bind is None:
         bind = statement.bind
 
-    stream = six.moves.cStringIO()
-    engine = create_mock_engine(bind.engine, stream=stream)
-    engine.execute(statement)
+    renderer = get_statement_renderer(bind.dialect)
+    return '\n%s;' % renderer.render(statement, params)
+
 
-    return stream.getvalue()
+def _get_bulk_insert(table, keys, size):
+    return table.insert().values([
+        dict(
+            (key, sa.bindparam(
+                'p%d_%d' % (index, position),
+                type_=table.c[key].type
+            ))
+            for position, key in enumerate(keys)
+        )
+        for index in range(size)
+    ])
+
+
+def render_bulk_insert(table, rows, batch=1000, bind=None):
+    """
+    Render multi-row INSERT statements (`INSERT INTO ... VALUES (...),
+    (...)`) for given rows with the values rendered inline. The statements
+    are generated lazily `batch` rows at a time, hence this can be used for
+    writing large offline data migration scripts without holding all the
+    rows or SQL in memory.
+
+    All the batches (except possibly the last one) share the same compiled
+    statement template, so only the values are rendered for each batch.
+
+    ::
+
+        from sqlalchemy_utils import render_bulk_insert
+        from sqlalchemy_utils.functions import open_dump
+
+
+        rows = ({'id': id, 'name': u'user %d' % id} for id in range(100000))
+
+        with open_dump('users.sql.gz') as stream:
+            stream.writelines(
+                render_bulk_insert(user_table, rows, bind=engine)
+            )
+
+
+    .. versionadded: 0.31.0
+
+    :param table: SQLAlchemy Table object
+    :param rows:
+        Iterable of dictionaries of column keys and values. The columns are
+        determined from the first row and all the rows must have the same
+        keys.
+    :param batch: maximum number of rows per INSERT statement
+    :param bind:
+        Optional SQLAlchemy engine or connection, if None uses the bind of
+        given table.
+    """
+    if batch < 1:
+        raise ValueError('Batch size must be a positive integer.')
+    if bind is None:
+        bind = table.bind
+    if bind is None:
+        raise ValueError(
+            'Table %r is not bound to an engine, bind must be given.' %
+            table.name
+        )
+    renderer = get_statement_renderer(bind.dialect)
+    rows = iter(rows)
+    keys = None
+    statement = None
+    while True:
+        chunk = list(islice(rows, batch))
+        if not chunk:
+            break
+        if keys is None:
+            keys = [column.key for column in table.c if column.key in chunk[0]]
+            statement = _get_bulk_insert(table, keys, batch)
+        params = dict(
+            ('p%d_%d' % (index, position), row[key])
+            for index, row in enumerate(chunk)
+            for position, key in enumerate(keys)
+        )
+        yield '\n%s;' % renderer.render(
+            statement if len(chunk) == batch
+            else _get_bulk_insert(table, keys, len(chunk)),
+            params
+        )
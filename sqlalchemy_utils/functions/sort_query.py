@@ -1,23 +1,127 @@
 import sqlalchemy as sa
-from sqlalchemy.sql.expression import asc, desc
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.expression import asc, desc, UnaryExpression
 
-from .database import has_unique_index
+from .cache import LRUCache
+from .database import has_index, has_unique_index
 from .orm import get_query_descriptor, get_tables
 
+#: Module level cache of resolved sort arguments shared by all QuerySorter
+#: objects, see :meth:`QuerySorter.resolve_sort_arg`.
+sort_cache = LRUCache(maxsize=1000)
+
+
+def clear_sort_cache(*args):
+    sort_cache.clear()
+
+
+sa.event.listen(sa.orm.mapper, 'instrument_class', clear_sort_cache)
+sa.event.listen(sa.orm.mapper, 'mapper_configured', clear_sort_cache)
+
 
 class QuerySorterException(Exception):
     pass
 
 
+def get_table_column(expr):
+    """
+    Return the Table column given ORDER BY expression refers to or None if
+    given expression is not a plain column expression (for example a function
+    call or an aggregate label).
+
+    :param expr: SQLAlchemy ColumnElement or InstrumentedAttribute
+    """
+    if hasattr(expr, '__clause_element__'):
+        expr = expr.__clause_element__()
+    for column in getattr(expr, 'base_columns', ()):
+        if (
+            isinstance(column, sa.Column) and
+            isinstance(column.table, sa.Table)
+        ):
+            return column
+
+
+def get_order_by_columns(query):
+    """
+    Return a list of (Table column, direction function) tuples for the ORDER
+    BY clause of given query. The column is None for expressions that are not
+    plain column expressions.
+
+    :param query: SQLAlchemy Query object
+    """
+    order_by = []
+    for clause in query._order_by or ():
+        func = asc
+        if isinstance(clause, UnaryExpression):
+            if clause.modifier is operators.desc_op:
+                func = desc
+                clause = clause.element
+            elif clause.modifier is operators.asc_op:
+                clause = clause.element
+        order_by.append((get_table_column(clause), func))
+    return order_by
+
+
+def get_query_signature(query):
+    """
+    Return a hashable signature of the entities (and joined entities) of given
+    query. Queries with equal signatures resolve sort arguments to the same
+    expressions.
+
+    :param query: SQLAlchemy Query object
+    """
+    return (
+        tuple(entity.expr for entity in query._entities) +
+        tuple(query._join_entities)
+    )
+
+
 class QuerySorter(object):
-    def __init__(self, silent=True, separator='-'):
+    def __init__(
+        self,
+        silent=True,
+        separator='-',
+        require_index=False,
+        on_unindexed=None,
+        cache=sort_cache
+    ):
         self.separator = separator
         self.silent = silent
+        self.require_index = require_index
+        self.on_unindexed = on_unindexed
+        self.cache = cache
+
+    def is_indexed(self, columns, directions):
+        """
+        Return whether or not an ORDER BY of given columns in given directions
+        is served by an index. The columns must form an index prefix and they
+        must be sorted in the same direction, since a (forward or backward)
+        index scan can not serve mixed directions. The index lookups use the
+        per table catalogs of
+        :func:`~sqlalchemy_utils.functions.index_catalog.get_index_catalog`.
+        """
+        if any(column is None for column in columns):
+            return False
+        if len(set(directions)) > 1:
+            return False
+        try:
+            return has_index(columns)
+        except TypeError:
+            return False
 
     def assign_order_by(self, entity, attr, func):
         expr = get_query_descriptor(self.query, entity, attr)
+        return self.apply_order_by(attr, expr, func)
 
+    def apply_order_by(self, attr, expr, func):
         if expr is not None:
+            if self.require_index:
+                columns = self.columns + [get_table_column(expr)]
+                directions = self.directions + [func]
+                if not self.is_indexed(columns, directions):
+                    return self.handle_unindexed(expr, attr, func)
+                self.columns = columns
+                self.directions = directions
             return self.query.order_by(func(expr))
         if not self.silent:
             raise QuerySorterException(
@@ -25,6 +129,20 @@ class QuerySorter(object):
             )
         return self.query
 
+    def handle_unindexed(self, expr, attr, func):
+        if self.on_unindexed is not None:
+            query = self.on_unindexed(self.query, expr, func)
+            order_by = get_order_by_columns(query)
+            self.columns = [column for column, _ in order_by]
+            self.directions = [direction for _, direction in order_by]
+            return query
+        if not self.silent:
+            raise QuerySorterException(
+                "Could not sort query with expression '%s' since it is not "
+                "served by an index" % attr
+            )
+        return self.query
+
     def parse_sort_arg(self, arg):
         if arg[0] == self.separator:
             func = desc
@@ -39,15 +157,43 @@ class QuerySorter(object):
             'func': func
         }
 
+    def resolve_sort_arg(self, arg):
+        """
+        Return a tuple of attribute name, resolved sort expression (or None
+        if given sort argument could not be resolved) and the direction
+        function for given sort argument.
+
+        The resolved values are cached by the entity signature of the query
+        (see :func:`get_query_signature`) and the sort argument, hence
+        repeated sorts of similar queries skip the descriptor lookup.
+        """
+        if self.cache is None:
+            key = None
+        else:
+            key = (get_query_signature(self.query), self.separator, arg)
+            resolved = self.cache.get(key)
+            if resolved is not None:
+                return resolved
+
+        parsed = self.parse_sort_arg(arg)
+        resolved = (
+            parsed['attr'],
+            get_query_descriptor(self.query, parsed['entity'], parsed['attr']),
+            parsed['func']
+        )
+        if key is not None:
+            self.cache.set(key, resolved)
+        return resolved
+
     def __call__(self, query, *args):
         self.query = query
+        self.columns = []
+        self.directions = []
 
         for sort in args:
             if not sort:
                 continue
-            self.query = self.assign_order_by(
-                **self.parse_sort_arg(sort)
-            )
+            self.query = self.apply_order_by(*self.resolve_sort_arg(sort))
         return self.query
 
 
@@ -122,6 +268,24 @@ def sort_query(query, *args, **kwargs):
         query = session.query(Article).join(Article.category)
         query = sort_query(query, 'category-name')
 
+    5. Allowing only sorts that can be served by an index
+    ::
+
+
+        query = session.query(Article)
+        query = sort_query(query, 'name', require_index=True)
+
+        # Article.name has no index, hence the query is left unsorted.
+        # Use silent=False to raise an exception instead or on_unindexed
+        # to decide what to do with the sort argument.
+
+        def sort_by_id(query, expr, func):
+            return query.order_by(func(Article.id))
+
+        query = sort_query(
+            query, 'name', require_index=True, on_unindexed=sort_by_id
+        )
+
 
     :param query:
         query to be modified
@@ -131,6 +295,30 @@ def sort_query(query, *args, **kwargs):
         Whether or not to raise exceptions if unknown sort column
         is passed. By default this is `True` indicating that no errors should
         be raised for unknown columns.
+    :param require_index:
+        Whether or not to allow only sort arguments that can be served by an
+        index. When `True` each sort argument must resolve to a Table column
+        that, together with the columns of the preceding sort arguments, forms
+        a prefix of an index or primary key (see :func:`has_index`). Unindexed
+        sort arguments are skipped, or an exception is raised if `silent` is
+        `False`. All the sort arguments must use the same direction, since
+        mixed directions can not be served by an index scan.
+    :param on_unindexed:
+        Optional callable that is called for unindexed sort arguments when
+        `require_index` is `True`. The callable receives the query, the
+        resolved sort expression and the direction function (`asc` or `desc`)
+        and returns the query to use, making it possible to downgrade
+        unindexed sorts instead of rejecting them. The ORDER BY of the
+        returned query is used for checking the following sort arguments.
+
+    :param cache:
+        :class:`~sqlalchemy_utils.functions.cache.LRUCache` object used for
+        caching resolved sort arguments. By default a module level cache that
+        holds at most 1000 resolved sort arguments is used. Use `None` to
+        disable caching.
+
+    .. versionchanged: 0.31.0
+        Added `require_index`, `on_unindexed` and `cache` parameters
     """
     return QuerySorter(**kwargs)(query, *args)
 
@@ -1,6 +1,18 @@
+import collections
+import json
+import logging
+import random
+import re
+import threading
+import time
+
+import six
 import sqlalchemy as sa
 
 from .exceptions import ImproperlyConfigured
+from .functions.database import QueryAnalysis
+
+logger = logging.getLogger(__name__)
 
 
 def coercion_listener(mapper, class_):
@@ -253,3 +265,209 @@ def auto_delete_orphans(attr):
                 )
                 .delete(synchronize_session=False)
             )
+
+
+EXPLAINABLE_STATEMENT = re.compile(
+    r'^\s*(SELECT|INSERT|UPDATE|DELETE|WITH|VALUES)\b',
+    re.IGNORECASE
+)
+
+
+class SlowQueryExplainer(object):
+    """
+    Engine level listener that EXPLAINs sampled slow statements. See
+    :func:`install_slow_query_explainer`.
+    """
+    savepoint_name = 'sqlalchemy_utils_explain'
+
+    def __init__(
+        self,
+        engine,
+        threshold_ms,
+        sample_rate,
+        sink,
+        max_explains=10,
+        period=60
+    ):
+        if engine.dialect.name != 'postgresql':
+            raise ImproperlyConfigured(
+                'Slow query explainer supports only PostgreSQL engines.'
+            )
+        self.engine = engine
+        self.threshold_ms = threshold_ms
+        self.sample_rate = sample_rate
+        self.sink = sink
+        self.max_explains = max_explains
+        self.period = period
+        self.explained_at = collections.deque()
+        self.lock = threading.Lock()
+
+    def install(self):
+        sa.event.listen(
+            self.engine, 'before_cursor_execute', self.before_cursor_execute
+        )
+        sa.event.listen(
+            self.engine, 'after_cursor_execute', self.after_cursor_execute
+        )
+
+    def remove(self):
+        """
+        Remove the event listeners of this explainer from the engine.
+        """
+        sa.event.remove(
+            self.engine, 'before_cursor_execute', self.before_cursor_execute
+        )
+        sa.event.remove(
+            self.engine, 'after_cursor_execute', self.after_cursor_execute
+        )
+
+    def before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        # The start time is stored on the execution context, hence failing
+        # statements can't leave stale start times behind.
+        context._slow_query_start_time = time.time()
+
+    def after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        start_time = getattr(context, '_slow_query_start_time', None)
+        if start_time is None:
+            return
+        duration = (time.time() - start_time) * 1000
+        if (
+            duration >= self.threshold_ms and
+            not executemany and
+            EXPLAINABLE_STATEMENT.match(statement) and
+            random.random() < self.sample_rate and
+            self.acquire()
+        ):
+            analysis = self.explain(conn, statement, parameters)
+            if analysis is not None:
+                try:
+                    self.sink(statement, parameters, duration, analysis)
+                except Exception:
+                    logger.exception('Slow query explainer sink failed.')
+
+    def acquire(self):
+        """
+        Return whether or not a new statement can be explained without
+        exceeding `max_explains` explains per `period` seconds.
+        """
+        now = time.time()
+        with self.lock:
+            expired = now - self.period
+            while self.explained_at and self.explained_at[0] <= expired:
+                self.explained_at.popleft()
+            if len(self.explained_at) >= self.max_explains:
+                return False
+            self.explained_at.append(now)
+            return True
+
+    def explain(self, conn, statement, parameters):
+        """
+        Run plain EXPLAIN for given statement using the DBAPI connection of
+        given connection and return a :class:`QueryAnalysis` object or None
+        if the statement could not be explained. The EXPLAIN is run inside a
+        savepoint so that a failing EXPLAIN never aborts the transaction the
+        statement belongs to.
+        """
+        dbapi_connection = conn.connection
+        use_savepoint = not getattr(dbapi_connection, 'autocommit', False)
+        cursor = dbapi_connection.cursor()
+        try:
+            if use_savepoint:
+                cursor.execute('SAVEPOINT %s' % self.savepoint_name)
+            try:
+                cursor.execute(
+                    'EXPLAIN (FORMAT JSON) ' + statement,
+                    parameters
+                )
+                result = cursor.fetchone()[0]
+            except Exception:
+                if use_savepoint:
+                    cursor.execute(
+                        'ROLLBACK TO SAVEPOINT %s' % self.savepoint_name
+                    )
+                return None
+            if use_savepoint:
+                cursor.execute('RELEASE SAVEPOINT %s' % self.savepoint_name)
+        finally:
+            cursor.close()
+        if isinstance(result, six.string_types):
+            result = json.loads(result)
+        return QueryAnalysis(result)
+
+
+def install_slow_query_explainer(
+    engine,
+    threshold_ms,
+    sample_rate,
+    sink,
+    max_explains=10,
+    period=60
+):
+    """
+    Time all statements executed with given engine and capture the query
+    plans of sampled slow statements. This is a client side alternative to
+    the auto_explain module of PostgreSQL, useful for example in staging
+    environments.
+
+    Statements that take at least `threshold_ms` milliseconds are sampled
+    with given `sample_rate` and EXPLAINed using the same connection. Only
+    plain EXPLAIN is used (never EXPLAIN ANALYZE), hence data modifying
+    statements are never executed twice. The EXPLAINs are rate limited to
+    `max_explains` per `period` seconds.
+
+    The sink is called with the statement, its parameters, the duration of
+    the statement in milliseconds and a :class:`QueryAnalysis` object of the
+    plan. Note that the runtime and actual row counts of the analysis are
+    None since the statement is not re-executed. Exceptions raised by the sink
+    are logged and never propagate to the statement being executed.
+
+    ::
+
+        from sqlalchemy_utils import install_slow_query_explainer
+
+
+        def log_plan(statement, parameters, duration, analysis):
+            logger.warning(
+                'Slow query (%.1f ms): %s %r',
+                duration,
+                statement,
+                analysis.node_types
+            )
+
+
+        explainer = install_slow_query_explainer(
+            engine,
+            threshold_ms=500,
+            sample_rate=0.1,
+            sink=log_plan
+        )
+
+        ...
+
+        explainer.remove()
+
+
+    .. versionadded: 0.31.0
+
+    :param engine: SQLAlchemy Engine object (PostgreSQL only)
+    :param threshold_ms: minimum duration of explained statements
+    :param sample_rate: probability of explaining a slow statement
+    :param sink: callable that receives the captured plans
+    :param max_explains: maximum number of EXPLAINs per period
+    :param period: length of the rate limiting period in seconds
+    :return: :class:`SlowQueryExplainer` object
+    """
+    explainer = SlowQueryExplainer(
+        engine,
+        threshold_ms,
+        sample_rate,
+        sink,
+        max_explains=max_explains,
+        period=period
+    )
+    explainer.install()
+    return explainer
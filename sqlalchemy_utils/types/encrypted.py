@@ -1,11 +1,22 @@
 # -*- coding: utf-8 -*-
 import base64
 import datetime
+import hashlib
+import hmac
+import multiprocessing
+import os
+from itertools import islice
 
 import six
+import sqlalchemy as sa
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.query import _MapperEntity
+from sqlalchemy.sql import operators
 from sqlalchemy.types import Binary, String, TypeDecorator
 
 from sqlalchemy_utils.exceptions import ImproperlyConfigured
+from sqlalchemy_utils.functions.cache import LRUCache
+from sqlalchemy_utils.functions.pagination import get_seek_predicate
 
 from .scalar_coercible import ScalarCoercible
 
@@ -21,6 +32,17 @@ try:
 except ImportError:
     pass
 
+AESGCM = None
+try:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+except ImportError:
+    pass
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
 
 class EncryptionDecryptionBaseEngine(object):
     """A base encryption and decryption engine.
@@ -29,6 +51,9 @@ class EncryptionDecryptionBaseEngine(object):
     new engines.
     """
 
+    #: Whether or not decrypting with a wrong key is guaranteed to fail.
+    authenticated = False
+
     def _update_key(self, key):
         if isinstance(key, six.string_types):
             key = key.encode()
@@ -36,8 +61,16 @@ class EncryptionDecryptionBaseEngine(object):
         digest.update(key)
         engine_key = digest.finalize()
 
+        self.key_id = hashlib.sha256(engine_key).digest()[:4]
         self._initialize_engine(engine_key)
 
+    def get_key_id(self, value):
+        """
+        Return the id of the key given encrypted value was encrypted with or
+        None if the format of the value does not contain key ids.
+        """
+        return None
+
     def encrypt(self, value):
         raise NotImplementedError('Subclasses must implement this!')
 
@@ -94,6 +127,8 @@ class AesEngine(EncryptionDecryptionBaseEngine):
 class FernetEngine(EncryptionDecryptionBaseEngine):
     """Provide Fernet encryption and decryption methods."""
 
+    authenticated = True
+
     def _initialize_engine(self, parent_class_key):
         self.secret_key = base64.urlsafe_b64encode(parent_class_key)
         self.fernet = Fernet(self.secret_key)
@@ -116,6 +151,83 @@ class FernetEngine(EncryptionDecryptionBaseEngine):
         return decrypted
 
 
+class AesGcmEngine(EncryptionDecryptionBaseEngine):
+    """
+    Provide AES-GCM authenticated encryption and decryption methods.
+
+    Unlike :class:`AesEngine` and :class:`FernetEngine` the encrypted values
+    are stored as raw bytes (without base64 encoding) in the following
+    format::
+
+        header (1 byte) || key id (4 bytes) || nonce (12 bytes) ||
+        ciphertext || tag (16 bytes)
+
+    The header byte contains the format version, which allows different
+    formats to coexist in the same column. The key id identifies the key
+    the value was encrypted with (see :func:`rotate_encrypted_column`). A
+    random nonce is used for each value, hence encrypting the same value
+    twice gives different results.
+
+    Values in the original format without the key id (version 1) are still
+    decrypted.
+
+    .. versionadded: 0.31.0
+    """
+
+    authenticated = True
+    VERSION = 2
+    NONCE_SIZE = 12
+    TAG_SIZE = 16
+    KEY_ID_SIZE = 4
+    HEADER_SIZES = {
+        six.int2byte(1): 1,
+        six.int2byte(2): 1 + KEY_ID_SIZE
+    }
+
+    def _initialize_engine(self, parent_class_key):
+        if AESGCM is None:
+            raise ImproperlyConfigured(
+                "'cryptography>=2.0' is required to use AesGcmEngine"
+            )
+        self.secret_key = parent_class_key
+        self.aesgcm = AESGCM(self.secret_key)
+        self.header = six.int2byte(self.VERSION) + self.key_id
+
+    def encrypt(self, value):
+        if not isinstance(value, six.string_types):
+            value = repr(value)
+        if isinstance(value, six.text_type):
+            value = value.encode('utf-8')
+        nonce = os.urandom(self.NONCE_SIZE)
+        return (
+            self.header + nonce + self.aesgcm.encrypt(nonce, value, None)
+        )
+
+    def get_key_id(self, value):
+        value = bytes(value)
+        if value[:1] == six.int2byte(2):
+            return value[1:1 + self.KEY_ID_SIZE]
+
+    def decrypt(self, value):
+        value = bytes(value)
+        try:
+            header_size = self.HEADER_SIZES[value[:1]]
+        except KeyError:
+            raise ValueError(
+                'Unknown encrypted value format %r.' % value[:1]
+            )
+        if len(value) < header_size + self.NONCE_SIZE + self.TAG_SIZE:
+            raise ValueError('Encrypted value is too short.')
+        key_id = self.get_key_id(value)
+        if key_id is not None and key_id != self.key_id:
+            raise ValueError('Value was encrypted with a different key.')
+        nonce = value[header_size:header_size + self.NONCE_SIZE]
+        decrypted = self.aesgcm.decrypt(
+            nonce, value[header_size + self.NONCE_SIZE:], None
+        )
+        return decrypted.decode('utf-8')
+
+
 class EncryptedType(TypeDecorator, ScalarCoercible):
     """
     EncryptedType provides a way to encrypt and decrypt values,
@@ -198,11 +310,76 @@ class EncryptedType(TypeDecorator, ScalarCoercible):
             username = sa.Column(EncryptedType(
                 sa.Unicode, get_key))
 
+    The encryption engine can be chosen with the engine parameter.
+    :class:`AesEngine` is used by default. :class:`AesGcmEngine` stores the
+    values as raw bytes with authenticated encryption and random nonces and
+    is recommended for new columns.
+
+    ::
+
+        from sqlalchemy_utils.types.encrypted import AesGcmEngine
+
+
+        class User(Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            username = sa.Column(EncryptedType(
+                sa.Unicode, secret_key, AesGcmEngine))
+
+    Deriving the encryption key and building the cipher objects is done only
+    once per key: the initialized engine of each key is cached, per-row
+    dynamic keys use a bounded LRU cache of `key_cache_size` engines.
+
+    The key (or the return value of the key callable) can also be a keyring,
+    a list of keys in which the first key is used for encryption and all the
+    keys are accepted for decryption. Keyrings are supported only by the
+    authenticated engines (:class:`FernetEngine` and
+    :class:`AesGcmEngine`). This allows rotating the key of a
+    column without downtime, see :func:`rotate_encrypted_column`.
+
+    ::
+
+        class User(Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            username = sa.Column(EncryptedType(
+                sa.Unicode, [new_key, old_key], AesGcmEngine))
+
+    Equality lookups are possible with a :class:`BlindIndexType` companion
+    column. If the table has one for the encrypted column, `==` and `!=`
+    comparisons of the encrypted column are done against the blind index.
+
+    .. versionchanged: 0.31.0
+        Added key_cache_size parameter, caching of initialized engines and
+        support for keyrings and blind indexes
+
     """
 
     impl = Binary
 
-    def __init__(self, type_in=None, key=None, engine=None, **kwargs):
+    class Comparator(TypeDecorator.Comparator):
+        def operate(self, op, *other, **kwargs):
+            if (
+                op in (operators.eq, operators.ne) and
+                not isinstance(other[0], sa.sql.ClauseElement)
+            ):
+                column = get_blind_index_column(self.expr)
+                if column is not None:
+                    return op(column, column.type.digest(other[0]), **kwargs)
+            return super(EncryptedType.Comparator, self).operate(
+                op, *other, **kwargs
+            )
+
+    comparator_factory = Comparator
+
+    def __init__(
+        self,
+        type_in=None,
+        key=None,
+        engine=None,
+        key_cache_size=32,
+        **kwargs
+    ):
         """Initialization."""
         if not cryptography:
             raise ImproperlyConfigured(
@@ -218,7 +395,10 @@ class EncryptedType(TypeDecorator, ScalarCoercible):
         self._key = key
         if not engine:
             engine = AesEngine
+        self.engine_class = engine
         self.engine = engine()
+        self._engines = LRUCache(maxsize=key_cache_size)
+        self._current = (None, None)
 
     @property
     def key(self):
@@ -228,14 +408,49 @@ class EncryptedType(TypeDecorator, ScalarCoercible):
     def key(self, value):
         self._key = value
 
-    def _update_key(self):
+    def _get_engine(self, key):
+        """
+        Return the engine initialized with given key, creating and caching a
+        new engine if needed.
+        """
+        if isinstance(key, six.text_type):
+            key = key.encode('utf-8')
+        engine = self._engines.get(key)
+        if engine is None:
+            engine = self.engine_class()
+            engine._update_key(key)
+            self._engines.set(key, engine)
+        return engine
+
+    def _get_engines(self):
+        """
+        Return the list of engines for the current key or keyring. The first
+        engine is used for encryption.
+        """
         key = self._key() if callable(self._key) else self._key
-        self.engine._update_key(key)
+        if isinstance(key, list):
+            key = tuple(key)
+        current_key, engines = self._current
+        if engines is None or key != current_key:
+            keys = key if isinstance(key, tuple) else (key, )
+            if len(keys) > 1 and not self.engine_class.authenticated:
+                raise ImproperlyConfigured(
+                    'Keyrings require an authenticated encryption engine, '
+                    '%s can not detect values encrypted with a wrong key.' %
+                    self.engine_class.__name__
+                )
+            engines = [self._get_engine(item) for item in keys]
+            self._current = (key, engines)
+            self.engine = engines[0]
+        return engines
+
+    def _update_key(self):
+        return self._get_engines()[0]
 
     def process_bind_param(self, value, dialect):
         """Encrypt a value on the way in."""
         if value is not None:
-            self._update_key()
+            engine = self._update_key()
 
             try:
                 value = self.underlying_type.process_bind_param(
@@ -253,47 +468,549 @@ class EncryptedType(TypeDecorator, ScalarCoercible):
                 elif issubclass(type_, (datetime.date, datetime.time)):
                     value = value.isoformat()
 
-            return self.engine.encrypt(value)
+            return engine.encrypt(value)
 
     def process_result_value(self, value, dialect):
         """Decrypt value on the way out."""
         if value is not None:
-            self._update_key()
-            decrypted_value = self.engine.decrypt(value)
-
-            try:
-                return self.underlying_type.process_result_value(
-                    decrypted_value, dialect
+            return self._decrypt(self._get_engines(), value, dialect)
+
+    def process_result_values(self, values, dialect, executor=None,
+                              chunk_size=100):
+        """
+        Decrypt given sequence of stored values in bulk and return a list of
+        decrypted values.
+
+        If an executor (for example a `ThreadPoolExecutor`) is given the
+        values are decrypted in chunks of `chunk_size` values in parallel.
+        The key is resolved only once in the calling thread, hence dynamic
+        keys work as with :meth:`process_result_value`.
+
+        .. versionadded: 0.31.0
+
+        :param values: sequence of encrypted values (or None values)
+        :param dialect: SQLAlchemy Dialect object
+        :param executor: optional `concurrent.futures` executor
+        :param chunk_size: number of values per executor task
+        """
+        engines = self._get_engines()
+
+        def decrypt(chunk):
+            return [
+                None if value is None else self._decrypt(
+                    engines, value, dialect
                 )
+                for value in chunk
+            ]
+
+        if executor is None:
+            return decrypt(values)
+        values = list(values)
+        decrypted = []
+        for chunk in executor.map(decrypt, [
+            values[index:index + chunk_size]
+            for index in range(0, len(values), chunk_size)
+        ]):
+            decrypted.extend(chunk)
+        return decrypted
 
-            except AttributeError:
-                # Doesn't have 'process_result_value'
+    def _decrypt(self, engines, value, dialect):
+        decrypted_value = decrypt_with_keyring(engines, value)
 
-                # Handle 'boolean' and 'dates'
-                type_ = self.underlying_type.python_type
-                if issubclass(type_, bool):
-                    return decrypted_value == 'true'
+        try:
+            return self.underlying_type.process_result_value(
+                decrypted_value, dialect
+            )
 
-                elif issubclass(type_, datetime.datetime):
-                    return datetime.datetime.strptime(
-                        decrypted_value, '%Y-%m-%dT%H:%M:%S'
-                    )
+        except AttributeError:
+            # Doesn't have 'process_result_value'
 
-                elif issubclass(type_, datetime.time):
-                    return datetime.datetime.strptime(
-                        decrypted_value, '%H:%M:%S'
-                    ).time()
+            # Handle 'boolean' and 'dates'
+            type_ = self.underlying_type.python_type
+            if issubclass(type_, bool):
+                return decrypted_value == 'true'
 
-                elif issubclass(type_, datetime.date):
-                    return datetime.datetime.strptime(
-                        decrypted_value, '%Y-%m-%d'
-                    ).date()
+            elif issubclass(type_, datetime.datetime):
+                return datetime.datetime.strptime(
+                    decrypted_value, '%Y-%m-%dT%H:%M:%S'
+                )
+
+            elif issubclass(type_, datetime.time):
+                return datetime.datetime.strptime(
+                    decrypted_value, '%H:%M:%S'
+                ).time()
+
+            elif issubclass(type_, datetime.date):
+                return datetime.datetime.strptime(
+                    decrypted_value, '%Y-%m-%d'
+                ).date()
 
-                # Handle all others
-                return self.underlying_type.python_type(decrypted_value)
+            # Handle all others
+            return self.underlying_type.python_type(decrypted_value)
 
     def _coerce(self, value):
         if isinstance(self.underlying_type, ScalarCoercible):
             return self.underlying_type._coerce(value)
 
         return value
+
+
+class BlindIndexType(TypeDecorator):
+    """
+    BlindIndexType stores a keyed HMAC-SHA256 "blind index" of the value of
+    an :class:`EncryptedType` column, which allows equality lookups without
+    decrypting the column and without using deterministic encryption.
+
+    The blind index column is updated automatically whenever the source
+    attribute is set and equality comparisons of the encrypted column are
+    turned into (indexed) lookups of the blind index column::
+
+
+        from sqlalchemy_utils import BlindIndexType, EncryptedType
+        from sqlalchemy_utils.types.encrypted import AesGcmEngine
+
+
+        class User(Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            email = sa.Column(EncryptedType(
+                sa.Unicode, secret_key, AesGcmEngine))
+            email_index = sa.Column(
+                BlindIndexType(
+                    index_key, 'email', normalize=six.text_type.lower
+                ),
+                index=True
+            )
+
+
+        user = User(email=u'John@example.com')
+
+        session.query(User).filter(User.email == u'john@example.com')
+        # WHERE user.email_index = :param_1
+
+
+    The key of the blind index should be different from the encryption key.
+    The blind index attribute holds the HMAC digest as soon as the source
+    attribute is set, hence no second plain copy of the value is kept.
+
+    Bulk updates with :meth:`~sqlalchemy.orm.query.Query.update` bypass the
+    attribute events, hence they have to update the blind index explicitly::
+
+
+        index_type = User.__table__.c.email_index.type
+        session.query(User).filter(User.id == 1).update({
+            User.email: email,
+            User.email_index: index_type.digest(email)
+        })
+
+    .. versionadded: 0.31.0
+
+    :param key: HMAC key
+    :param source: name of the EncryptedType column
+    :param normalize:
+        Optional callable applied to the values before hashing, for example
+        for case insensitive lookups.
+    """
+
+    impl = Binary
+
+    def __init__(self, key, source, normalize=None, **kwargs):
+        if not cryptography:
+            raise ImproperlyConfigured(
+                "'cryptography' is required to use BlindIndexType"
+            )
+        super(BlindIndexType, self).__init__(length=32, **kwargs)
+        if isinstance(key, six.text_type):
+            key = key.encode('utf-8')
+        self.key = key
+        self.source = source
+        self.normalize = normalize
+
+    def digest(self, value):
+        """
+        Return the HMAC digest of given plain value or None if the value is
+        None.
+        """
+        if value is None:
+            return None
+        if self.normalize is not None:
+            value = self.normalize(value)
+        if not isinstance(value, six.binary_type):
+            value = six.text_type(value).encode('utf-8')
+        return hmac.new(self.key, value, hashlib.sha256).digest()
+
+
+def get_blind_index_column(column):
+    """
+    Return the :class:`BlindIndexType` column of given encrypted column or
+    None if the table of the column does not have one.
+
+    :param column: SQLAlchemy Column object
+    """
+    table = getattr(column, 'table', None)
+    if table is None:
+        return None
+    for index_column in table.c:
+        type_ = index_column.type
+        if (
+            isinstance(type_, BlindIndexType) and
+            type_.source == column.name
+        ):
+            return index_column
+
+
+def blind_index_listener(mapper, class_):
+    """
+    Make the source attributes of the :class:`BlindIndexType` columns of
+    given mapper set the digests of their values to the blind index
+    attributes.
+    """
+    for column in mapper.columns:
+        if not isinstance(column.type, BlindIndexType):
+            continue
+        source = column.table.c[column.type.source]
+        source_key = mapper.get_property_by_column(source).key
+        index_key = mapper.get_property_by_column(column).key
+
+        def listener(
+            target,
+            value,
+            oldvalue,
+            initiator,
+            key=index_key,
+            type_=column.type
+        ):
+            setattr(target, key, type_.digest(value))
+
+        sa.event.listen(getattr(class_, source_key), 'set', listener)
+
+
+sa.event.listen(sa.orm.mapper, 'mapper_configured', blind_index_listener)
+
+
+def decrypt_with_keyring(engines, value):
+    """
+    Decrypt given value with the engine of the key it was encrypted with.
+    If the format of the value contains the key id the matching engine is
+    used directly, otherwise the engines are tried in order. The latter
+    requires authenticated engines, since decrypting with a wrong key must
+    fail instead of returning garbage.
+
+    :param engines: list of initialized engines
+    :param value: encrypted value
+    """
+    if len(engines) == 1:
+        return engines[0].decrypt(value)
+    key_id = engines[0].get_key_id(value)
+    if key_id is not None:
+        for engine in engines:
+            if engine.key_id == key_id:
+                return engine.decrypt(value)
+        raise ValueError('No key in the keyring matches the key id.')
+    if not all(engine.authenticated for engine in engines):
+        raise ImproperlyConfigured(
+            'Keyrings require authenticated encryption engines.'
+        )
+    for engine in engines[:-1]:
+        try:
+            return engine.decrypt(value)
+        except Exception:
+            pass
+    return engines[-1].decrypt(value)
+
+
+def _get_raw_statement(statement):
+    columns = []
+    encrypted = []
+    for index, column in enumerate(statement._raw_columns):
+        type_ = getattr(column, 'type', None)
+        if isinstance(type_, EncryptedType):
+            column = sa.type_coerce(column, type_.impl).label(column.name)
+            encrypted.append((index, type_))
+        columns.append(column)
+    return statement.with_only_columns(columns), encrypted
+
+
+def _get_encrypted_attributes(query):
+    attributes = []
+    for index, entity in enumerate(query._entities):
+        if not isinstance(entity, _MapperEntity):
+            continue
+        for prop in entity.mapper.column_attrs:
+            type_ = prop.columns[0].type
+            if isinstance(type_, EncryptedType):
+                attributes.append((
+                    index,
+                    prop.key,
+                    getattr(entity.entity_zero.entity, prop.key),
+                    type_
+                ))
+    return attributes
+
+
+def _iter_decrypted_rows(statement, bind, batch_size, executor):
+    statement, encrypted = _get_raw_statement(statement)
+    result = bind.execute(statement)
+    try:
+        keys = result.keys()
+        while True:
+            rows = result.fetchmany(batch_size)
+            if not rows:
+                break
+            columns = [list(column) for column in zip(*rows)]
+            for index, type_ in encrypted:
+                columns[index] = type_.process_result_values(
+                    columns[index],
+                    bind.dialect,
+                    executor=executor
+                )
+            for values in zip(*columns):
+                yield sa.util.KeyedTuple(values, keys)
+    finally:
+        result.close()
+
+
+def _iter_decrypted_entities(query, attributes, batch_size, executor):
+    # The encrypted attributes are deferred and their raw values are
+    # selected as extra columns, which are decrypted in bulk and set to the
+    # loaded objects afterwards. Objects that were already loaded in the
+    # session keep their current values.
+    width = len(query._entities)
+    query = query.options(
+        *(sa.orm.defer(attr) for _, _, attr, _ in attributes)
+    ).add_columns(
+        *(sa.type_coerce(attr, type_.impl) for _, _, attr, type_ in attributes)
+    ).yield_per(batch_size)
+    dialect = query.session.get_bind(query._mapper_zero()).dialect
+    rows = iter(query)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        for offset, (index, key, _, type_) in enumerate(attributes):
+            objs = []
+            values = []
+            for row in batch:
+                obj = row[index]
+                if obj is not None and key in sa.inspect(obj).unloaded:
+                    objs.append(obj)
+                    values.append(row[width + offset])
+            decrypted = type_.process_result_values(
+                values,
+                dialect,
+                executor=executor
+            )
+            for obj, value in zip(objs, decrypted):
+                set_committed_value(obj, key, value)
+        for row in batch:
+            if width == 1:
+                yield row[0]
+            else:
+                yield sa.util.KeyedTuple(row[:width], row.keys()[:width])
+
+
+def iter_decrypted(
+    query,
+    bind=None,
+    batch_size=1000,
+    executor=None,
+    max_workers=None
+):
+    """
+    Iterate through the results of given query, decrypting the
+    :class:`EncryptedType` values in bulk, one column of a fetched batch at
+    a time, on a thread pool.
+
+    By default the values of EncryptedType columns are decrypted one by one
+    in the result processor. Decrypting is CPU bound and `cryptography`
+    releases the GIL while running the actual ciphers, hence for large
+    results with several encrypted columns decrypting the values in
+    parallel can be considerably faster.
+
+    The results are fetched `batch_size` rows at a time. Queries of columns
+    and plain selects return keyed tuples::
+
+        from sqlalchemy_utils.types.encrypted import iter_decrypted
+
+
+        query = session.query(User.id, User.email, User.phone)
+
+        for row in iter_decrypted(query, batch_size=5000):
+            print(row.id, row.email, row.phone)
+
+
+    Queries of entities return the entities (or tuples of them) as
+    :meth:`~sqlalchemy.orm.query.Query.yield_per` would. The encrypted
+    attributes of the entities are loaded as raw values, decrypted in bulk
+    and set to the loaded objects in place. Objects that were already loaded
+    in the session keep their current values::
+
+        for user in iter_decrypted(session.query(User), batch_size=5000):
+            print(user.email)
+
+
+    .. versionadded: 0.31.0
+
+    :param query: SQLAlchemy Query object or a select
+    :param bind:
+        Optional SQLAlchemy bind, if None uses the bind of the given query
+        object. Queries of entities are always executed using the session
+        of the query.
+    :param batch_size: number of rows to fetch and decrypt at a time
+    :param executor:
+        Optional `concurrent.futures` executor, by default a thread pool of
+        `max_workers` threads is created for the duration of the iteration.
+    :param max_workers:
+        Number of worker threads of the created thread pool, defaults to the
+        number of CPUs.
+    """
+    attributes = []
+    if isinstance(query, sa.orm.query.Query):
+        attributes = _get_encrypted_attributes(query)
+        if not attributes:
+            if bind is None:
+                bind = query.session.get_bind(query._mapper_zero())
+            query = query.statement
+
+    elif bind is None:
+        bind = query.bind
+
+    own_executor = executor is None
+    if own_executor:
+        if ThreadPoolExecutor is None:
+            raise ImproperlyConfigured(
+                "'futures' is required to use iter_decrypted"
+            )
+        executor = ThreadPoolExecutor(
+            max_workers or multiprocessing.cpu_count()
+        )
+
+    try:
+        if attributes:
+            results = _iter_decrypted_entities(
+                query, attributes, batch_size, executor
+            )
+        else:
+            results = _iter_decrypted_rows(query, bind, batch_size, executor)
+        for result in results:
+            yield result
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+
+def rotate_encrypted_column(session, attr, old_key, new_key, batch_size=1000):
+    """
+    Re-encrypt the values of given :class:`EncryptedType` column from
+    `old_key` to `new_key`.
+
+    The table is walked in primary key order `batch_size` rows at a time
+    and the re-encrypted values of each batch are written with a single
+    executemany UPDATE, after which the batch is committed. Rows that are
+    already encrypted with the new key are skipped, hence an interrupted
+    rotation can be resumed simply by running it again.
+
+    Rows on the new key are recognized by the key id of the value if the
+    engine stores key ids (:class:`AesGcmEngine`) and otherwise by trying to
+    decrypt the value with the new key. The latter requires an authenticated
+    engine, hence :class:`AesEngine` columns are not supported.
+
+    During the rotation the column should be configured with a keyring of
+    both keys so that all the rows can be read and new rows are written with
+    the new key::
+
+
+        class User(Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            email = sa.Column(EncryptedType(
+                sa.Unicode, [new_key, old_key], AesGcmEngine))
+
+
+        rotate_encrypted_column(session, User.email, old_key, new_key)
+
+
+    .. versionadded: 0.31.0
+
+    :param session: SQLAlchemy Session object
+    :param attr: EncryptedType column attribute, for example `User.email`
+    :param old_key: key to rotate from
+    :param new_key: key to rotate to
+    :param batch_size: number of rows per batch
+    :return: number of re-encrypted rows
+    """
+    column = attr.property.columns[0]
+    type_ = column.type
+    if not isinstance(type_, EncryptedType):
+        raise TypeError('Attribute %r is not an EncryptedType column.' % attr)
+    old_engine = type_._get_engine(old_key)
+    new_engine = type_._get_engine(new_key)
+    if not new_engine.authenticated:
+        raise ValueError(
+            'Key rotation requires an authenticated encryption engine, '
+            '%s can not detect values encrypted with a wrong key.' %
+            type_.engine_class.__name__
+        )
+
+    table = column.table
+    primary_keys = list(table.primary_key.columns)
+    raw_column = sa.type_coerce(column, type_.impl)
+    bind = session.get_bind(attr.class_)
+    query = (
+        sa.select(primary_keys + [raw_column])
+        .order_by(*primary_keys)
+        .limit(batch_size)
+    )
+    update = (
+        table.update()
+        .where(sa.and_(*(
+            key == sa.bindparam('_pk_%d' % index)
+            for index, key in enumerate(primary_keys)
+        )))
+        .values({column.name: sa.bindparam('_value', type_=type_.impl)})
+    )
+
+    def is_on_new_key(value):
+        key_id = new_engine.get_key_id(value)
+        if key_id is not None:
+            return key_id == new_engine.key_id
+        try:
+            new_engine.decrypt(value)
+        except Exception:
+            return False
+        return True
+
+    count = 0
+    last = None
+    while True:
+        batch_query = query
+        if last is not None:
+            batch_query = query.where(get_seek_predicate(
+                [(key, False) for key in primary_keys],
+                last,
+                row_values=bind.dialect.name == 'postgresql'
+            ))
+        rows = [
+            tuple(row)
+            for row in session.execute(batch_query, mapper=attr.class_)
+        ]
+        if not rows:
+            break
+        last = list(rows[-1][:-1])
+        params = []
+        for row in rows:
+            value = row[-1]
+            if value is None or is_on_new_key(value):
+                continue
+            row_params = dict(
+                ('_pk_%d' % index, pk) for index, pk in enumerate(row[:-1])
+            )
+            row_params['_value'] = new_engine.encrypt(
+                old_engine.decrypt(value)
+            )
+            params.append(row_params)
+        if params:
+            session.execute(update, params, mapper=attr.class_)
+            count += len(params)
+        session.commit()
+    return count
@@ -1,6 +1,10 @@
+import itertools
+import multiprocessing
+import threading
 import weakref
 
 import six
+import sqlalchemy as sa
 from sqlalchemy import types
 from sqlalchemy.dialects import oracle, postgresql
 from sqlalchemy.ext.mutable import Mutable
@@ -16,6 +20,54 @@ try:
 except ImportError:
     pass
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+
+_default_executor = None
+_default_executor_lock = threading.Lock()
+
+
+def get_default_executor():
+    """
+    Return the shared thread pool that is used for hashing and verifying
+    passwords when no executor is configured.
+    """
+    global _default_executor
+
+    if ThreadPoolExecutor is None:
+        raise ImproperlyConfigured(
+            "'futures' is required for asynchronous password hashing"
+        )
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(
+                multiprocessing.cpu_count()
+            )
+        return _default_executor
+
+
+_contexts = {}
+
+
+def _get_context(config):
+    # Executed in the workers, which may be other processes.
+    try:
+        return _contexts[config]
+    except KeyError:
+        context = _contexts[config] = CryptContext.from_string(config)
+        return context
+
+
+def _hash_secret(config, secret):
+    return _get_context(config).encrypt(secret)
+
+
+def _verify_secret(config, secret, hash):
+    return _get_context(config).verify_and_update(secret, hash)
+
 
 class Password(Mutable, object):
 
@@ -29,7 +81,7 @@ class Password(Mutable, object):
 
         super(Password, cls).coerce(key, value)
 
-    def __init__(self, value, context=None, secret=False):
+    def __init__(self, value, context=None, secret=False, executor=None):
         # Store the hash (if it is one).
         self.hash = value if not secret else None
 
@@ -43,6 +95,83 @@ class Password(Mutable, object):
         # Save weakref of the password context (if we have one)
         self.context = weakref.proxy(context) if context is not None else None
 
+        # Executor used for asynchronous hashing and verification.
+        self.executor = executor
+
+    def _submit(self, func, *args):
+        if self.context is None:
+            raise ValueError(
+                'Password without a context can not be hashed or verified.'
+            )
+        executor = self.executor or get_default_executor()
+        return executor.submit(func, self.context.to_string(), *args)
+
+    def set_hash(self, hash):
+        """
+        Store given new hash (as returned by the futures of
+        :meth:`hash_async` and :meth:`verify_async`), clear the secret and
+        mark the password as changed.
+
+        .. versionadded: 0.31.0
+
+        :param hash: new password hash
+        """
+        if isinstance(hash, six.text_type):
+            hash = hash.encode('utf8')
+        self.hash = hash
+        self.secret = None
+        self.changed()
+
+    def hash_async(self):
+        """
+        Hash the secret of this password in the executor of this password
+        (or the shared default thread pool) and return a
+        `concurrent.futures.Future` that resolves to the hash.
+
+        The future does not modify this password, since its callbacks run in
+        the threads of the executor. The hash should be stored with
+        :meth:`set_hash` in the thread that owns the password (and its
+        session). In asyncio code the future can be awaited with
+        `asyncio.wrap_future`::
+
+            password = user.password
+            password.set_hash(
+                await asyncio.wrap_future(password.hash_async())
+            )
+
+        .. versionadded: 0.31.0
+        """
+        if self.secret is None:
+            raise ValueError('Password does not have a secret to hash.')
+        return self._submit(_hash_secret, self.secret)
+
+    def verify_async(self, value):
+        """
+        Verify given plain text password against this password in the
+        executor of this password (or the shared default thread pool) and
+        return a `concurrent.futures.Future` that resolves to a
+        `(valid, new_hash)` tuple.
+
+        The new hash is not None if the password is valid but the stored
+        hash should be updated (for example because its scheme is
+        deprecated). Unlike `==`, the future does not update the hash itself
+        since its callbacks run in the threads of the executor. The update
+        should be done with :meth:`set_hash` in the thread that owns the
+        password::
+
+            password = user.password
+            valid, new_hash = await asyncio.wrap_future(
+                password.verify_async(plain_text)
+            )
+            if new_hash is not None:
+                password.set_hash(new_hash)
+
+        .. versionadded: 0.31.0
+
+        :param value: plain text password
+        """
+        return self._submit(_verify_secret, value, self.hash)
+
     def __eq__(self, value):
         if self.hash is None or value is None:
             # Ensure that we don't continue comparison if one of us is None.
@@ -116,12 +245,60 @@ class PasswordType(types.TypeDecorator, ScalarCoercible):
         target.password == 'b'
         # True
 
+
+    Hashing and verifying can also be done asynchronously in an executor,
+    which is useful for example in asyncio applications where blocking the
+    event loop for the duration of the hashing is not acceptable. By default
+    a shared thread pool is used, another executor can be given with the
+    executor parameter.
+
+    ::
+
+        class Model(Base):
+            password = sa.Column(PasswordType(
+                schemes=['pbkdf2_sha512'],
+                executor=ThreadPoolExecutor(4)
+            ))
+
+
+        valid, new_hash = await asyncio.wrap_future(
+            target.password.verify_async('b')
+        )
+
+
+    With `defer_hashing=True` the passwords are not hashed on assignment.
+    Instead all the unhashed passwords of a flush are hashed in parallel in
+    the executor, which makes bulk imports considerably faster. Since the
+    hashing is CPU bound, a `ProcessPoolExecutor` is recommended for this::
+
+        class Model(Base):
+            password = sa.Column(PasswordType(
+                schemes=['pbkdf2_sha512'],
+                executor=ProcessPoolExecutor(),
+                defer_hashing=True
+            ))
+
+
+        session.add_all([Model(password=password) for password in passwords])
+        session.commit()  # hashes all the passwords in parallel
+
+    Note that deferred passwords can not be verified until they have been
+    hashed, either by flushing or with :meth:`Password.hash_async`.
+
+    .. versionchanged: 0.31.0
+        Added executor and defer_hashing parameters
     """
 
     impl = types.VARBINARY(1024)
     python_type = Password
 
-    def __init__(self, max_length=None, **kwargs):
+    def __init__(
+        self,
+        max_length=None,
+        executor=None,
+        defer_hashing=False,
+        **kwargs
+    ):
         # Fail if passlib is not found.
         if passlib is None:
             raise ImproperlyConfigured(
@@ -131,6 +308,15 @@ class PasswordType(types.TypeDecorator, ScalarCoercible):
         # Construct the passlib crypt context.
         self.context = CryptContext(**kwargs)
 
+        self.executor = executor
+        self.defer_hashing = defer_hashing
+        if defer_hashing and not sa.event.contains(
+            sa.orm.Session, 'before_flush', deferred_hashing_listener
+        ):
+            sa.event.listen(
+                sa.orm.Session, 'before_flush', deferred_hashing_listener
+            )
+
         if max_length is None:
             max_length = self.calculate_max_length()
 
@@ -185,7 +371,7 @@ class PasswordType(types.TypeDecorator, ScalarCoercible):
 
     def process_result_value(self, value, dialect):
         if value is not None:
-            return Password(value, self.context)
+            return Password(value, self.context, executor=self.executor)
 
     def _coerce(self, value):
 
@@ -193,16 +379,28 @@ class PasswordType(types.TypeDecorator, ScalarCoercible):
             return
 
         if not isinstance(value, Password):
+            if self.defer_hashing:
+                # Hash the password on flush.
+                return Password(
+                    value,
+                    context=self.context,
+                    secret=True,
+                    executor=self.executor
+                )
+
             # Hash the password using the default scheme.
             value = self.context.encrypt(value).encode('utf8')
-            return Password(value, context=self.context)
+            return Password(
+                value, context=self.context, executor=self.executor
+            )
 
         else:
             # If were given a password object; ensure the context is right.
             value.context = weakref.proxy(self.context)
+            value.executor = self.executor
 
             # If were given a password secret; encrypt it.
-            if value.secret is not None:
+            if value.secret is not None and not self.defer_hashing:
                 value.hash = self.context.encrypt(value.secret).encode('utf8')
                 value.secret = None
 
@@ -214,3 +412,46 @@ class PasswordType(types.TypeDecorator, ScalarCoercible):
 
 
 Password.associate_with(PasswordType)
+
+
+def hash_passwords(passwords):
+    """
+    Hash the secrets of given :class:`Password` objects in parallel in their
+    executors and wait for the results.
+
+    .. versionadded: 0.31.0
+
+    :param passwords: iterable of Password objects
+    """
+    futures = [
+        (password, password.hash_async())
+        for password in passwords
+        if password.secret is not None
+    ]
+    for password, future in futures:
+        password.set_hash(future.result())
+
+
+def deferred_hashing_listener(session, flush_context, instances):
+    """
+    Hash the unhashed passwords of all the new and modified objects of given
+    session that use a :class:`PasswordType` with `defer_hashing=True`.
+    """
+    columns = {}
+    passwords = []
+    for obj in itertools.chain(session.new, session.dirty):
+        mapper = sa.inspect(obj).mapper
+        if mapper not in columns:
+            columns[mapper] = [
+                (prop.key, prop.columns[0].type)
+                for prop in mapper.column_attrs
+                if isinstance(prop.columns[0].type, PasswordType) and
+                prop.columns[0].type.defer_hashing
+            ]
+        for key, type_ in columns[mapper]:
+            value = obj.__dict__.get(key)
+            if isinstance(value, Password) and value.secret is not None:
+                value.context = weakref.proxy(type_.context)
+                value.executor = type_.executor
+                passwords.append(value)
+    hash_passwords(passwords)
@@ -1,4 +1,5 @@
 from sqlalchemy_utils import analyze
+from sqlalchemy_utils.functions.database import QueryAnalysis
 from tests import TestCase
 
 
@@ -27,3 +28,84 @@ class TestAnalyzeWithPostgres(TestCase):
         )
         analysis = analyze(self.connection, query)
         assert analysis.node_types == [u'Limit', u'Index Only Scan']
+
+    def test_plan_tree(self):
+        query = (
+            self.session.query(self.Article)
+            .join(self.Article.category)
+        )
+        analysis = analyze(self.connection, query)
+        assert [node.node_type for node in analysis.nodes] == [
+            u'Hash Join', u'Seq Scan', u'Hash', u'Seq Scan'
+        ]
+        assert analysis.nodes[1].relation_name == u'article'
+        assert analysis.nodes[1].actual_rows == 0
+        assert analysis.nodes[1].loops == 1
+        assert set(analysis.total_buffers) == set([
+            'shared_hit', 'shared_read', 'local_hit', 'local_read'
+        ])
+
+
+class TestQueryAnalysis(object):
+    def setup_method(self, method):
+        self.analysis = QueryAnalysis([{
+            'Plan': {
+                'Node Type': 'Nested Loop',
+                'Plan Rows': 10,
+                'Actual Rows': 1000,
+                'Actual Loops': 1,
+                'Actual Total Time': 10.0,
+                'Shared Hit Blocks': 20,
+                'Shared Read Blocks': 5,
+                'Plans': [
+                    {
+                        'Node Type': 'Seq Scan',
+                        'Relation Name': 'category',
+                        'Plan Rows': 100,
+                        'Actual Rows': 100,
+                        'Actual Loops': 1,
+                        'Actual Total Time': 2.0,
+                        'Shared Hit Blocks': 10,
+                    },
+                    {
+                        'Node Type': 'Index Scan',
+                        'Relation Name': 'article',
+                        'Index Name': 'ix_article_category_id',
+                        'Plan Rows': 1,
+                        'Actual Rows': 10,
+                        'Actual Loops': 100,
+                        'Actual Total Time': 0.05,
+                        'Shared Hit Blocks': 10,
+                        'Shared Read Blocks': 5,
+                    }
+                ]
+            },
+            'Planning Time': 0.5,
+            'Execution Time': 10.5
+        }])
+
+    def test_runtime(self):
+        assert self.analysis.runtime == 11.0
+
+    def test_exclusive_time(self):
+        assert [node.exclusive_time for node in self.analysis.nodes] == [
+            3.0, 2.0, 5.0
+        ]
+
+    def test_slowest_nodes(self):
+        assert [
+            node.index_name for node in self.analysis.slowest_nodes(1)
+        ] == ['ix_article_category_id']
+
+    def test_misestimates(self):
+        assert [
+            node.node_type for node in self.analysis.misestimates(10)
+        ] == ['Nested Loop', 'Index Scan']
+
+    def test_total_buffers(self):
+        assert self.analysis.total_buffers == {
+            'shared_hit': 20,
+            'shared_read': 5,
+            'local_hit': 0,
+            'local_read': 0
+        }
@@ -0,0 +1,138 @@
+import pytest
+import sqlalchemy as sa
+
+from sqlalchemy_utils import cascade_delete, get_cascade_delete_plan
+from tests import TestCase
+
+
+class TestCascadeDelete(TestCase):
+    def create_models(self):
+        class Tenant(self.Base):
+            __tablename__ = 'tenant'
+            id = sa.Column(sa.Integer, primary_key=True)
+            name = sa.Column(sa.Unicode(255))
+
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            tenant_id = sa.Column(sa.Integer, sa.ForeignKey(Tenant.id))
+
+        class Article(self.Base):
+            __tablename__ = 'article'
+            id = sa.Column(sa.Integer, primary_key=True)
+            tenant_id = sa.Column(sa.Integer, sa.ForeignKey(Tenant.id))
+            author_id = sa.Column(sa.Integer, sa.ForeignKey(User.id))
+
+        class Comment(self.Base):
+            __tablename__ = 'comment'
+            id = sa.Column(sa.Integer, primary_key=True)
+            article_id = sa.Column(sa.Integer, sa.ForeignKey(Article.id))
+
+        self.Tenant = Tenant
+        self.User = User
+        self.Article = Article
+        self.Comment = Comment
+
+    def create_data(self):
+        self.session.add_all([
+            self.Tenant(id=1, name=u'acme'),
+            self.Tenant(id=2, name=u'other'),
+            self.User(id=1, tenant_id=1),
+            self.User(id=2, tenant_id=2),
+            self.Article(id=1, tenant_id=1, author_id=1),
+            self.Article(id=2, tenant_id=2, author_id=1),
+            self.Article(id=3, tenant_id=2, author_id=2),
+            self.Comment(id=1, article_id=1),
+            self.Comment(id=2, article_id=2),
+            self.Comment(id=3, article_id=3),
+            self.Comment(id=4, article_id=3),
+        ])
+        self.session.commit()
+
+    def test_plan_orders_referencing_tables_first(self):
+        tables = [
+            table.name for table, _ in get_cascade_delete_plan(self.Tenant)
+        ]
+        assert tables == ['comment', 'article', 'user', 'tenant']
+
+    def test_dry_run_counts_rows(self):
+        self.create_data()
+        query = self.session.query(self.Tenant).filter_by(name=u'acme')
+        counts = cascade_delete(query, dry_run=True)
+        assert list(counts.items()) == [
+            ('comment', 2),
+            ('article', 2),
+            ('user', 1),
+            ('tenant', 1)
+        ]
+        assert self.session.query(self.Comment).count() == 4
+
+    def test_deletes_referencing_rows(self):
+        self.create_data()
+        query = self.session.query(self.Tenant).filter_by(name=u'acme')
+        cascade_delete(query)
+        assert self.session.query(self.Tenant.id).all() == [(2, )]
+        assert self.session.query(self.Article.id).all() == [(3, )]
+        assert (
+            self.session.query(self.Comment.id).order_by('id').all() ==
+            [(3, ), (4, )]
+        )
+
+    def test_query_depending_on_referencing_rows(self):
+        self.create_data()
+        query = self.session.query(self.Tenant).filter(
+            sa.exists().where(
+                sa.and_(
+                    self.Article.tenant_id == self.Tenant.id,
+                    self.Comment.article_id == self.Article.id
+                )
+            )
+        ).filter(self.Tenant.name == u'acme')
+        counts = cascade_delete(query)
+        assert counts['tenant'] == 1
+        assert self.session.query(self.Tenant.id).all() == [(2, )]
+
+    def test_query_without_matching_rows(self):
+        self.create_data()
+        query = self.session.query(self.Tenant).filter_by(name=u'unknown')
+        assert set(cascade_delete(query).values()) == set([0])
+        assert self.session.query(self.Comment).count() == 4
+
+    def test_requires_bind(self):
+        with pytest.raises(ValueError):
+            cascade_delete(self.Tenant)
+
+    @pytest.mark.parametrize('chunk_size', (1, 2, 100))
+    def test_deletes_in_chunks(self, chunk_size):
+        self.create_data()
+        counts = cascade_delete(
+            self.Tenant,
+            bind=self.session,
+            chunk_size=chunk_size
+        )
+        assert counts['comment'] == 4
+        assert counts['tenant'] == 2
+        assert self.session.query(self.Comment).count() == 0
+
+
+class TestCascadeDeleteWithCycles(TestCase):
+    def create_models(self):
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            article_id = sa.Column(
+                sa.Integer, sa.ForeignKey('article.id', use_alter=True,
+                                          name='fk_user_article')
+            )
+
+        class Article(self.Base):
+            __tablename__ = 'article'
+            id = sa.Column(sa.Integer, primary_key=True)
+            author_id = sa.Column(sa.Integer, sa.ForeignKey(User.id))
+
+        self.User = User
+        self.Article = Article
+
+    def test_raises_value_error(self):
+        with pytest.raises(ValueError):
+            get_cascade_delete_plan(self.User)
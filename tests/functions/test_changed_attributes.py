@@ -0,0 +1,61 @@
+import sqlalchemy as sa
+
+from sqlalchemy_utils import changed_attributes, session_changes
+from tests import TestCase
+
+
+class TestChangedAttributes(TestCase):
+    def test_new_object(self):
+        article = self.Article(name=u'Some article')
+        assert changed_attributes(article) == set(['name'])
+
+    def test_persisted_object_without_changes(self):
+        article = self.Article(name=u'Some article')
+        self.session.add(article)
+        self.session.commit()
+        assert changed_attributes(article) == set()
+
+    def test_assigning_current_value_is_not_a_change(self):
+        article = self.Article(name=u'Some article')
+        self.session.add(article)
+        self.session.commit()
+        assert article.name == u'Some article'
+        article.name = u'Some article'
+        assert changed_attributes(article) == set()
+
+    def test_changed_relationship(self):
+        article = self.Article(name=u'Some article')
+        self.session.add(article)
+        self.session.commit()
+        article.category = self.Category(name=u'Some category')
+        assert changed_attributes(article) == set(['category'])
+
+    def test_does_not_load_unloaded_relationships(self):
+        category = self.Category(name=u'Some category')
+        self.session.add(category)
+        self.session.commit()
+        category.name = u'Other category'
+        assert changed_attributes(category) == set(['name'])
+        assert 'articles' not in sa.inspect(category).dict
+
+
+class TestSessionChanges(TestCase):
+    def test_returns_new_and_dirty_objects(self):
+        article = self.Article(name=u'Some article')
+        article2 = self.Article(name=u'Other article')
+        self.session.add_all([article, article2])
+        self.session.commit()
+
+        article.name = u'Updated article'
+        assert article2.name == u'Other article'
+        article2.name = u'Other article'
+        category = self.Category(name=u'Some category')
+        self.session.add(category)
+
+        changes = dict(
+            (obj.name, keys) for obj, keys in session_changes(self.session)
+        )
+        assert changes == {
+            u'Updated article': set(['name']),
+            u'Some category': set(['name'])
+        }
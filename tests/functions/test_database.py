@@ -4,7 +4,14 @@ import sqlalchemy as sa
 from flexmock import flexmock
 from pytest import mark
 
-from sqlalchemy_utils import create_database, database_exists, drop_database
+from sqlalchemy_utils import (
+    AdminEngineCache,
+    create_database,
+    create_databases,
+    database_exists,
+    databases_exist,
+    drop_database
+)
 from tests import TestCase
 
 pymysql = None
@@ -22,6 +29,32 @@ class DatabaseTest(TestCase):
         drop_database(self.url)
         assert not database_exists(self.url)
 
+    def test_create_and_drop_with_engine_cache(self):
+        with AdminEngineCache() as engines:
+            assert not database_exists(self.url, engines=engines)
+            create_database(self.url, engines=engines)
+            assert database_exists(self.url, engines=engines)
+            drop_database(self.url, engines=engines)
+            assert not database_exists(self.url, engines=engines)
+            assert len(engines.engines) == 1
+        assert engines.engines == {}
+
+    def test_batch_create(self):
+        urls = [self.url, self.get_other_url()]
+        try:
+            assert databases_exist(urls) == [False, False]
+            create_database(self.url)
+            assert databases_exist(urls) == [True, False]
+            assert create_databases(urls) == [self.get_other_url()]
+            assert databases_exist(urls) == [True, True]
+        finally:
+            for url, exists in zip(urls, databases_exist(urls)):
+                if exists:
+                    drop_database(url)
+
+    def get_other_url(self):
+        return self.url.replace('sqlalchemy', 'sqlalchemy_other')
+
 
 class TestDatabaseSQLite(DatabaseTest):
     url = 'sqlite:///sqlalchemy_utils.db'
@@ -0,0 +1,83 @@
+import os
+
+import sqlalchemy as sa
+from pytest import raises
+
+from sqlalchemy_utils import database_exists, DatabasePool
+
+
+class DatabasePoolTest(object):
+    def setup_method(self, method):
+        self.setup_calls = 0
+        self.pool = DatabasePool(self.url, size=2, setup=self.create_schema)
+
+    def teardown_method(self, method):
+        self.pool.drop()
+
+    def create_schema(self, engine):
+        self.setup_calls += 1
+        engine.execute('CREATE TABLE article (id INTEGER PRIMARY KEY)')
+
+    def count_articles(self, url):
+        engine = sa.create_engine(url)
+        try:
+            return engine.execute('SELECT COUNT(*) FROM article').scalar()
+        finally:
+            engine.dispose()
+
+    def insert_article(self, url):
+        engine = sa.create_engine(url)
+        try:
+            engine.execute('INSERT INTO article (id) VALUES (1)')
+        finally:
+            engine.dispose()
+
+    def test_create(self):
+        self.pool.create()
+        assert self.setup_calls == 1
+        assert database_exists(self.pool.template_url)
+        for url in self.pool.urls:
+            assert self.count_articles(url) == 0
+
+    def test_acquire_and_release(self):
+        self.pool.create()
+        url = self.pool.acquire()
+        assert url in self.pool.urls
+        assert self.pool.acquire() != url
+        self.insert_article(url)
+        self.pool.release(url)
+        assert self.pool.acquire() == url
+        assert self.count_articles(url) == 0
+
+    def test_database_context_manager(self):
+        self.pool.create()
+        with self.pool.database() as url:
+            self.insert_article(url)
+        assert self.count_articles(url) == 0
+
+    def test_drop(self):
+        self.pool.create()
+        self.pool.drop()
+        for url in self.pool.urls + [self.pool.template_url]:
+            assert not database_exists(url)
+
+
+class TestDatabasePoolSQLite(DatabasePoolTest):
+    url = 'sqlite:///sqlalchemy_utils_pool.db'
+
+    def test_database_names(self):
+        assert [url.database for url in self.pool.urls] == [
+            'sqlalchemy_utils_pool_1.db',
+            'sqlalchemy_utils_pool_2.db'
+        ]
+        assert os.path.basename(self.pool.template_url.database) == (
+            'sqlalchemy_utils_pool_template.db'
+        )
+
+    def test_memory_database(self):
+        with raises(ValueError):
+            DatabasePool('sqlite:///:memory:', size=2, setup=None)
+
+
+class TestDatabasePoolPostgres(DatabasePoolTest):
+    url = 'postgres://postgres@localhost/db_test_sqlalchemy_util_pool'
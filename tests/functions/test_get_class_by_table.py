@@ -97,3 +97,26 @@ class TestGetClassByTableWithSingleTableInheritance(object):
                 self.Entity.__table__,
                 {'type': 'unknown'}
             )
+
+
+class TestGetClassByTableIndex(object):
+    def setup_method(self, method):
+        self.Base = declarative_base()
+
+        class Entity(self.Base):
+            __tablename__ = 'entity'
+            id = sa.Column(sa.Integer, primary_key=True)
+
+        self.Entity = Entity
+
+    def test_index_is_refreshed_when_new_mappers_appear(self):
+        assert get_class_by_table(
+            self.Base,
+            self.Entity.__table__
+        ) == self.Entity
+
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+
+        assert get_class_by_table(self.Base, User.__table__) == User
@@ -1,6 +1,11 @@
 import sqlalchemy as sa
 
-from sqlalchemy_utils.functions import getdotattr
+from sqlalchemy_utils.functions import (
+    compile_dotpath,
+    getdotattr,
+    getdotattr_many
+)
+from sqlalchemy_utils.functions.orm import _dotpath_getters
 from tests import TestCase
 
 
@@ -83,3 +88,75 @@ class TestGetDotAttr(TestCase):
             self.Section.document
         )
         assert getdotattr(self.Section, 'document.name') is self.Document.name
+
+    def test_compile_dotpath_caches_parsed_paths(self):
+        compile_dotpath('section.document')
+        hits = _dotpath_getters.hits
+        compile_dotpath('section.document', condition=lambda value: True)
+        assert _dotpath_getters.hits == hits + 1
+
+    def test_compile_dotpath(self):
+        document = self.Document(name=u'some document')
+        section = self.Section(document=document)
+        subsection = self.SubSection(section=section)
+
+        get_name = compile_dotpath('section.document.name')
+        assert get_name(subsection) == u'some document'
+        assert get_name(self.SubSection) is self.Document.name
+
+    def test_getdotattr_many(self):
+        document = self.Document(name=u'some document')
+        sections = [
+            self.Section(document=document),
+            self.Section(document=document)
+        ]
+        subsections = [
+            self.SubSection(section=sections[0]),
+            self.SubSection(section=sections[1]),
+            self.SubSection(section=sections[1])
+        ]
+        assert getdotattr_many(subsections, 'section') == [
+            sections[0], sections[1], sections[1]
+        ]
+        assert getdotattr_many([], 'section') == []
+
+    def test_getdotattr_many_with_none_values(self):
+        sections = [
+            self.Section(document=self.Document(name=u'a')),
+            self.Section()
+        ]
+        assert getdotattr_many(sections, 'document.name') == [u'a', None]
+        assert [
+            getdotattr(section, 'document.name') for section in sections
+        ] == [u'a', None]
+
+    def test_none_elements_in_sequences(self):
+        subsections = [
+            self.SubSection(section=self.Section(name=u'a')),
+            self.SubSection()
+        ]
+        assert getdotattr(subsections, 'section.name') == [u'a', None]
+
+    def test_getdotattr_many_with_load(self):
+        documents = [
+            self.Document(name=u'document %d' % index) for index in range(3)
+        ]
+        self.session.add_all([
+            self.SubSection(section=self.Section(document=document))
+            for document in documents
+        ])
+        self.session.commit()
+        self.session.expunge_all()
+        subsections = (
+            self.session.query(self.SubSection)
+            .order_by(self.SubSection.id)
+            .all()
+        )
+
+        query_count = self.connection.query_count
+        names = getdotattr_many(
+            subsections, 'section.document.name', load=True
+        )
+        assert names == [u'document 0', u'document 1', u'document 2']
+        # One query for the subsections and one per eager loaded relationship
+        assert self.connection.query_count == query_count + 3
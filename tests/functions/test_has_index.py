@@ -47,3 +47,39 @@ class TestHasIndex(object):
             sa.Column('name', sa.String)
         )
         assert not has_index(article.c.name)
+
+
+class TestHasIndexWithMultipleColumns(object):
+    def setup_method(self, method):
+        Base = declarative_base()
+
+        class ArticleTranslation(Base):
+            __tablename__ = 'article_translation'
+            id = sa.Column(sa.Integer, primary_key=True)
+            locale = sa.Column(sa.String(10), primary_key=True)
+            title = sa.Column(sa.String(100))
+            is_deleted = sa.Column(sa.Boolean)
+            is_archived = sa.Column(sa.Boolean)
+
+            __table_args__ = (
+                sa.Index('my_index', is_deleted, is_archived, title),
+            )
+
+        self.table = ArticleTranslation.__table__
+
+    def test_primary_key(self):
+        assert has_index([self.table.c.id, self.table.c.locale])
+        assert not has_index([self.table.c.locale, self.table.c.id])
+
+    def test_index_prefix(self):
+        table = self.table
+        assert has_index([table.c.is_deleted, table.c.is_archived])
+        assert has_index(
+            (table.c.is_deleted, table.c.is_archived, table.c.title)
+        )
+        assert not has_index([table.c.is_deleted, table.c.title])
+
+    def test_columns_of_different_tables(self):
+        other = sa.Table('other', sa.MetaData(), sa.Column('id', sa.Integer))
+        with raises(TypeError):
+            has_index([self.table.c.id, other.c.id])
@@ -50,3 +50,40 @@ class TestHasUniqueIndex(object):
     def test_compound_column_unique_index(self):
         assert not has_unique_index(self.article_translations.c.is_published)
         assert not has_unique_index(self.article_translations.c.is_archived)
+
+
+class TestHasUniqueIndexWithMultipleColumns(object):
+    def setup_method(self, method):
+        Base = declarative_base()
+
+        class ArticleTranslation(Base):
+            __tablename__ = 'article_translation'
+            id = sa.Column(sa.Integer, primary_key=True)
+            locale = sa.Column(sa.String(10), primary_key=True)
+            title = sa.Column(sa.String(100))
+            is_published = sa.Column(sa.Boolean)
+            is_archived = sa.Column(sa.Boolean)
+
+            __table_args__ = (
+                sa.Index('my_index', is_archived, is_published, unique=True),
+                sa.UniqueConstraint(title, locale),
+            )
+
+        self.table = ArticleTranslation.__table__
+
+    def test_primary_key(self):
+        assert has_unique_index([self.table.c.locale, self.table.c.id])
+
+    def test_unique_constraint(self):
+        assert has_unique_index([self.table.c.locale, self.table.c.title])
+
+    def test_unique_index(self):
+        assert has_unique_index(
+            [self.table.c.is_published, self.table.c.is_archived]
+        )
+
+    def test_subset_of_columns(self):
+        assert not has_unique_index([self.table.c.title])
+        assert not has_unique_index(
+            [self.table.c.title, self.table.c.locale, self.table.c.id]
+        )
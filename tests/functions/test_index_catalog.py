@@ -0,0 +1,133 @@
+import sqlalchemy as sa
+from sqlalchemy.ext.declarative import declarative_base
+
+from sqlalchemy_utils import get_index_catalog, has_index, has_unique_index
+from sqlalchemy_utils.functions import clear_index_catalogs
+
+
+class TestIndexCatalog(object):
+    def setup_method(self, method):
+        Base = declarative_base()
+
+        class User(Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            email = sa.Column(sa.Unicode(255), unique=True)
+            name = sa.Column(sa.Unicode(255))
+            age = sa.Column(sa.Integer)
+            is_active = sa.Column(sa.Boolean)
+
+            __table_args__ = (
+                sa.Index('ix_user_lower_name_age', sa.func.lower(name), age),
+                sa.Index(
+                    'ix_user_active_age',
+                    age,
+                    unique=True,
+                    postgresql_where=is_active
+                ),
+            )
+
+        self.User = User
+        self.table = User.__table__
+        self.catalog = get_index_catalog(self.table)
+
+    def test_column_prefixes(self):
+        assert self.catalog.has_prefix([self.User.id])
+        assert self.catalog.has_prefix([self.table.c.email])
+        assert not self.catalog.has_prefix([self.User.name])
+
+    def test_expression_prefixes(self):
+        lower_name = sa.func.lower(self.User.name)
+        assert self.catalog.has_prefix([lower_name])
+        assert self.catalog.has_prefix([sa.desc(lower_name), self.User.age])
+        assert not self.catalog.has_prefix([self.User.age, lower_name])
+
+    def test_partial_indexes(self):
+        assert not self.catalog.has_prefix([self.User.age])
+        assert self.catalog.has_prefix([self.User.age], partial=True)
+        assert not self.catalog.has_unique([self.User.age])
+
+    def test_sqlite_partial_indexes(self):
+        sa.Index(
+            'ix_user_active_name',
+            self.table.c.name,
+            sqlite_where=self.table.c.is_active
+        )
+        catalog = get_index_catalog(self.table)
+        assert not catalog.has_prefix([self.User.name])
+        assert catalog.has_prefix([self.User.name], partial=True)
+
+    def test_unique_keys(self):
+        assert self.catalog.has_unique([self.User.id])
+        assert self.catalog.has_unique(['email'])
+        assert not self.catalog.has_unique([self.User.name])
+
+    def test_catalog_is_cached(self):
+        assert get_index_catalog(self.table) is self.catalog
+
+    def test_catalog_is_refreshed_when_indexes_are_added(self):
+        sa.Index('ix_user_name', self.table.c.name)
+        assert has_index(self.table.c.name)
+        assert get_index_catalog(self.table) is not self.catalog
+
+    def test_catalog_is_refreshed_when_indexes_are_replaced(self):
+        index = [
+            index for index in self.table.indexes
+            if index.name == 'ix_user_lower_name_age'
+        ][0]
+        self.table.indexes.remove(index)
+        sa.Index('ix_user_name', self.table.c.name)
+        assert has_index(self.table.c.name)
+
+    def test_catalog_is_refreshed_when_primary_key_changes(self):
+        self.table.primary_key.columns.add(self.table.c.name)
+        assert not get_index_catalog(self.table).has_unique([self.User.id])
+
+    def test_has_index_ignores_columns_of_expression_indexes(self):
+        assert not has_index(self.table.c.name)
+
+    def test_has_unique_index_ignores_partial_indexes(self):
+        assert not has_unique_index(self.table.c.age)
+
+
+class TestReflectedIndexCatalog(object):
+    def setup_method(self, method):
+        self.engine = sa.create_engine('sqlite:///:memory:')
+        self.engine.execute(
+            'CREATE TABLE article (id INTEGER PRIMARY KEY, name TEXT, '
+            'author_id INTEGER)'
+        )
+        self.engine.execute(
+            'CREATE INDEX ix_article_author_name ON article (author_id, name)'
+        )
+        self.table = sa.Table(
+            'article',
+            sa.MetaData(),
+            sa.Column('id', sa.Integer, primary_key=True),
+            sa.Column('name', sa.Unicode),
+            sa.Column('author_id', sa.Integer)
+        )
+
+    def teardown_method(self, method):
+        self.engine.dispose()
+
+    def test_reflected_indexes(self):
+        catalog = get_index_catalog(self.table, bind=self.engine)
+        assert catalog.has_prefix([self.table.c.author_id, self.table.c.name])
+        assert catalog.has_unique([self.table.c.id])
+        assert not get_index_catalog(self.table).has_prefix(
+            [self.table.c.author_id]
+        )
+
+    def test_reflected_catalog_is_cached(self):
+        catalog = get_index_catalog(self.table, bind=self.engine)
+        assert get_index_catalog(self.table, bind=self.engine) is catalog
+
+    def test_clear_reflected_catalogs(self):
+        catalog = get_index_catalog(self.table, bind=self.engine)
+        declared_catalog = get_index_catalog(self.table)
+        clear_index_catalogs(bind=self.engine)
+        assert get_index_catalog(self.table, bind=self.engine) is not catalog
+        assert get_index_catalog(self.table) is declared_catalog
+        clear_index_catalogs(self.table)
+        assert get_index_catalog(self.table) is not declared_catalog
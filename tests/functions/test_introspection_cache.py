@@ -0,0 +1,115 @@
+import gc
+
+import sqlalchemy as sa
+from sqlalchemy.ext.declarative import declarative_base
+
+from sqlalchemy_utils import get_mapper, get_primary_keys, get_tables
+from sqlalchemy_utils.functions.cache import introspection_cache, LRUCache
+
+
+class TestIntrospectionCache(object):
+    def setup_method(self, method):
+        self.Base = declarative_base()
+
+        class Building(self.Base):
+            __tablename__ = 'building'
+            id = sa.Column(sa.Integer, primary_key=True)
+            name = sa.Column(sa.Unicode(255))
+
+        self.Building = Building
+        sa.orm.configure_mappers()
+        introspection_cache.reset()
+
+    def teardown_method(self, method):
+        introspection_cache.reset()
+
+    def test_counts_hits_and_misses(self):
+        get_primary_keys(self.Building)
+        get_primary_keys(self.Building)
+        get_primary_keys(self.Building())
+        assert introspection_cache.misses == 1
+        assert introspection_cache.hits == 2
+
+    def test_returns_copies(self):
+        get_primary_keys(self.Building).clear()
+        assert list(get_primary_keys(self.Building)) == ['id']
+        get_tables(self.Building).append(None)
+        assert get_tables(self.Building) == [self.Building.__table__]
+
+    def test_keyword_arguments_are_part_of_the_key(self):
+        @introspection_cache.memoize()
+        def get_name(model, upper=False):
+            return model.__name__.upper() if upper else model.__name__
+
+        assert get_name(self.Building) == 'Building'
+        assert get_name(self.Building, upper=True) == 'BUILDING'
+
+    def test_does_not_keep_classes_alive(self):
+        class Room(self.Base):
+            __tablename__ = 'room'
+            id = sa.Column(sa.Integer, primary_key=True)
+
+        sa.orm.configure_mappers()
+        get_mapper(Room)
+        get_primary_keys(Room)
+        assert Room in introspection_cache.values
+        del Room
+        self.Base._decl_class_registry.pop('Room')
+        gc.collect()
+        assert len(introspection_cache.values) == 0
+
+    def test_evict(self):
+        get_mapper(self.Building)
+        introspection_cache.evict(self.Building)
+        get_mapper(self.Building)
+        assert introspection_cache.misses == 2
+
+    def test_aliases_are_not_cached(self):
+        get_primary_keys(sa.orm.aliased(self.Building))
+        assert introspection_cache.misses == 0
+        assert introspection_cache.hits == 0
+
+    def test_tables_are_cached_only_for_get_mapper(self):
+        table = self.Building.__table__
+        get_primary_keys(table)
+        assert introspection_cache.misses == 0
+        assert get_mapper(table) is get_mapper(table)
+        assert introspection_cache.misses == 1
+        assert introspection_cache.hits == 1
+
+    def test_clear(self):
+        get_mapper(self.Building)
+        introspection_cache.clear()
+        get_mapper(self.Building)
+        assert introspection_cache.misses == 2
+
+    def test_cleared_when_new_mappers_appear(self):
+        get_primary_keys(self.Building)
+
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+
+        assert len(introspection_cache.values) == 0
+
+
+class TestLRUCache(object):
+    def test_discards_least_recently_used_values(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        assert cache.get('a') == 1
+        cache.set('c', 3)
+        assert 'b' not in cache
+        assert len(cache) == 2
+
+    def test_counts_hits_and_misses(self):
+        cache = LRUCache()
+        cache.set('a', 1)
+        cache.get('a')
+        assert cache.get('b', 2) == 2
+        assert cache.hits == 1
+        assert cache.misses == 1
+        cache.reset()
+        assert len(cache) == 0
+        assert cache.hits == 0
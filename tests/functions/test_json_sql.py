@@ -1,7 +1,8 @@
 import pytest
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
-from sqlalchemy_utils import json_sql
+from sqlalchemy_utils import json_recordset_sql, json_sql
 from tests import TestCase
 
 
@@ -31,3 +32,75 @@ class TestJSONSQL(TestCase):
         assert result == (
             self.connection.execute(sa.select([json_sql(value)])).fetchone()[0]
         )
+
+
+class TestJSONSQLWithBindParams(TestCase):
+    dns = 'postgres://postgres@localhost/sqlalchemy_utils_test'
+
+    def execute(self, value, **kwargs):
+        return self.connection.execute(
+            sa.select([json_sql(value, bindparams=True, **kwargs)])
+        ).scalar()
+
+    @pytest.mark.parametrize(
+        'value',
+        (
+            1,
+            14.14,
+            u'a',
+            True,
+            {'a': 2, 'b': u'c', 'd': None, 'e': False},
+            {'a': {'b': [1, u"'c'"]}},
+            {},
+            [1, 2],
+            [],
+        )
+    )
+    def test_values(self, value):
+        assert self.execute(value) == value
+
+    def test_wide_object(self):
+        value = dict(('key%d' % index, index) for index in range(120))
+        assert self.execute(value, chunk_size=50) == value
+
+    def test_wide_array(self):
+        value = list(range(150))
+        assert self.execute(value, chunk_size=50) == value
+
+    def test_scalars_are_bound(self):
+        sql = str(
+            json_sql({'a': u'secret', 'b': 12345}, bindparams=True).compile(
+                dialect=postgresql.dialect()
+            )
+        )
+        assert 'secret' not in sql
+        assert '12345' not in sql
+        assert sql.count('jsonb_build_object') == 1
+
+    def test_chunking(self):
+        value = dict(('key%d' % index, index) for index in range(5))
+        sql = str(json_sql(value, bindparams=True, chunk_size=2))
+        assert sql.count('jsonb_build_object') == 3
+        assert sql.count('||') == 2
+
+
+class TestJSONRecordsetSQL(TestCase):
+    dns = 'postgres://postgres@localhost/sqlalchemy_utils_test'
+
+    def test_insert_from_select(self):
+        table = self.Article.__table__
+        self.connection.execute(
+            table.insert().from_select(
+                [column.name for column in table.c],
+                json_recordset_sql(
+                    table,
+                    [
+                        {'id': 1, 'name': u'Some article'},
+                        {'id': 2, 'name': u'Other article'}
+                    ]
+                )
+            )
+        )
+        assert self.connection.execute(
+            sa.select([table.c.id, table.c.name]).order_by(table.c.id)
+        ).fetchall() == [(1, u'Some article'), (2, u'Other article')]
@@ -1,4 +1,7 @@
-from sqlalchemy_utils.functions import naturally_equivalent
+from sqlalchemy_utils.functions import (
+    find_naturally_equivalent,
+    naturally_equivalent
+)
 from tests import TestCase
 
 
@@ -12,3 +15,71 @@ class TestNaturallyEquivalent(TestCase):
         assert naturally_equivalent(
             self.User(id=1, name=u'someone'), self.User(id=2, name=u'someone')
         )
+
+
+class TestFindNaturallyEquivalent(TestCase):
+    def test_groups_equivalent_objects(self):
+        users = [
+            self.User(id=1, name=u'someone'),
+            self.User(id=2, name=u'someone else'),
+            self.User(id=3, name=u'someone'),
+        ]
+        assert find_naturally_equivalent(users) == [[users[0], users[2]]]
+
+    def test_without_equivalent_objects(self):
+        users = [
+            self.User(id=1, name=u'someone'),
+            self.User(id=2, name=u'someone else'),
+        ]
+        assert find_naturally_equivalent(users) == []
+
+    def test_exclude(self):
+        articles = [
+            self.Article(name=u'Some article', category_id=1),
+            self.Article(name=u'Some article', category_id=2),
+        ]
+        assert find_naturally_equivalent(articles) == []
+        assert find_naturally_equivalent(
+            articles, exclude=['category_id']
+        ) == [articles]
+
+    def test_with_query(self):
+        articles = [
+            self.Article(id=1, name=u'Some article'),
+            self.Article(id=2, name=u'Other article'),
+            self.Article(id=3, name=u'Some article'),
+            self.Article(id=4, name=None),
+            self.Article(id=5, name=None),
+        ]
+        self.session.add_all(articles)
+        self.session.commit()
+        groups = find_naturally_equivalent(
+            self.session.query(self.Article).order_by(self.Article.id)
+        )
+        ids = sorted([article.id for article in group] for group in groups)
+        assert ids == [[1, 3], [4, 5]]
+
+    def test_with_query_with_joins(self):
+        category = self.Category(id=1, name=u'a')
+        self.session.add_all([
+            category,
+            self.Category(id=2, name=u'b'),
+            self.Article(id=1, category=category),
+            self.Article(id=2, category=category),
+        ])
+        self.session.commit()
+        query = self.session.query(self.Category).join(
+            self.Category.articles
+        )
+        assert find_naturally_equivalent(query) == []
+
+    def test_with_query_without_natural_keys(self):
+        self.session.add_all([self.User(id=1), self.User(id=2)])
+        self.session.commit()
+        assert find_naturally_equivalent(
+            self.session.query(self.User), exclude=['name']
+        ) == []
+
+
+class TestFindNaturallyEquivalentOnPostgres(TestFindNaturallyEquivalent):
+    dns = 'postgres://postgres@localhost/sqlalchemy_utils_test'
@@ -55,3 +55,66 @@ class TestFindNonIndexedForeignKeys(TestCase):
         ))
         assert 'category_id' in column_names
         assert 'author_id' not in column_names
+
+    def test_generates_index_ddl(self):
+        fks = non_indexed_foreign_keys(self.Base.metadata, self.engine)
+        assert [fk.info['ddl'] for fk in fks['article']] == [
+            'CREATE INDEX ix_article_category_id ON article (category_id)'
+        ]
+
+
+class TestFindNonIndexedCompositeForeignKeys(TestCase):
+    def create_models(self):
+        class User(self.Base):
+            __tablename__ = 'user'
+            first_name = sa.Column(sa.Unicode(255), primary_key=True)
+            last_name = sa.Column(sa.Unicode(255), primary_key=True)
+
+        class Article(self.Base):
+            __tablename__ = 'article'
+            id = sa.Column(sa.Integer, primary_key=True)
+            author_first_name = sa.Column(sa.Unicode(255))
+            author_last_name = sa.Column(sa.Unicode(255))
+            name = sa.Column(sa.Unicode(255))
+            __table_args__ = (
+                sa.ForeignKeyConstraint(
+                    [author_first_name, author_last_name],
+                    [User.first_name, User.last_name]
+                ),
+                sa.Index(
+                    'ix_article_author',
+                    author_first_name,
+                    author_last_name,
+                    name
+                ),
+            )
+
+        self.User = User
+        self.Article = Article
+
+    def test_exact_column_set_equality_by_default(self):
+        fks = non_indexed_foreign_keys(self.Base.metadata, self.engine)
+        assert len(fks['article']) == 1
+
+    def test_index_prefix_matching(self):
+        fks = non_indexed_foreign_keys(
+            self.Base.metadata, self.engine, prefix=True
+        )
+        assert fks == {}
+
+
+class TestFindNonIndexedForeignKeysOnPostgres(TestFindNonIndexedForeignKeys):
+    dns = 'postgres://postgres@localhost/sqlalchemy_utils_test'
+
+    def test_generates_index_ddl(self):
+        fks = non_indexed_foreign_keys(self.Base.metadata, self.engine)
+        assert [fk.info['ddl'] for fk in fks['article']] == [
+            'CREATE INDEX CONCURRENTLY ix_article_category_id '
+            'ON article (category_id)'
+        ]
+
+    def test_estimates_table_size(self):
+        fks = non_indexed_foreign_keys(self.Base.metadata, self.engine)
+        table = fks['article'][0].table
+        assert 'estimated_rows' in table.info
+        assert table.info['total_bytes'] > 0
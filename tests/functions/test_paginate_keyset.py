@@ -0,0 +1,96 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+import sqlalchemy as sa
+
+from sqlalchemy_utils import iter_keyset, paginate_keyset, sort_query
+from sqlalchemy_utils.functions.pagination import (
+    decode_cursor,
+    encode_cursor,
+    utc
+)
+from tests import TestCase
+
+
+class TestCursorEncoding(object):
+    @pytest.mark.parametrize(
+        'values',
+        (
+            [1, u'name', None, True, 1.5],
+            [datetime.datetime(2015, 1, 1, 12, 30, 5, 10)],
+            [datetime.datetime(2015, 1, 1, 12, 30, tzinfo=utc)],
+            [datetime.date(2015, 1, 1), datetime.time(12, 30)],
+            [Decimal('1.25')],
+        )
+    )
+    def test_roundtrip(self, values):
+        assert decode_cursor(encode_cursor(values)) == values
+
+    def test_invalid_cursor(self):
+        with pytest.raises(ValueError):
+            decode_cursor('invalid')
+
+
+class TestPaginateKeyset(TestCase):
+    def create_data(self):
+        self.session.add_all([
+            self.Article(id=index, name=name)
+            for index, name in enumerate([u'c', u'a', u'b', u'a', u'c'], 1)
+        ])
+        self.session.commit()
+
+    def get_ids(self, query, per_page):
+        pages = []
+        cursor = None
+        while True:
+            articles, cursor = paginate_keyset(query, per_page, after=cursor)
+            pages.append([article.id for article in articles])
+            if cursor is None:
+                return pages
+
+    def test_orders_by_primary_key_by_default(self):
+        self.create_data()
+        query = self.session.query(self.Article)
+        assert self.get_ids(query, 2) == [[1, 2], [3, 4], [5]]
+
+    def test_ascending_order_by(self):
+        self.create_data()
+        query = sort_query(self.session.query(self.Article), 'name')
+        assert self.get_ids(query, 2) == [[2, 4], [3, 1], [5]]
+
+    def test_descending_order_by(self):
+        self.create_data()
+        query = sort_query(self.session.query(self.Article), '-name')
+        assert self.get_ids(query, 2) == [[5, 1], [3, 4], [2]]
+
+    def test_mixed_order_by(self):
+        self.create_data()
+        query = (
+            self.session.query(self.Article)
+            .order_by(sa.desc(self.Article.name), sa.asc(self.Article.id))
+        )
+        assert self.get_ids(query, 2) == [[1, 5], [3, 2], [4]]
+
+    def test_last_page_without_cursor(self):
+        self.create_data()
+        query = self.session.query(self.Article)
+        articles, cursor = paginate_keyset(query, 5)
+        assert len(articles) == 5
+        assert cursor is None
+
+    def test_multiple_entities(self):
+        self.create_data()
+        query = self.session.query(self.Article.id, self.Article.name)
+        rows, cursor = paginate_keyset(query, 2)
+        assert rows == [(1, u'c'), (2, u'a')]
+
+    def test_iter_keyset(self):
+        self.create_data()
+        query = sort_query(self.session.query(self.Article), '-name')
+        ids = [article.id for article in iter_keyset(query, per_page=2)]
+        assert ids == [5, 1, 3, 4, 2]
+
+
+class TestPaginateKeysetOnPostgres(TestPaginateKeyset):
+    dns = 'postgres://postgres@localhost/sqlalchemy_utils_test'
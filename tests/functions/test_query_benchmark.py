@@ -0,0 +1,118 @@
+import pytest
+
+from sqlalchemy_utils import QueryBenchmark
+from sqlalchemy_utils.functions import BenchmarkResult
+from tests import TestCase
+
+
+def make_result(
+    runtimes=(1.0, 2.0, 3.0),
+    node_types=(u'Limit', u'Index Scan'),
+    estimated_rows=10,
+    actual_rows=10
+):
+    return BenchmarkResult(
+        'articles',
+        list(runtimes),
+        list(node_types),
+        estimated_rows,
+        actual_rows
+    )
+
+
+class TestQueryBenchmark(object):
+    def setup_method(self, method):
+        self.benchmark = QueryBenchmark(runtime_threshold=0.5)
+
+    def test_register_decorator(self):
+        @self.benchmark.register('articles')
+        def articles(conn):
+            return 'SELECT * FROM article'
+
+        assert self.benchmark.queries['articles'] is articles
+
+    def test_register_duplicate_name(self):
+        self.benchmark.register('articles', 'SELECT 1')
+        with pytest.raises(ValueError):
+            self.benchmark.register('articles', 'SELECT 2')
+
+    def test_median_runtime(self):
+        assert make_result(runtimes=[3.0, 1.0, 2.0]).runtime == 2.0
+        assert make_result(runtimes=[4.0, 1.0]).runtime == 2.5
+
+    def test_save_and_load(self, tmpdir):
+        path = str(tmpdir.join('benchmarks.json'))
+        self.benchmark.save({'articles': make_result()}, path)
+        result = self.benchmark.load(path)['articles']
+        assert result.name == 'articles'
+        assert result.runtimes == [1.0, 2.0, 3.0]
+        assert result.node_types == [u'Limit', u'Index Scan']
+
+    def test_no_regressions(self):
+        regressions = self.benchmark.compare(
+            {'articles': make_result()},
+            {'articles': make_result(runtimes=[2.5], estimated_rows=12)}
+        )
+        assert regressions == []
+
+    @pytest.mark.parametrize(
+        ('kwargs', 'kind'),
+        (
+            ({'node_types': [u'Limit', u'Seq Scan']}, 'seq_scan'),
+            ({'runtimes': [3.5]}, 'runtime'),
+            ({'estimated_rows': 100}, 'estimated_rows'),
+            ({'actual_rows': 9}, 'actual_rows'),
+        )
+    )
+    def test_regressions(self, kwargs, kind):
+        regressions = self.benchmark.compare(
+            {'articles': make_result()},
+            {'articles': make_result(**kwargs)}
+        )
+        assert [regression.kind for regression in regressions] == [kind]
+
+    @pytest.mark.parametrize(
+        ('baseline', 'result'),
+        (
+            ({'estimated_rows': None}, {}),
+            ({}, {'estimated_rows': None}),
+            ({'actual_rows': None}, {}),
+        )
+    )
+    def test_unknown_row_counts(self, baseline, result):
+        regressions = self.benchmark.compare(
+            {'articles': make_result(**baseline)},
+            {'articles': make_result(**result)}
+        )
+        assert regressions == []
+
+    def test_missing_query(self):
+        regressions = self.benchmark.compare({'articles': make_result()}, {})
+        assert regressions[0].kind == 'missing'
+
+
+class TestQueryBenchmarkWithPostgres(TestCase):
+    dns = 'postgres://postgres@localhost/sqlalchemy_utils_test'
+
+    def setup_method(self, method):
+        TestCase.setup_method(self, method)
+        self.benchmark = QueryBenchmark(runs=2)
+        self.benchmark.register(
+            'articles',
+            lambda conn: self.session.query(self.Article)
+        )
+
+    def test_run(self):
+        result = self.benchmark.run(self.connection)['articles']
+        assert len(result.runtimes) == 2
+        assert result.node_types == [u'Seq Scan']
+        assert result.actual_rows == 0
+
+    def test_assert_no_regressions(self, tmpdir):
+        path = str(tmpdir.join('benchmarks.json'))
+        self.benchmark.assert_no_regressions(self.connection, path)
+        self.session.add(self.Article(name=u'Some article'))
+        self.session.flush()
+        with pytest.raises(AssertionError) as e:
+            self.benchmark.assert_no_regressions(self.connection, path)
+        assert 'actual_rows changed from 0 to 1' in str(e.value)
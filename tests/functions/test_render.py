@@ -1,9 +1,19 @@
+import gc
+import gzip
+
+import pytest
+import six
 import sqlalchemy as sa
 
 from sqlalchemy_utils.functions import (
+    create_mock_engine,
+    get_statement_renderer,
     mock_engine,
+    open_dump,
+    render_bulk_insert,
     render_expression,
-    render_statement
+    render_statement,
+    StatementRenderer
 )
 from tests import TestCase
 
@@ -56,3 +66,147 @@ class TestRender(TestCase):
 
         assert 'CREATE TABLE user' in text
         assert 'PRIMARY KEY' in text
+
+    def test_render_statement_with_params(self):
+        statement = (
+            self.User.__table__.select()
+            .where(self.User.id == sa.bindparam('id'))
+        )
+        text = render_statement(
+            statement, bind=self.session.bind, params={'id': 3}
+        )
+        assert 'WHERE user.id = 3' in text
+        text = render_statement(
+            statement, bind=self.session.bind, params={'id': 4}
+        )
+        assert 'WHERE user.id = 4' in text
+
+    def test_render_null(self):
+        statement = self.User.__table__.update().values(name=None)
+        text = render_statement(statement, bind=self.session.bind)
+        assert 'SET name=NULL' in text
+
+
+class TestStatementRenderer(TestCase):
+    def setup_method(self, method):
+        TestCase.setup_method(self, method)
+        self.renderer = StatementRenderer(self.engine.dialect)
+
+    def test_caches_compiled_statements(self):
+        statement = (
+            self.Article.__table__.select()
+            .where(self.Article.name == sa.bindparam('name'))
+        )
+        assert self.renderer.render(statement, {'name': u'a'}).endswith(
+            "WHERE article.name = 'a'"
+        )
+        assert self.renderer.render(statement, {'name': u"b'"}).endswith(
+            "WHERE article.name = 'b'''"
+        )
+        assert self.renderer.hits == 1
+
+    def test_caches_queries(self):
+        query = self.session.query(self.Article).filter_by(id=3)
+        renderer = get_statement_renderer(self.session.bind.dialect)
+        hits = renderer.hits
+        for _ in range(3):
+            assert render_statement(query).endswith('WHERE article.id = 3;')
+        assert renderer.hits == hits + 2
+        del query
+        gc.collect()
+        assert len(renderer.templates) == 0
+
+    def test_requires_values_for_required_params(self):
+        statement = (
+            self.Article.__table__.select()
+            .where(self.Article.name == sa.bindparam('name'))
+        )
+        with pytest.raises(sa.exc.InvalidRequestError):
+            self.renderer.render(statement)
+
+    def test_does_not_keep_statements_alive(self):
+        statement = self.Article.__table__.select()
+        self.renderer.render(statement)
+        assert len(self.renderer.templates) == 1
+        del statement
+        gc.collect()
+        assert len(self.renderer.templates) == 0
+
+    def test_render_ddl(self):
+        text = self.renderer.render(
+            sa.schema.CreateTable(self.Article.__table__)
+        )
+        assert text.startswith('CREATE TABLE article')
+
+    def test_shared_renderer(self):
+        assert (
+            get_statement_renderer(self.engine.dialect) is
+            get_statement_renderer(self.engine.dialect)
+        )
+
+
+class TestStreamingMockEngine(TestCase):
+    def test_normalize_false(self):
+        stream = six.moves.StringIO()
+        engine = create_mock_engine(self.engine, stream, normalize=False)
+        self.Article.__table__.create(engine)
+        text = stream.getvalue()
+        assert text.startswith('\n\nCREATE TABLE article')
+        assert text.endswith(';')
+
+    def test_mock_engine_gzip_path(self, tmpdir):
+        path = str(tmpdir.join('schema.sql.gz'))
+        with mock_engine('self.engine', path, normalize=False) as stream:
+            self.Article.__table__.create(self.engine)
+        assert stream.closed
+        with gzip.open(path) as f:
+            assert b'CREATE TABLE article' in f.read()
+
+    def test_mock_engine_path(self, tmpdir):
+        path = str(tmpdir.join('schema.sql'))
+        with mock_engine('self.engine', path):
+            self.Article.__table__.create(self.engine)
+        assert tmpdir.join('schema.sql').read().startswith(
+            '\nCREATE TABLE article'
+        )
+
+    def test_open_dump_without_compression(self, tmpdir):
+        path = str(tmpdir.join('schema.sql'))
+        with open_dump(path) as stream:
+            stream.write(u'SELECT 1;')
+        assert tmpdir.join('schema.sql').read() == 'SELECT 1;'
+
+
+class TestRenderBulkInsert(TestCase):
+    def test_batches(self):
+        rows = ({'id': id, 'name': u'%d' % id} for id in range(1, 6))
+        statements = list(
+            render_bulk_insert(
+                self.Article.__table__,
+                rows,
+                batch=2,
+                bind=self.engine
+            )
+        )
+        assert len(statements) == 3
+        assert statements[0] == (
+            "\nINSERT INTO article (id, name) VALUES (1, '1'), (2, '2');"
+        )
+        assert statements[2] == (
+            "\nINSERT INTO article (id, name) VALUES (5, '5');"
+        )
+
+    def test_executes_rendered_sql(self):
+        rows = [{'name': u"o'neil"}, {'name': None}]
+        for statement in render_bulk_insert(
+            self.Article.__table__, rows, bind=self.engine
+        ):
+            self.connection.execute(statement.strip().rstrip(';'))
+        assert self.session.query(self.Article.name).all() == [
+            (u"o'neil", ), (None, )
+        ]
+
+    def test_requires_bind(self):
+        table = sa.Table('user', sa.MetaData(), sa.Column('id', sa.Integer))
+        with pytest.raises(ValueError):
+            list(render_bulk_insert(table, [{'id': 1}]))
@@ -0,0 +1,90 @@
+import sqlalchemy as sa
+from pytest import raises
+
+from sqlalchemy_utils import ImproperlyConfigured, install_slow_query_explainer
+from tests import TestCase
+
+
+class TestSlowQueryExplainer(TestCase):
+    dns = 'postgres://postgres@localhost/sqlalchemy_utils_test'
+
+    def setup_method(self, method):
+        TestCase.setup_method(self, method)
+        self.plans = []
+
+    def teardown_method(self, method):
+        self.explainer.remove()
+        TestCase.teardown_method(self, method)
+
+    def install(self, **kwargs):
+        params = dict(threshold_ms=0, sample_rate=1, sink=self.sink)
+        params.update(kwargs)
+        self.explainer = install_slow_query_explainer(self.engine, **params)
+
+    def sink(self, statement, parameters, duration, analysis):
+        self.plans.append((statement, analysis))
+
+    def test_explains_slow_statements(self):
+        self.install()
+        self.session.query(self.Article).all()
+        statement, analysis = self.plans[0]
+        assert statement.startswith('SELECT')
+        assert analysis.node_types == [u'Seq Scan']
+        assert analysis.runtime is None
+
+    def test_skips_fast_statements(self):
+        self.install(threshold_ms=10000)
+        self.session.query(self.Article).all()
+        assert self.plans == []
+
+    def test_sample_rate(self):
+        self.install(sample_rate=0)
+        self.session.query(self.Article).all()
+        assert self.plans == []
+
+    def test_rate_limit(self):
+        self.install(max_explains=1)
+        self.session.query(self.Article).all()
+        self.session.query(self.Article).all()
+        assert len(self.plans) == 1
+
+    def test_write_statements_are_not_executed_twice(self):
+        self.install()
+        self.session.add(self.Article(name=u'Some article'))
+        self.session.flush()
+        assert self.plans[0][1].node_types == [u'ModifyTable', u'Result']
+        assert self.session.query(self.Article).count() == 1
+
+    def test_sink_errors_do_not_propagate(self):
+        def sink(*args):
+            raise ValueError()
+
+        self.install(sink=sink)
+        assert self.session.query(self.Article).all() == []
+
+    def test_failing_statements(self):
+        self.install(threshold_ms=10000)
+        with raises(sa.exc.DBAPIError):
+            self.session.execute('SELECT * FROM unknown_table')
+        self.session.rollback()
+        self.explainer.threshold_ms = 0
+        self.session.query(self.Article).all()
+        assert len(self.plans) == 1
+
+    def test_remove(self):
+        self.install()
+        self.explainer.remove()
+        self.session.query(self.Article).all()
+        assert self.plans == []
+        self.install()
+
+
+class TestSlowQueryExplainerWithSQLite(object):
+    def test_raises_for_unsupported_dialects(self):
+        with raises(ImproperlyConfigured):
+            install_slow_query_explainer(
+                sa.create_engine('sqlite:///:memory:'),
+                threshold_ms=0,
+                sample_rate=1,
+                sink=lambda *args: None
+            )
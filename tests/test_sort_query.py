@@ -3,6 +3,7 @@ from pytest import raises
 
 from sqlalchemy_utils import sort_query
 from sqlalchemy_utils.functions import QuerySorterException
+from sqlalchemy_utils.functions.cache import LRUCache
 from tests import assert_contains, TestCase
 
 
@@ -349,3 +350,125 @@ class TestSortQueryWithCustomPolymorphic(TestCase):
             'category'
         )
         assert 'ORDER BY' in str(query)
+
+
+class TestSortQueryRequireIndex(TestCase):
+    def create_models(self):
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            name = sa.Column(sa.Unicode(255), index=True)
+            last_name = sa.Column(sa.Unicode(255))
+            age = sa.Column(sa.Integer)
+
+            __table_args__ = (
+                sa.Index('ix_user_last_name_age', last_name, age),
+            )
+
+        self.User = User
+
+    def sort(self, *args, **kwargs):
+        return sort_query(
+            self.session.query(self.User),
+            *args,
+            require_index=True,
+            **kwargs
+        )
+
+    def test_indexed_column(self):
+        assert_contains('ORDER BY "user".name ASC', self.sort('name'))
+
+    def test_primary_key(self):
+        assert_contains('ORDER BY "user".id DESC', self.sort('-id'))
+
+    def test_skips_unindexed_column(self):
+        assert 'ORDER BY' not in str(self.sort('age'))
+
+    def test_composite_index_prefix(self):
+        assert_contains(
+            'ORDER BY "user".last_name ASC, "user".age ASC',
+            self.sort('last_name', 'age')
+        )
+
+    def test_composite_index_prefix_in_reverse_direction(self):
+        assert_contains(
+            'ORDER BY "user".last_name DESC, "user".age DESC',
+            self.sort('-last_name', '-age')
+        )
+
+    def test_skips_mixed_directions(self):
+        query = self.sort('last_name', '-age')
+        assert_contains('ORDER BY "user".last_name ASC', query)
+        assert 'age DESC' not in str(query)
+
+    def test_skips_columns_not_in_index_order(self):
+        query = self.sort('name', 'age')
+        assert_contains('ORDER BY "user".name ASC', query)
+        assert 'age ASC' not in str(query)
+
+    def test_skips_expressions(self):
+        query = sort_query(
+            self.session.query(
+                self.User, sa.func.lower(self.User.name).label('lower_name')
+            ),
+            'lower_name',
+            require_index=True
+        )
+        assert 'ORDER BY' not in str(query)
+
+    def test_non_silent_mode(self):
+        with raises(QuerySorterException):
+            self.sort('age', silent=False)
+
+    def test_on_unindexed_hook(self):
+        def sort_by_id(query, expr, func):
+            return query.order_by(func(self.User.id))
+
+        query = self.sort('-age', on_unindexed=sort_by_id)
+        assert_contains('ORDER BY "user".id DESC', query)
+
+    def test_on_unindexed_hook_order_is_used_for_later_arguments(self):
+        def sort_by_last_name(query, expr, func):
+            return query.order_by(func(self.User.last_name))
+
+        query = self.sort('-age', '-age', on_unindexed=sort_by_last_name)
+        assert_contains(
+            'ORDER BY "user".last_name DESC, "user".age DESC',
+            query
+        )
+
+
+class TestSortQueryCache(TestCase):
+    def setup_method(self, method):
+        TestCase.setup_method(self, method)
+        self.cache = LRUCache(maxsize=2)
+
+    def test_caches_resolved_sort_arguments(self):
+        for _ in range(2):
+            query = sort_query(
+                self.session.query(self.Article), '-name', cache=self.cache
+            )
+            assert_contains('ORDER BY article.name DESC', query)
+        assert self.cache.misses == 1
+        assert self.cache.hits == 1
+
+    def test_cache_key_contains_query_entities(self):
+        sort_query(self.session.query(self.Article), 'name', cache=self.cache)
+        query = sort_query(
+            self.session.query(self.Category), 'name', cache=self.cache
+        )
+        assert_contains('ORDER BY category.name ASC', query)
+        assert self.cache.misses == 2
+
+    def test_caches_unknown_sort_arguments(self):
+        query = self.session.query(self.Article)
+        sort_query(query, 'unknown', cache=self.cache)
+        with raises(QuerySorterException):
+            sort_query(query, 'unknown', cache=self.cache, silent=False)
+        assert self.cache.hits == 1
+
+    def test_without_cache(self):
+        query = sort_query(
+            self.session.query(self.Article), 'name', cache=None
+        )
+        assert_contains('ORDER BY article.name ASC', query)
@@ -1,11 +1,26 @@
+# -*- coding: utf-8 -*-
 from datetime import date, datetime, time
 
 import pytest
+import six
 import sqlalchemy as sa
 from pytest import mark
 
-from sqlalchemy_utils import ColorType, EncryptedType, PhoneNumberType
-from sqlalchemy_utils.types.encrypted import AesEngine, FernetEngine
+from sqlalchemy_utils import (
+    BlindIndexType,
+    ColorType,
+    EncryptedType,
+    ImproperlyConfigured,
+    PhoneNumberType
+)
+from sqlalchemy_utils.types.encrypted import (
+    AesEngine,
+    AesGcmEngine,
+    FernetEngine,
+    get_blind_index_column,
+    iter_decrypted,
+    rotate_encrypted_column
+)
 from tests import TestCase
 
 cryptography = None
@@ -14,6 +29,11 @@ try:
 except ImportError:
     pass
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
 
 @mark.skipif('cryptography is None')
 class EncryptedTypeTestCase(TestCase):
@@ -226,11 +246,118 @@ class EncryptedTypeTestCase(TestCase):
         self.session.query(self.Team).delete()
         self.session.commit()
 
+    def test_reuses_engine_for_same_key(self):
+        type_ = EncryptedType(
+            sa.Unicode, lambda: self._team_key, self.encryption_engine
+        )
+        self._team_key = 'one'
+        value = type_.process_bind_param(u'value', None)
+        engine = type_.engine
+        assert type_.process_result_value(value, None) == u'value'
+        assert type_.engine is engine
+        assert len(type_._engines) == 1
+
+        self._team_key = 'two'
+        type_.process_bind_param(u'value', None)
+        assert type_.engine is not engine
+
+        self._team_key = 'one'
+        assert type_.process_result_value(value, None) == u'value'
+        assert type_.engine is engine
+        assert len(type_._engines) == 2
+
+    @mark.skipif('ThreadPoolExecutor is None')
+    def test_process_result_values(self):
+        type_ = EncryptedType(sa.Unicode, 'key', self.encryption_engine)
+        values = [
+            type_.process_bind_param(u'value %d' % index, None)
+            for index in range(5)
+        ] + [None]
+        expected = [u'value %d' % index for index in range(5)] + [None]
+        assert type_.process_result_values(values, None) == expected
+        executor = ThreadPoolExecutor(2)
+        assert type_.process_result_values(
+            values, None, executor=executor, chunk_size=2
+        ) == expected
+        executor.shutdown()
+
+    @mark.skipif('ThreadPoolExecutor is None')
+    def test_iter_decrypted(self, user):
+        query = self.session.query(
+            self.User.id,
+            self.User.username,
+            self.User.is_active,
+            self.User.date
+        )
+        rows = list(iter_decrypted(query, batch_size=1, max_workers=2))
+        assert len(rows) == 1
+        assert rows[0].id == user.id
+        assert rows[0].username == self.user_name
+        assert rows[0].is_active is True
+        assert rows[0].date == self.user_date
+
+    @mark.skipif('ThreadPoolExecutor is None')
+    def test_iter_decrypted_entities(self, user):
+        user_id = user.id
+        self.session.expunge_all()
+        users = list(
+            iter_decrypted(
+                self.session.query(self.User), batch_size=1, max_workers=2
+            )
+        )
+        assert [obj.id for obj in users] == [user_id]
+        assert users[0].username == self.user_name
+        assert users[0].is_active is True
+        assert not self.session.is_modified(users[0])
+
+    @mark.skipif('ThreadPoolExecutor is None')
+    def test_iter_decrypted_entity_tuples(self, user):
+        self.session.expunge_all()
+        rows = list(
+            iter_decrypted(
+                self.session.query(self.User, self.User.id),
+                max_workers=1
+            )
+        )
+        assert rows[0][0].username == self.user_name
+        assert rows[0].id == rows[0][0].id
+        assert len(rows[0]) == 2
+
+    def test_keyring(self):
+        old_type = EncryptedType(sa.Unicode, 'old', self.encryption_engine)
+        new_type = EncryptedType(sa.Unicode, 'new', self.encryption_engine)
+        type_ = EncryptedType(
+            sa.Unicode, ['new', 'old'], self.encryption_engine
+        )
+        old_value = old_type.process_bind_param(u'old value', None)
+        new_value = type_.process_bind_param(u'new value', None)
+        assert type_.process_result_value(old_value, None) == u'old value'
+        assert type_.process_result_value(new_value, None) == u'new value'
+        assert new_type.process_result_value(new_value, None) == u'new value'
+
+    def test_key_cache_size(self):
+        type_ = EncryptedType(
+            sa.Unicode,
+            lambda: self._team_key,
+            self.encryption_engine,
+            key_cache_size=1
+        )
+        for key in ('one', 'two', 'three'):
+            self._team_key = key
+            value = type_.process_bind_param(u'value', None)
+            assert type_.process_result_value(value, None) == u'value'
+        assert len(type_._engines) == 1
+
 
 class TestAesEncryptedTypeTestcase(EncryptedTypeTestCase):
 
     encryption_engine = AesEngine
 
+    def test_keyring(self):
+        type_ = EncryptedType(sa.Unicode, ['new', 'old'], AesEngine)
+        with pytest.raises(ImproperlyConfigured):
+            type_.process_bind_param(u'value', None)
+
     def test_lookup_by_encrypted_string(self, user):
         test = self.session.query(self.User).filter(
             self.User.username == self.user_name
@@ -242,3 +369,200 @@ class TestAesEncryptedTypeTestcase(EncryptedTypeTestCase):
 class TestFernetEncryptedTypeTestCase(EncryptedTypeTestCase):
 
     encryption_engine = FernetEngine
+
+
+class TestAesGcmEncryptedTypeTestCase(EncryptedTypeTestCase):
+
+    encryption_engine = AesGcmEngine
+
+    def setup_method(self, method):
+        EncryptedTypeTestCase.setup_method(self, method)
+        self.engine_ = AesGcmEngine()
+        self.engine_._update_key('secretkey1234')
+
+    def test_stores_raw_bytes(self):
+        encrypted = self.engine_.encrypt(u'äö')
+        assert encrypted[:5] == b'\x02' + self.engine_.key_id
+        assert len(encrypted) == 5 + 12 + len(u'äö'.encode('utf-8')) + 16
+        assert self.engine_.decrypt(encrypted) == u'äö'
+
+    def test_decrypts_values_without_key_id(self):
+        nonce = b'0' * 12
+        encrypted = b'\x01' + nonce + self.engine_.aesgcm.encrypt(
+            nonce, b'value', None
+        )
+        assert self.engine_.get_key_id(encrypted) is None
+        assert self.engine_.decrypt(encrypted) == u'value'
+
+    def test_different_key_id(self):
+        engine = AesGcmEngine()
+        engine._update_key('otherkey')
+        with pytest.raises(ValueError):
+            self.engine_.decrypt(engine.encrypt(u'a'))
+
+    def test_random_nonce(self):
+        assert self.engine_.encrypt(u'a') != self.engine_.encrypt(u'a')
+
+    def test_unknown_header(self):
+        encrypted = self.engine_.encrypt(u'a')
+        with pytest.raises(ValueError):
+            self.engine_.decrypt(b'\x03' + encrypted[1:])
+
+    def test_tampered_value(self):
+        encrypted = bytearray(self.engine_.encrypt(u'a'))
+        encrypted[-1] ^= 1
+        with pytest.raises(Exception):
+            self.engine_.decrypt(bytes(encrypted))
+
+
+@mark.skipif('cryptography is None')
+class RotateEncryptedColumnTestCase(TestCase):
+    def create_models(self):
+        self.keyring = ['old']
+
+        class Account(self.Base):
+            __tablename__ = 'account'
+            id = sa.Column(sa.Integer, primary_key=True)
+            email = sa.Column(EncryptedType(
+                sa.Unicode,
+                lambda: self.keyring,
+                self.__class__.encryption_engine
+            ))
+
+        self.Account = Account
+
+    def create_accounts(self, count):
+        self.session.add_all([
+            self.Account(id=index, email=u'%d@example.com' % index)
+            for index in range(1, count + 1)
+        ])
+        self.session.add(self.Account(id=count + 1, email=None))
+        self.session.commit()
+
+    def get_emails(self):
+        self.session.expunge_all()
+        return [
+            account.email
+            for account in self.session.query(self.Account).order_by('id')
+        ]
+
+
+class RotateAuthenticatedColumnTestCase(RotateEncryptedColumnTestCase):
+    def test_rotate(self):
+        self.create_accounts(5)
+        self.keyring = ['new', 'old']
+        self.session.add(self.Account(id=10, email=u'10@example.com'))
+        self.session.commit()
+
+        rotated = rotate_encrypted_column(
+            self.session, self.Account.email, 'old', 'new', batch_size=2
+        )
+        assert rotated == 5
+
+        self.keyring = ['new']
+        assert self.get_emails() == [
+            u'1@example.com',
+            u'2@example.com',
+            u'3@example.com',
+            u'4@example.com',
+            u'5@example.com',
+            None,
+            u'10@example.com'
+        ]
+
+    def test_resume(self):
+        self.create_accounts(3)
+        self.keyring = ['new', 'old']
+        assert rotate_encrypted_column(
+            self.session, self.Account.email, 'old', 'new'
+        ) == 3
+        assert rotate_encrypted_column(
+            self.session, self.Account.email, 'old', 'new'
+        ) == 0
+
+
+class TestRotateFernetEncryptedColumn(RotateAuthenticatedColumnTestCase):
+    encryption_engine = FernetEngine
+
+
+class TestRotateAesGcmEncryptedColumn(RotateAuthenticatedColumnTestCase):
+    encryption_engine = AesGcmEngine
+
+
+class TestRotateAesGcmEncryptedColumnOnPostgres(
+    TestRotateAesGcmEncryptedColumn
+):
+    dns = 'postgres://postgres@localhost/sqlalchemy_utils_test'
+
+
+class TestRotateAesEncryptedColumn(RotateEncryptedColumnTestCase):
+    encryption_engine = AesEngine
+
+    def test_requires_authenticated_engine(self):
+        with pytest.raises(ValueError):
+            rotate_encrypted_column(
+                self.session, self.Account.email, 'old', 'new'
+            )
+
+
+@mark.skipif('cryptography is None')
+class TestBlindIndexType(TestCase):
+    def create_models(self):
+        class Account(self.Base):
+            __tablename__ = 'account'
+            id = sa.Column(sa.Integer, primary_key=True)
+            email = sa.Column(EncryptedType(sa.Unicode, 'key', FernetEngine))
+            email_index = sa.Column(
+                BlindIndexType(
+                    'index key', 'email', normalize=six.text_type.lower
+                ),
+                index=True
+            )
+
+        self.Account = Account
+
+    def test_updates_index_on_set(self):
+        digest = BlindIndexType('index key', 'email').digest(
+            u'john@example.com'
+        )
+        account = self.Account(email=u'John@example.com')
+        assert account.email_index == digest
+        self.session.add(account)
+        self.session.commit()
+        self.session.expire(account)
+        assert account.email_index == digest
+
+        account.email = None
+        self.session.commit()
+        assert account.email_index is None
+
+    def test_equality_lookup(self):
+        self.session.add_all([
+            self.Account(email=u'john@example.com'),
+            self.Account(email=u'jack@example.com')
+        ])
+        self.session.commit()
+        query = self.session.query(self.Account.email).filter(
+            self.Account.email == u'JOHN@example.com'
+        )
+        assert 'account.email_index = ' in str(query)
+        assert query.all() == [(u'john@example.com', )]
+        assert self.session.query(self.Account.email).filter(
+            self.Account.email != u'john@example.com'
+        ).all() == [(u'jack@example.com', )]
+
+    def test_none_lookup(self):
+        self.session.add(self.Account())
+        self.session.commit()
+        query = self.session.query(self.Account).filter(
+            self.Account.email == None  # noqa
+        )
+        assert 'account.email_index IS NULL' in str(query)
+        assert query.count() == 1
+
+    def test_compare_blind_index_column(self):
+        query = self.session.query(self.Account).filter(
+            self.Account.email_index == u'a'
+        )
+        assert 'account.email_index = ' in str(query)
+        assert get_blind_index_column(self.Account.__table__.c.id) is None
@@ -1,10 +1,15 @@
 import sqlalchemy as sa
-from pytest import mark
+from pytest import mark, raises
 from sqlalchemy import inspect
 
 from sqlalchemy_utils import Password, PasswordType, types  # noqa
 from tests import TestCase
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
 
 @mark.skipif('types.password.passlib is None')
 class TestPasswordType(TestCase):
@@ -172,3 +177,99 @@ class TestPasswordType(TestCase):
 
         assert obj.password.hash.decode('utf8').startswith('$pbkdf2-sha512$')
         assert obj.password == 'b'
+
+
+@mark.skipif('types.password.passlib is None')
+@mark.skipif('ThreadPoolExecutor is None')
+class TestPasswordAsync(TestCase):
+    def create_models(self):
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            password = sa.Column(PasswordType(
+                schemes=['pbkdf2_sha512', 'md5_crypt'],
+                deprecated=['md5_crypt']
+            ))
+
+        self.User = User
+
+    def test_verify_async(self):
+        from passlib.hash import md5_crypt
+
+        obj = self.User()
+        obj.password = Password(md5_crypt.encrypt('b'))
+
+        valid, new_hash = obj.password.verify_async('b').result()
+        assert valid is True
+        assert new_hash.startswith('$pbkdf2-sha512$')
+        assert obj.password.hash.decode('utf8').startswith('$1$')
+
+        obj.password.set_hash(new_hash)
+        assert obj.password.hash.decode('utf8').startswith('$pbkdf2-sha512$')
+        assert obj.password.verify_async('a').result() == (False, None)
+
+    def test_hash_async(self):
+        password = Password('b', secret=True)
+        password.context = inspect(self.User).c.password.type.context
+
+        hash = password.hash_async().result()
+        assert password.secret == 'b'
+
+        password.set_hash(hash)
+        assert password.secret is None
+        assert password.hash.startswith(b'$pbkdf2-sha512$')
+        assert password == 'b'
+
+    def test_hash_async_without_secret(self):
+        with raises(ValueError):
+            Password(b'hash').hash_async()
+
+    def test_async_without_context(self):
+        with raises(ValueError):
+            Password('b', secret=True).hash_async()
+
+
+@mark.skipif('ThreadPoolExecutor is None')
+@mark.skipif('types.password.passlib is None')
+class TestPasswordTypeWithDeferredHashing(TestCase):
+    def create_models(self):
+        self.executor = ThreadPoolExecutor(2)
+
+        class User(self.Base):
+            __tablename__ = 'user'
+            id = sa.Column(sa.Integer, primary_key=True)
+            password = sa.Column(PasswordType(
+                schemes=['pbkdf2_sha512'],
+                executor=self.executor,
+                defer_hashing=True
+            ))
+
+        self.User = User
+
+    def teardown_method(self, method):
+        TestCase.teardown_method(self, method)
+        self.executor.shutdown()
+
+    def test_hashes_on_flush(self):
+        users = [self.User(password=u'password%d' % i) for i in range(3)]
+        assert users[0].password.hash is None
+        assert users[0].password.executor is self.executor
+
+        self.session.add_all(users)
+        self.session.commit()
+
+        for index, user in enumerate(users):
+            assert user.password.secret is None
+            assert user.password.hash.startswith(b'$pbkdf2-sha512$')
+            assert user.password == u'password%d' % index
+
+    def test_hashes_modified_password(self):
+        user = self.User(password=u'a')
+        self.session.add(user)
+        self.session.commit()
+
+        user.password = u'b'
+        self.session.commit()
+
+        user = self.session.query(self.User).get(user.id)
+        assert user.password == u'b'